@@ -0,0 +1,47 @@
+'''
+Completion time and HTTP 429 responses when sending many requests to a
+server with a request quota, using a fixed number of requests in flight
+versus the AIMD adaptive concurrency limiter.
+
+Usage: python -m benchmarks.bench_adaptive_concurrency [requests] [quota]
+'''
+import asyncio
+import sys
+import time
+
+from benchmarks.standin import StandInServer
+
+from semanticscholar.AdaptiveConcurrencyLimiter import \
+    AdaptiveConcurrencyLimiter
+from semanticscholar.ApiRequester import ApiRequester
+
+
+async def run(url: str, requests: int, adaptive: bool) -> float:
+    semaphore = asyncio.Semaphore(32)
+    limiter = AdaptiveConcurrencyLimiter(max_limit=32) if adaptive else None
+    requester = ApiRequester(timeout=30, concurrency_limiter=limiter)
+
+    async def call(i: int) -> None:
+        async with semaphore:
+            await requester.get_data_async(
+                f'{url}/graph/v1/paper/{i}', 'fields=title', {})
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    await requester.aclose()
+    return elapsed
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    quota = float(sys.argv[2]) if len(sys.argv) > 2 else 100
+    for label, adaptive in (('fixed (32)', False), ('adaptive', True)):
+        with StandInServer(latency=0.05, quota=quota) as server:
+            elapsed = asyncio.run(run(server.url, requests, adaptive))
+            print(f'{label:>12}: {elapsed:6.2f} s, '
+                  f'{server.throttled:5d} HTTP 429 responses')
+
+
+if __name__ == '__main__':
+    main()
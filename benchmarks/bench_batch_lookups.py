@@ -0,0 +1,49 @@
+'''
+Request count and wall time for hydrating authors with concurrent
+get_author calls, sent one by one versus micro-batched into
+POST /author/batch requests.
+
+Usage: python -m benchmarks.bench_batch_lookups [authors] [concurrency]
+'''
+import asyncio
+import sys
+import time
+
+from benchmarks.standin import StandInServer
+
+from semanticscholar.AsyncSemanticScholar import AsyncSemanticScholar
+
+
+async def run(
+            url: str,
+            authors: int,
+            concurrency: int,
+            batch_lookups: bool
+        ) -> float:
+    # Number of callers hydrating authors at the same time.
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def hydrate(author_id: str) -> None:
+        async with semaphore:
+            await sch.get_author(author_id)
+
+    async with AsyncSemanticScholar(
+            api_url=url, batch_lookups=batch_lookups) as sch:
+        start = time.perf_counter()
+        await asyncio.gather(*(hydrate(str(i)) for i in range(authors)))
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    authors = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    for label, batch_lookups in (('one by one', False), ('batched', True)):
+        with StandInServer(latency=0.02) as server:
+            elapsed = asyncio.run(
+                run(server.url, authors, concurrency, batch_lookups))
+            print(f'{label:>10}: {server.requests:6d} requests, '
+                  f'{elapsed:6.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+'''
+Requests per second with a fresh HTTP client per call (previous behavior)
+versus the pooled, keep-alive client held by ApiRequester.
+
+Usage: python -m benchmarks.bench_connection_pool [requests] [concurrency]
+'''
+import asyncio
+import sys
+import time
+
+from benchmarks.standin import StandInServer
+
+from semanticscholar.ApiRequester import ApiRequester
+
+
+async def run(url: str, requests: int, concurrency: int, pooled: bool):
+    semaphore = asyncio.Semaphore(concurrency)
+    shared = ApiRequester(timeout=30, max_connections=concurrency)
+
+    async def call(i: int) -> None:
+        async with semaphore:
+            if pooled:
+                await shared.get_data_async(
+                    f'{url}/graph/v1/paper/{i}', 'fields=title', {})
+            else:
+                async with ApiRequester(timeout=30) as requester:
+                    await requester.get_data_async(
+                        f'{url}/graph/v1/paper/{i}', 'fields=title', {})
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    await shared.aclose()
+    return requests / elapsed
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    with StandInServer() as server:
+        for label, pooled in (('client per call', False), ('pooled', True)):
+            rate = asyncio.run(run(server.url, requests, concurrency, pooled))
+            print(f'{label:>16}: {rate:8.1f} requests/s')
+
+
+if __name__ == '__main__':
+    main()
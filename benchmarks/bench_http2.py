@@ -0,0 +1,88 @@
+'''
+Throughput of concurrent lookups over HTTP/1.1 versus multiplexed HTTP/2,
+against a local h2-capable stand-in served by hypercorn (cleartext HTTP/2
+with prior knowledge, so no certificates are needed).
+
+Requires: pip install hypercorn semanticscholar[http2]
+
+Usage: python -m benchmarks.bench_http2 [requests] [latency]
+'''
+import asyncio
+import json
+import socket
+import sys
+import threading
+import time
+
+import httpx
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from benchmarks.standin import make_paper
+from semanticscholar.ApiRequester import ApiRequester
+
+
+class PriorKnowledgeRequester(ApiRequester):
+    '''Speaks HTTP/2 over cleartext, as the stand-in has no TLS.'''
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=self.limits, http1=not self.http2, http2=self.http2)
+
+
+def start_server(latency: float) -> tuple:
+    clients = set()
+
+    async def app(scope, receive, send):
+        if scope['type'] != 'http':
+            return
+        clients.add(tuple(scope['client']))
+        await asyncio.sleep(latency)
+        body = json.dumps(make_paper(scope['path'].split('/')[-1])).encode()
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': body})
+
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    config = Config()
+    config.bind = [f'127.0.0.1:{port}']
+    config.loglevel = 'ERROR'
+    config.keep_alive_max_requests = 10 ** 6
+    forever = lambda: asyncio.Event().wait()  # noqa: E731
+    thread = threading.Thread(
+        target=lambda: asyncio.run(serve(app, config, shutdown_trigger=forever)),
+        daemon=True)
+    thread.start()
+    time.sleep(1)
+    return f'http://127.0.0.1:{port}', clients
+
+
+async def run(url: str, requests: int, http2: bool) -> float:
+    requester = PriorKnowledgeRequester(
+        timeout=30, max_connections=20, http2=http2,
+        max_concurrent_streams=100)
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        requester.get_data_async(
+            f'{url}/graph/v1/paper/{i}', 'fields=title', {})
+        for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    await requester.aclose()
+    return requests / elapsed
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    url, clients = start_server(latency)
+    for label, http2 in (('HTTP/1.1', False), ('HTTP/2', True)):
+        clients.clear()
+        rate = asyncio.run(run(url, requests, http2))
+        print(f'{label:>8}: {rate:8.1f} requests/s '
+              f'over {len(clients)} connection(s)')
+
+
+if __name__ == '__main__':
+    main()
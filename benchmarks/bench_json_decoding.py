@@ -0,0 +1,68 @@
+'''
+Parse throughput of each installed JSON decoder over the response bodies
+recorded in the vcrpy cassettes of tests/data, compared to httpx's
+Response.json(), which the client used before.
+
+Usage: python -m benchmarks.bench_json_decoding [repetitions]
+'''
+import glob
+import sys
+import time
+
+import httpx
+import yaml
+
+from semanticscholar._utils import _JSON_DECODERS, _json_decoder
+
+
+def load_bodies() -> list:
+    bodies = []
+    for path in sorted(glob.glob('tests/data/*.yaml')):
+        with open(path, encoding='utf-8') as file:
+            cassette = yaml.safe_load(file)
+        for interaction in cassette['interactions']:
+            response = interaction['response']
+            # Cassettes are recorded in both of vcrpy's response formats.
+            if 'body' in response:
+                body = response['body']['string']
+                status_code = response['status']['code']
+            else:
+                body = response['content']
+                status_code = response['status_code']
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            if status_code == 200 and body.strip():
+                bodies.append(body)
+    return bodies
+
+
+def measure(bodies: list, loads, repetitions: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        for body in bodies:
+            loads(body)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    bodies = load_bodies()
+    size = sum(len(body) for body in bodies) * repetitions
+    print(f'{len(bodies)} response bodies, '
+          f'{sum(len(body) for body in bodies) / 1e6:.1f} MB')
+
+    responses = [httpx.Response(200, content=body) for body in bodies]
+    elapsed = measure(responses, httpx.Response.json, repetitions)
+    print(f'{"httpx .json()":>14}: {size / elapsed / 1e6:7.1f} MB/s')
+    for name in _JSON_DECODERS:
+        try:
+            _, loads = _json_decoder(name)
+        except ImportError:
+            print(f'{name:>14}: not installed')
+            continue
+        elapsed = measure(bodies, loads, repetitions)
+        print(f'{name:>14}: {size / elapsed / 1e6:7.1f} MB/s')
+
+
+if __name__ == '__main__':
+    main()
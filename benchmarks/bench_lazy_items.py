@@ -0,0 +1,66 @@
+'''
+Items per second when iterating over paginated results whose objects are
+built eagerly for every item of a page, versus lazily when each item is
+first accessed. Pages are served from memory, so only the client side
+processing is measured.
+
+Usage: python -m benchmarks.bench_lazy_items [pages]
+'''
+import asyncio
+import sys
+import time
+
+from benchmarks.standin import make_paper
+
+from semanticscholar.Paper import Paper
+from semanticscholar.PaginatedResults import PaginatedResults
+from semanticscholar.SemanticScholarException import NoMorePagesException
+
+
+class PageRequester:
+    '''
+    Returns the same pages of 1000 papers as the bulk search of the
+    stand-in, chained with continuation tokens.
+    '''
+
+    def __init__(self, pages: int) -> None:
+        self._pages = pages
+        self._data = [make_paper(str(i)) for i in range(1000)]
+
+    async def get_data_async(self, url, parameters, headers) -> dict:
+        page = int(parameters.partition('token=')[2].partition('&')[0] or 0)
+        data = {'total': self._pages * 1000, 'data': list(self._data)}
+        if page + 1 < self._pages:
+            data['token'] = str(page + 1)
+        return data
+
+
+async def run(pages: int, lazy: bool, per_page: int) -> float:
+    results = await PaginatedResults.create(
+        PageRequester(pages), Paper, '', 'turing', ['title'], 1000,
+        max_results=10000000, stream=True, lazy=lazy)
+    start = time.perf_counter()
+    count = 0
+    while True:
+        # Reads two fields of the first items of each page.
+        for paper in results.items[:per_page]:
+            paper.paperId, paper.title
+            count += 1
+        try:
+            await results.async_next_page()
+        except NoMorePagesException:
+            break
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    for per_page in (1000, 10):
+        for lazy in (False, True):
+            rate = asyncio.run(run(pages, lazy, per_page))
+            print(f'{"lazy" if lazy else "eager":>5}, {per_page:4d} items '
+                  f'read per page: {rate:9.0f} items/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+'''
+Bytes allocated per Paper on top of the response data it is built from,
+right after construction and after every one of its fields has been read.
+The response data is created before measuring, so only what the model
+object itself holds is counted.
+
+Usage: python -m benchmarks.bench_model_memory [papers]
+'''
+import gc
+import sys
+import tracemalloc
+
+from benchmarks.standin import make_paper
+
+from semanticscholar.Paper import Paper
+
+
+def measure(data: list, read_fields: bool) -> float:
+    gc.collect()
+    tracemalloc.start()
+    papers = [Paper(item) for item in data]
+    if read_fields:
+        for paper in papers:
+            for field in Paper.SEARCH_FIELDS:
+                getattr(paper, field)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(papers)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    data = [make_paper(str(i)) for i in range(count)]
+    for label, read_fields in (
+            ('constructed', False), ('all fields read', True)):
+        size = measure(data, read_fields)
+        print(f'{label:>15}: {size:8.1f} bytes/paper')
+
+
+if __name__ == '__main__':
+    main()
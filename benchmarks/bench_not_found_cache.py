@@ -0,0 +1,52 @@
+'''
+Requests and wall time of repeated get_papers runs over candidate IDs of
+which most are not found, without and with the not found cache. Also
+reports the size of the cache and the time to look up an ID.
+
+Usage: python -m benchmarks.bench_not_found_cache [ids] [runs]
+'''
+import asyncio
+import logging
+import sys
+import time
+
+from benchmarks.standin import StandInServer
+
+from semanticscholar.AsyncSemanticScholar import AsyncSemanticScholar
+from semanticscholar.NotFoundCache import NotFoundCache
+
+
+async def run(url: str, paper_ids: list, runs: int, cache: bool) -> float:
+    async with AsyncSemanticScholar(
+            api_url=url, not_found_cache=cache) as sch:
+        start = time.perf_counter()
+        for _ in range(runs):
+            await sch.get_papers(paper_ids, fields=['title'])
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    # Every run logs the IDs not found.
+    logging.getLogger('semanticscholar').setLevel(logging.ERROR)
+    ids = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    # 80% of the candidates are never found.
+    paper_ids = [
+        str(i) if i % 5 == 0 else f'missing{i}' for i in range(ids)]
+    for cache in (False, True):
+        with StandInServer(latency=0.05) as server:
+            elapsed = asyncio.run(run(server.url, paper_ids, runs, cache))
+            print(f'not_found_cache={str(cache):<5}: '
+                  f'{server.requests:4d} requests, {elapsed:6.2f} s')
+
+    cache = NotFoundCache(capacity=10 ** 7)
+    print(f'capacity 10M, 2 generations: {cache.size / 1024 ** 2:.1f} MiB')
+    cache.add_all('paper', (f'missing{i}' for i in range(100000)))
+    start = time.perf_counter()
+    for i in range(100000):
+        cache.contains('paper', f'missing{i}')
+    print(f'lookup: {(time.perf_counter() - start) * 10:.2f} us per ID')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+'''
+Time to iterate over the 9000 citations of a paper, with 100 results per
+page, fetching pages one by one versus several offset windows at once.
+
+Usage: python -m benchmarks.bench_page_concurrency [latency]
+'''
+import asyncio
+import sys
+import time
+
+from benchmarks.standin import StandInServer
+
+from semanticscholar.AsyncSemanticScholar import AsyncSemanticScholar
+
+
+async def run(url: str, page_concurrency: int) -> float:
+    async with AsyncSemanticScholar(
+            api_url=url, page_concurrency=page_concurrency) as sch:
+        start = time.perf_counter()
+        results = await sch.get_paper_citations('1', limit=100)
+        count = len([item async for item in results])
+        assert count == 9000, count
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.05
+    for page_concurrency in (1, 10, 45):
+        with StandInServer(latency=latency) as server:
+            elapsed = asyncio.run(run(server.url, page_concurrency))
+            print(f'page_concurrency={page_concurrency:<3}: '
+                  f'{server.requests:3d} requests, {elapsed:6.2f} s')
+
+
+if __name__ == '__main__':
+    main()
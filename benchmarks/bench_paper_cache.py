@@ -0,0 +1,51 @@
+'''
+Request count and wall time of a get_papers call followed by get_paper
+lookups of the same papers by DOI, for a subset of the fields, then of a
+get_papers call for these papers and more, without and with the paper
+cache.
+
+Usage: python -m benchmarks.bench_paper_cache [papers]
+'''
+import asyncio
+import sys
+import time
+
+from benchmarks.standin import StandInServer
+
+from semanticscholar.AsyncSemanticScholar import AsyncSemanticScholar
+
+FIELDS = ['title', 'year', 'externalIds']
+SUBSET = ['title', 'year']
+
+
+async def run(url: str, papers: int, paper_cache: bool) -> tuple:
+    semaphore = asyncio.Semaphore(10)
+
+    async def lookup(doi: str) -> None:
+        async with semaphore:
+            await sch.get_paper(f'DOI:{doi}', fields=SUBSET)
+
+    async with AsyncSemanticScholar(
+            api_url=url, paper_cache=paper_cache) as sch:
+        start = time.perf_counter()
+        results = await sch.get_papers(
+            [str(i) for i in range(papers)], fields=FIELDS)
+        await asyncio.gather(*(
+            lookup(paper.externalIds['DOI']) for paper in results))
+        await sch.get_papers(
+            [str(i) for i in range(papers * 2)], fields=SUBSET)
+        return time.perf_counter() - start, sch.paper_cache
+
+
+def main() -> None:
+    papers = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    for paper_cache in (False, True):
+        with StandInServer(latency=0.05) as server:
+            elapsed, cache = asyncio.run(run(server.url, papers, paper_cache))
+            stats = f', {cache.stats}' if cache is not None else ''
+            print(f'paper_cache={str(paper_cache):<5}: '
+                  f'{server.requests:5d} requests, {elapsed:6.2f} s{stats}')
+
+
+if __name__ == '__main__':
+    main()
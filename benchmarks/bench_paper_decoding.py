@@ -0,0 +1,37 @@
+'''
+Time to build a Paper from the tests/data/Paper.json fixture, which holds
+1000 citations and 14 references, and to read a few of its fields, before
+and after reading its nested collections.
+
+Usage: python -m benchmarks.bench_paper_decoding [repetitions]
+'''
+import json
+import sys
+import timeit
+
+from semanticscholar.Paper import Paper
+
+
+def main() -> None:
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with open('tests/data/Paper.json', encoding='utf-8') as file:
+        data = json.load(file)
+
+    def build() -> None:
+        paper = Paper(data)
+        paper.paperId, paper.title, paper.year
+
+    def build_and_read_nested() -> None:
+        paper = Paper(data)
+        paper.authors, paper.citations, paper.references
+        paper.publicationDate, paper.journal, paper.tldr
+
+    for label, function in (
+            ('construct + 3 fields', build),
+            ('construct + nested', build_and_read_nested)):
+        elapsed = timeit.timeit(function, number=repetitions)
+        print(f'{label:>20}: {elapsed / repetitions * 1e6:10.1f} us/paper')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+'''
+Throughput of a bulk search iterated with a single cursor versus split
+into year ranges iterated over concurrently. The stand-in spreads its
+results unevenly over the years, as the real corpus grows every year.
+
+Usage: python -m benchmarks.bench_partitioned_search [latency] [results]
+'''
+import asyncio
+import sys
+import time
+
+from benchmarks.standin import StandInServer
+
+from semanticscholar.AsyncSemanticScholar import AsyncSemanticScholar
+
+
+async def run(url: str, partitions: int, results: int) -> float:
+    async with AsyncSemanticScholar(api_url=url) as sch:
+        start = time.perf_counter()
+        papers = sch.search_paper_partitioned(
+            'turing', partitions=partitions, year='1950-2024')
+        paper_ids = {paper.paperId async for paper in papers}
+        assert len(paper_ids) == results, len(paper_ids)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.2
+    results = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    for partitions in (1, 4, 16):
+        with StandInServer(latency=latency, total=results) as server:
+            elapsed = asyncio.run(run(server.url, partitions, results))
+            print(f'partitions={partitions:<2}: '
+                  f'{server.requests:4d} requests, {elapsed:6.2f} s, '
+                  f'{results / elapsed:8.0f} papers/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+'''
+Items per second when iterating over paginated results and reading two
+fields of every item, with Paper objects built for each item, built on
+first access (lazy_items) or not built at all (raw). Pages are served
+from memory, so only the client side processing is measured.
+
+Usage: python -m benchmarks.bench_raw_mode [pages]
+'''
+import asyncio
+import sys
+import time
+
+from benchmarks.bench_lazy_items import PageRequester
+
+from semanticscholar.Paper import Paper
+from semanticscholar.PaginatedResults import PaginatedResults
+from semanticscholar.SemanticScholarException import NoMorePagesException
+
+
+async def run(pages: int, mode: str) -> float:
+    results = await PaginatedResults.create(
+        PageRequester(pages), Paper, '', 'turing', ['title'], 1000,
+        max_results=10000000, stream=True, lazy=mode == 'lazy',
+        raw=mode == 'raw')
+    start = time.perf_counter()
+    count = 0
+    while True:
+        if mode == 'raw':
+            for paper in results.items:
+                paper['paperId'], paper['title']
+                count += 1
+        else:
+            for paper in results.items:
+                paper.paperId, paper.title
+                count += 1
+        try:
+            await results.async_next_page()
+        except NoMorePagesException:
+            break
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    for mode in ('objects', 'lazy', 'raw'):
+        rate = asyncio.run(run(pages, mode))
+        print(f'{mode:>7}: {rate:10.0f} items/s')
+
+
+if __name__ == '__main__':
+    main()
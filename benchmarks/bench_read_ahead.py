@@ -0,0 +1,36 @@
+'''
+Time to iterate over a token-paginated bulk search while processing each
+item, with and without background read-ahead of the next pages.
+
+Usage: python -m benchmarks.bench_read_ahead [latency] [work per page]
+'''
+import sys
+import time
+
+from benchmarks.standin import StandInServer
+
+from semanticscholar.SemanticScholar import SemanticScholar
+
+
+def run(url: str, read_ahead: int, work: float) -> float:
+    with SemanticScholar(api_url=url, read_ahead=read_ahead) as sch:
+        start = time.perf_counter()
+        results = sch.search_paper('turing', bulk=True)
+        for i, _ in enumerate(results):
+            if i % 1000 == 999:
+                # Stands for the processing of a page worth of items.
+                time.sleep(work)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.1
+    work = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    for read_ahead in (0, 1, 2):
+        with StandInServer(latency=latency, total=20000) as server:
+            elapsed = run(server.url, read_ahead, work)
+            print(f'read_ahead={read_ahead}: {elapsed:6.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+'''
+Request count and wall time for repeated get_paper lookups, where a few
+popular papers are looked up much more often than the others, without
+and with the in-memory response cache.
+
+Usage: python -m benchmarks.bench_response_cache [lookups] [papers]
+'''
+import asyncio
+import random
+import sys
+import time
+
+from benchmarks.standin import StandInServer
+
+from semanticscholar.AsyncSemanticScholar import AsyncSemanticScholar
+
+
+async def run(url: str, paper_ids: list, cache: bool) -> tuple:
+    semaphore = asyncio.Semaphore(10)
+
+    async def lookup(paper_id: str) -> None:
+        async with semaphore:
+            await sch.get_paper(paper_id, fields=['title', 'year'])
+
+    async with AsyncSemanticScholar(api_url=url, cache=cache) as sch:
+        start = time.perf_counter()
+        await asyncio.gather(*(lookup(paper_id) for paper_id in paper_ids))
+        return time.perf_counter() - start, sch.cache
+
+
+def main() -> None:
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    papers = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = random.Random(0)
+    # Zipf-like popularity: paper i is looked up about 1 / (i + 1) as often.
+    weights = [1 / (i + 1) for i in range(papers)]
+    paper_ids = [
+        str(i) for i in rng.choices(range(papers), weights, k=lookups)]
+    for cache in (False, True):
+        with StandInServer(latency=0.05) as server:
+            elapsed, response_cache = asyncio.run(
+                run(server.url, paper_ids, cache))
+            stats = f', {response_cache.stats}' if response_cache else ''
+            print(f'cache={str(cache):<5}: {server.requests:5d} requests, '
+                  f'{elapsed:6.2f} s{stats}')
+
+
+if __name__ == '__main__':
+    main()
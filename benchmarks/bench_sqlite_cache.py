@@ -0,0 +1,66 @@
+'''
+Requests and wall time of a get_papers refresh run in a new process each
+time, sharing a SQLite response cache: a cold run, then warm reruns by
+several processes at once. Also reports the size of the database with
+and without compression.
+
+Usage: python -m benchmarks.bench_sqlite_cache [papers] [processes]
+'''
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.standin import StandInServer
+
+from semanticscholar.AsyncSemanticScholar import AsyncSemanticScholar
+from semanticscholar.SQLiteResponseCache import SQLiteResponseCache
+
+
+async def refresh(url: str, path: str, papers: int, compress: bool) -> None:
+    cache = SQLiteResponseCache(path, compress=compress)
+    async with AsyncSemanticScholar(api_url=url, cache=cache) as sch:
+        await sch.get_papers([str(i) for i in range(papers)])
+    cache.close()
+
+
+def run(url: str, path: str, papers: int, processes: int) -> float:
+    start = time.perf_counter()
+    children = [
+        subprocess.Popen([
+            sys.executable, '-m', 'benchmarks.bench_sqlite_cache',
+            '--child', url, path, str(papers)])
+        for _ in range(processes)]
+    for child in children:
+        assert child.wait() == 0
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        asyncio.run(refresh(sys.argv[2], sys.argv[3], int(sys.argv[4]), True))
+        return
+    papers = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    with tempfile.TemporaryDirectory() as directory, \
+            StandInServer(latency=0.05) as server:
+        path = os.path.join(directory, 'cache.sqlite')
+        for label, count in (('cold', 1), ('warm', processes)):
+            before = server.requests
+            elapsed = run(server.url, path, papers, count)
+            print(f'{label}, {count} process(es): '
+                  f'{server.requests - before:4d} requests, {elapsed:6.2f} s')
+
+        for compress in (False, True):
+            path = os.path.join(directory, f'cache-{compress}.sqlite')
+            asyncio.run(refresh(server.url, path, papers, compress))
+            cache = SQLiteResponseCache(path)
+            print(f'compress={str(compress):<5}: '
+                  f'{cache.size / 1024 / 1024:6.1f} MiB stored')
+            cache.close()
+
+
+if __name__ == '__main__':
+    main()
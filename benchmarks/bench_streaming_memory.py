@@ -0,0 +1,49 @@
+'''
+Peak memory of iterating over a bulk search, accumulating every page in
+items versus streaming one page at a time. Each mode runs in its own
+process so that its peak resident set size can be compared.
+
+Usage: python -m benchmarks.bench_streaming_memory [results] [eager results]
+
+The eager baseline grows linearly with the number of results, so it
+iterates over fewer of them by default.
+'''
+import resource
+import subprocess
+import sys
+import time
+
+from benchmarks.standin import StandInServer
+
+from semanticscholar.SemanticScholar import SemanticScholar
+
+
+def run(stream: bool, count: int) -> None:
+    with StandInServer(latency=0, total=count) as server, \
+            SemanticScholar(api_url=server.url) as sch:
+        start = time.perf_counter()
+        results = sch.search_paper('turing', bulk=True, stream=stream)
+        iterated = sum(1 for _ in results)
+        assert iterated == count, iterated
+        elapsed = time.perf_counter() - start
+    # Kilobytes on Linux.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f'{"stream" if stream else "eager":>6}: {count:8d} results, '
+          f'peak RSS {peak:7.1f} MiB, {elapsed:6.2f} s')
+
+
+def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        run(sys.argv[2] == 'stream', int(sys.argv[3]))
+        return
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    eager_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    for mode, results in (('eager', eager_count), ('stream', count)):
+        subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_streaming_memory',
+             '--child', mode, str(results)],
+            check=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+'''
+Latency of synchronous calls when every call runs on a new event loop
+(previous behavior) versus the long-lived event loop thread used by
+SemanticScholar.
+
+Usage: python -m benchmarks.bench_sync_client [requests]
+'''
+import sys
+import time
+
+from benchmarks.standin import StandInServer
+
+from semanticscholar._utils import _run_async
+from semanticscholar.SemanticScholar import SemanticScholar
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with StandInServer() as server:
+        sch = SemanticScholar(api_url=server.url)
+        sch.get_paper('0')
+        start = time.perf_counter()
+        for i in range(requests):
+            _run_async(sch._AsyncSemanticScholar.get_paper(str(i)))
+        per_call = (time.perf_counter() - start) / requests
+        print(f'new loop per call: {per_call * 1000:6.2f} ms/call')
+
+        start = time.perf_counter()
+        for i in range(requests):
+            sch.get_paper(str(i))
+        per_call = (time.perf_counter() - start) / requests
+        print(f'event loop thread: {per_call * 1000:6.2f} ms/call')
+        sch.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,242 @@
+'''
+Local stand-in for the Semantic Scholar API used by the benchmarks.
+
+It implements just enough of the Graph API to exercise the client: single
+and batch paper/author lookups, offset-paginated citations and
+token-paginated bulk search. Responses are synthetic and deterministic.
+
+Bulk search results are spread over the years 1950 to 2024, with 5% more
+papers each year, and can be filtered with ``year`` or
+``publicationDateOrYear``.
+'''
+import calendar
+import json
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from urllib.parse import parse_qs, urlparse
+
+
+class _Server(ThreadingHTTPServer):
+    # The default backlog of 5 refuses connections under high concurrency.
+    request_queue_size = 1024
+
+
+def _parse_day(text: str, last: bool) -> date:
+    # First or last day of a YYYY, YYYY-MM or YYYY-MM-DD date.
+    parts = [int(part) for part in text.split('-')]
+    year = parts[0]
+    month = parts[1] if len(parts) > 1 else 12 if last else 1
+    day = parts[2] if len(parts) > 2 else \
+        calendar.monthrange(year, month)[1] if last else 1
+    return date(year, month, day)
+
+
+def make_paper(paper_id: str) -> dict:
+    return {
+        'paperId': paper_id,
+        'externalIds': {'DOI': f'10.0000/{paper_id}', 'CorpusId': 1},
+        'title': f'Paper {paper_id}',
+        'abstract': 'Lorem ipsum dolor sit amet. ' * 20,
+        'year': 2020,
+        'publicationDate': '2020-01-01',
+        'citationCount': 10,
+        'authors': [
+            {'authorId': f'{paper_id}-{i}', 'name': f'Author {i}'}
+            for i in range(5)
+        ],
+        'journal': {'name': 'Journal', 'pages': '1-10', 'volume': '1'},
+    }
+
+
+def make_author(author_id: str) -> dict:
+    return {
+        'authorId': author_id,
+        'name': f'Author {author_id}',
+        'hIndex': 10,
+        'citationCount': 100,
+        'paperCount': 20,
+    }
+
+
+class StandInServer:
+    '''
+    Threaded HTTP/1.1 server with keep-alive, started on a free local port.
+
+    :param float latency: artificial delay added to every response.
+    :param int total: number of items reported by paginated endpoints.
+    :param float quota: if set, maximum requests per second; requests over
+           the quota get HTTP 429 with a ``Retry-After`` header.
+    '''
+
+    def __init__(
+                self,
+                latency: float = 0.0,
+                total: int = 9000,
+                quota: float = None
+            ) -> None:
+        self.latency = latency
+        self.total = total
+        self.quota = quota
+        self.requests = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._window = []
+        self._years = self._spread_over_years(total)
+        self._httpd = _Server(('127.0.0.1', 0), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address
+        return f'http://{host}:{port}'
+
+    def __enter__(self) -> 'StandInServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _over_quota(self) -> bool:
+        if not self.quota:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            self._window = [t for t in self._window if now - t < 1.0]
+            if len(self._window) >= self.quota:
+                self.throttled += 1
+                return True
+            self._window.append(now)
+            return False
+
+    @staticmethod
+    def _spread_over_years(total: int) -> dict:
+        # Index of the first paper of each year.
+        weights = [1.05 ** (year - 1950) for year in range(1950, 2025)]
+        first = {}
+        cumulative = 0.0
+        for year, weight in zip(range(1950, 2025), weights):
+            first[year] = round(total * cumulative / sum(weights))
+            cumulative += weight
+        first[2025] = total
+        return first
+
+    def _first_index(self, day: date) -> int:
+        # Papers of a year are spread evenly over its days.
+        if day.year < 1950:
+            return 0
+        if day.year > 2024:
+            return self.total
+        start = self._years[day.year]
+        count = self._years[day.year + 1] - start
+        days = 366 if calendar.isleap(day.year) else 365
+        elapsed = (day - date(day.year, 1, 1)).days
+        return start + -(-elapsed * count // days)
+
+    def _bulk_interval(self, query: dict) -> tuple:
+        if 'year' in query:
+            start, _, end = query['year'][0].partition('-')
+            end = end if '-' in query['year'][0] else start
+            start = min(max(int(start or 1950), 1950), 2025)
+            end = min(max(int(end or 2024) + 1, 1950), 2025)
+            return self._years[start], max(self._years[end],
+                                           self._years[start])
+        if 'publicationDateOrYear' in query:
+            value = query['publicationDateOrYear'][0]
+            start, _, end = value.partition(':')
+            end = end if ':' in value else start
+            first = self._first_index(_parse_day(start or '1900', False))
+            after = _parse_day(end or '2100', True) + timedelta(days=1)
+            return first, max(self._first_index(after), first)
+        return 0, self.total
+
+    def _route(self, method: str, path: str, query: dict, body: dict):
+        path = path.removeprefix('/graph/v1')
+        parts = path.strip('/').split('/')
+        offset = int(query.get('offset', ['0'])[0])
+        limit = int(query.get('limit', ['100'])[0])
+        if method == 'POST' and path == '/paper/batch':
+            return [None if i.startswith('missing') else make_paper(i)
+                    for i in body['ids']]
+        if method == 'POST' and path == '/author/batch':
+            return [None if i.startswith('missing') else make_author(i)
+                    for i in body['ids']]
+        if parts[0] == 'paper' and parts[1:] == ['search', 'bulk']:
+            first, last = self._bulk_interval(query)
+            start = int(query.get('token', [first])[0])
+            end = min(start + 1000, last)
+            page = {
+                'total': last - first,
+                'data': [make_paper(str(i)) for i in range(start, end)]
+            }
+            if end < last:
+                page['token'] = str(end)
+            return page
+        if parts[0] == 'paper' and len(parts) == 3:
+            end = min(offset + limit, self.total)
+            page = {
+                'offset': offset,
+                'data': [{'citingPaper': make_paper(str(i))}
+                         for i in range(offset, end)]
+            }
+            if end < self.total:
+                page['next'] = end
+            return page
+        if parts[0] == 'paper' and len(parts) == 2:
+            return make_paper(parts[1])
+        if parts[0] == 'author' and len(parts) == 2:
+            return make_author(parts[1])
+        return None
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def _respond(self, status: int, data, headers=None) -> None:
+                body = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _serve(self, method: str) -> None:
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length)) if length else {}
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                if server._over_quota():
+                    self._respond(429, {'message': 'Too Many Requests'},
+                                  {'Retry-After': '1'})
+                    return
+                url = urlparse(self.path)
+                data = server._route(
+                    method, url.path, parse_qs(url.query), body)
+                if data is None:
+                    self._respond(404, {'error': 'Not found'})
+                else:
+                    self._respond(200, data)
+
+            def do_GET(self) -> None:
+                self._serve('GET')
+
+            def do_POST(self) -> None:
+                self._serve('POST')
+
+        return Handler
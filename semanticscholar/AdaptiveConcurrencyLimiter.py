@@ -0,0 +1,164 @@
+import asyncio
+import threading
+from collections import deque
+
+
+class AdaptiveConcurrencyLimiter:
+    '''
+    Limits the number of requests in flight and adapts the limit to the
+    API responses using AIMD (additive increase, multiplicative decrease).
+
+    While responses are healthy, the limit grows by ``increase`` for every
+    ``limit`` successful responses, i.e. roughly once per round of requests.
+    On HTTP 429 or 5xx, the limit is multiplied by ``decrease_factor``. Only
+    the first throttled response of a round lowers the limit, so a burst of
+    429s from requests sent together counts once.
+    '''
+
+    def __init__(
+                self,
+                initial_limit: int = 4,
+                min_limit: int = 1,
+                max_limit: int = 64,
+                increase: float = 1.0,
+                decrease_factor: float = 0.5
+            ) -> None:
+        '''
+        :param int initial_limit: (optional) requests allowed in flight at
+               first.
+        :param int min_limit: (optional) lower bound for the limit.
+        :param int max_limit: (optional) upper bound for the limit.
+        :param float increase: (optional) amount added to the limit after
+               each round of healthy responses.
+        :param float decrease_factor: (optional) factor applied to the limit
+               on HTTP 429 or 5xx responses.
+        '''
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                'The limits must satisfy 1 <= min_limit <= initial_limit '
+                '<= max_limit.')
+        if not 0 < decrease_factor < 1:
+            raise ValueError(
+                'The decrease_factor parameter must be between 0 and 1.')
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._increase = increase
+        self._decrease_factor = decrease_factor
+        self._in_flight = 0
+        self._waiters = deque()
+        self._round = 0
+        self._decreases = 0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        '''
+        Current number of requests allowed in flight.
+
+        :type: :class:`int`
+        '''
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        '''
+        Number of requests currently in flight.
+
+        :type: :class:`int`
+        '''
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        '''
+        Number of requests waiting for a slot.
+
+        :type: :class:`int`
+        '''
+        return len(self._waiters)
+
+    @property
+    def decreases(self) -> int:
+        '''
+        Number of times the limit has been lowered.
+
+        :type: :class:`int`
+        '''
+        return self._decreases
+
+    async def acquire(self) -> int:
+        '''
+        Wait for a free slot and take it.
+
+        :returns: the round in which the request was started, to be passed
+                  back to :meth:`release`.
+        :rtype: :class:`int`
+        '''
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                waiter = None
+            else:
+                waiter = (loop, loop.create_future())
+                self._waiters.append(waiter)
+        if waiter:
+            try:
+                await waiter[1]
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                    elif waiter[1].done() and not waiter[1].cancelled():
+                        # The slot was handed over before the cancellation
+                        # reached this task: give it back.
+                        self._in_flight -= 1
+                        self._wake_waiters()
+                # If the slot was handed over to the cancelled future,
+                # _wake gives it back.
+                raise
+        return self._round
+
+    def release(
+                self,
+                started_round: int,
+                status_code: int = None
+            ) -> None:
+        '''
+        Free the slot taken by :meth:`acquire` and adjust the limit.
+
+        :param int started_round: value returned by :meth:`acquire`.
+        :param int status_code: (optional) HTTP status of the response, or
+               None if no response was received.
+        '''
+        with self._lock:
+            self._in_flight -= 1
+            if status_code is not None:
+                self._update_limit(started_round, status_code)
+            self._wake_waiters()
+
+    def _update_limit(self, started_round: int, status_code: int) -> None:
+        if status_code == 429 or status_code >= 500:
+            if started_round == self._round:
+                self._limit = max(
+                    self._min_limit, self._limit * self._decrease_factor)
+                self._round += 1
+                self._decreases += 1
+        else:
+            self._limit = min(
+                self._max_limit, self._limit + self._increase / self._limit)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            loop, future = self._waiters.popleft()
+            self._in_flight += 1
+            loop.call_soon_threadsafe(self._wake, future)
+
+    def _wake(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._in_flight -= 1
+                self._wake_waiters()
+        else:
+            future.set_result(None)
@@ -1,31 +1,121 @@
 import asyncio
+import contextlib
+import copy
 import json
 import logging
 import warnings
-from typing import List, Union
+import weakref
+from typing import Any, AsyncIterator, List, Tuple, Union
 
 import httpx
 from tenacity import retry as rerun
 from tenacity import retry_if_exception_type, stop_after_attempt, \
     wait_exponential
 
+from semanticscholar._utils import _json_decoder, _parse_retry_after
+from semanticscholar.AdaptiveConcurrencyLimiter import \
+    AdaptiveConcurrencyLimiter
+from semanticscholar.RateLimiter import RateLimiter
+from semanticscholar.ResponseCache import ResponseCache
 from semanticscholar.SemanticScholarException import (
     BadQueryParametersException, GatewayTimeoutException,
     InternalServerErrorException, ObjectNotFoundException)
 
 logger = logging.getLogger('semanticscholar')
 
+# Longest wait between two attempts, in seconds.
+_MAX_WAIT = 60
+
+_wait_exponential = wait_exponential(min=5, max=_MAX_WAIT)
+
+
+def _wait_for_retry(retry_state) -> float:
+    '''
+    Wait as long as the API asked for in the Retry-After header, up to
+    _MAX_WAIT seconds, falling back to exponential back-off.
+    '''
+    exception = retry_state.outcome.exception()
+    retry_after = getattr(exception, 'retry_after', None)
+    if retry_after is not None:
+        # A proxy or a faulty server may ask for hours.
+        return min(retry_after, _MAX_WAIT)
+    return _wait_exponential(retry_state)
+
 
 class ApiRequester:
 
-    def __init__(self, timeout, retry: bool = True) -> None:
+    def __init__(
+                self,
+                timeout,
+                retry: bool = True,
+                max_connections: int = 100,
+                max_keepalive_connections: int = 20,
+                keepalive_expiry: float = 5.0,
+                http2: bool = False,
+                max_concurrent_streams: int = 100,
+                rate_limiter: RateLimiter = None,
+                concurrency_limiter: AdaptiveConcurrencyLimiter = None,
+                coalesce_requests: bool = True,
+                json_decoder: str = None,
+                cache: ResponseCache = None
+            ) -> None:
         '''
         :param float timeout: an exception is raised 
                if the server has not issued a response for timeout seconds.
         :param bool retry: enable retry mode.
+        :param int max_connections: (optional) maximum number of concurrent
+               connections in the pool.
+        :param int max_keepalive_connections: (optional) maximum number of
+               idle connections kept alive in the pool.
+        :param float keepalive_expiry: (optional) time in seconds an idle
+               connection is kept alive before being closed.
+        :param bool http2: (optional) multiplex requests over HTTP/2
+               connections. Requires the ``h2`` package.
+        :param int max_concurrent_streams: (optional) maximum number of
+               requests in flight on each HTTP/2 connection.
+        :param RateLimiter rate_limiter: (optional) paces requests sent to
+               the API, including retries.
+        :param AdaptiveConcurrencyLimiter concurrency_limiter: (optional)
+               adapts the number of requests in flight to the API responses.
+        :param bool coalesce_requests: (optional) share a single HTTP call
+               between identical requests made at the same time.
+        :param str json_decoder: (optional) library decoding the response
+               bodies: "orjson", "msgspec" or "json". Defaults to the
+               fastest one installed.
+        :param ResponseCache cache: (optional) answers identical requests
+               from previous responses.
         '''
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    'HTTP/2 support requires the h2 package. Install it '
+                    'with: pip install semanticscholar[http2]') from None
         self.timeout = timeout
         self.retry = retry
+        self._http2 = http2
+        self._max_concurrent_streams = max_concurrent_streams
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.coalesce_requests = coalesce_requests
+        self.json_decoder = json_decoder
+        self.cache = cache
+        self._in_flight = {}
+        self._coalesced_calls = 0
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        # Event loop: (client, HTTP/2 streams semaphore, closer)
+        self._clients = weakref.WeakKeyDictionary()
+
+    async def __aenter__(self) -> 'ApiRequester':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
 
     @property
     def timeout(self) -> int:
@@ -55,6 +145,180 @@ class ApiRequester:
         '''
         self._retry = retry
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        '''
+        :type: :class:`semanticscholar.RateLimiter.RateLimiter`
+        '''
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, rate_limiter: RateLimiter) -> None:
+        '''
+        :param RateLimiter rate_limiter:
+        '''
+        self._rate_limiter = rate_limiter
+
+    @property
+    def concurrency_limiter(self) -> AdaptiveConcurrencyLimiter:
+        '''
+        :type: :class:`semanticscholar.AdaptiveConcurrencyLimiter.\
+            AdaptiveConcurrencyLimiter`
+        '''
+        return self._concurrency_limiter
+
+    @concurrency_limiter.setter
+    def concurrency_limiter(
+                self,
+                concurrency_limiter: AdaptiveConcurrencyLimiter
+            ) -> None:
+        '''
+        :param AdaptiveConcurrencyLimiter concurrency_limiter:
+        '''
+        self._concurrency_limiter = concurrency_limiter
+
+    @property
+    def coalesce_requests(self) -> bool:
+        '''
+        :type: :class:`bool`
+        '''
+        return self._coalesce_requests
+
+    @coalesce_requests.setter
+    def coalesce_requests(self, coalesce_requests: bool) -> None:
+        '''
+        :param bool coalesce_requests:
+        '''
+        self._coalesce_requests = coalesce_requests
+
+    @property
+    def json_decoder(self) -> str:
+        '''
+        Name of the library decoding the response bodies.
+
+        :type: :class:`str`
+        '''
+        return self._json_decoder
+
+    @json_decoder.setter
+    def json_decoder(self, json_decoder: str) -> None:
+        '''
+        :param str json_decoder:
+        '''
+        self._json_decoder, self._loads = _json_decoder(json_decoder)
+
+    @property
+    def cache(self) -> ResponseCache:
+        '''
+        :type: :class:`semanticscholar.ResponseCache.ResponseCache`
+        '''
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: ResponseCache) -> None:
+        '''
+        :param ResponseCache cache:
+        '''
+        self._cache = cache
+
+    @property
+    def coalesced_calls(self) -> int:
+        '''
+        Number of HTTP calls saved by sharing the response of an identical
+        request already in flight.
+
+        :type: :class:`int`
+        '''
+        return self._coalesced_calls
+
+    @property
+    def limits(self) -> httpx.Limits:
+        '''
+        Connection pool limits.
+
+        :type: :class:`httpx.Limits`
+        '''
+        return self._limits
+
+    @property
+    def http2(self) -> bool:
+        '''
+        Whether requests are sent over HTTP/2.
+
+        :type: :class:`bool`
+        '''
+        return self._http2
+
+    @property
+    def max_concurrent_streams(self) -> int:
+        '''
+        Maximum number of requests in flight on each HTTP/2 connection.
+
+        :type: :class:`int`
+        '''
+        return self._max_concurrent_streams
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(limits=self._limits, http2=self._http2)
+
+    async def _get_client(self) -> Tuple[httpx.AsyncClient, Any]:
+        '''
+        Returns the pooled HTTP client of the running event loop and the
+        semaphore bounding its HTTP/2 streams, creating them on first use.
+        Connections are bound to the event loop that opened them, so each
+        loop gets its own client. The client is closed when the loop shuts
+        down its asynchronous generators, as asyncio.run() does on exit, or
+        by :meth:`aclose`.
+        '''
+        loop = asyncio.get_running_loop()
+        for other in [other for other in self._clients if other.is_closed()]:
+            # Closed without shutting down its asynchronous generators, so
+            # its connections can't be closed anymore.
+            del self._clients[other]
+            warnings.warn(
+                'HTTP client of a closed event loop left unclosed.',
+                ResourceWarning)
+        entry = self._clients.get(loop)
+        if entry is None or entry[0].is_closed:
+            client = self._create_client()
+            streams = contextlib.nullcontext()
+            if self._http2:
+                # The pool multiplexes all requests to a host over a single
+                # HTTP/2 connection, so this bounds the streams on it.
+                streams = asyncio.Semaphore(self._max_concurrent_streams)
+            closer = self._close_on_shutdown(client)
+            await closer.__anext__()
+            entry = self._clients[loop] = (client, streams, closer)
+        return entry[0], entry[1]
+
+    async def _close_on_shutdown(
+                self,
+                client: httpx.AsyncClient
+            ) -> AsyncIterator[None]:
+        # Started by the event loop of the client, which closes it when
+        # shutting down its asynchronous generators. It must not hold a
+        # reference to the loop, the key of the client in _clients.
+        try:
+            yield
+        finally:
+            loop = asyncio.get_running_loop()
+            if self._clients.get(loop, (None,))[0] is client:
+                del self._clients[loop]
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        '''
+        Close the pooled HTTP clients and release their connections.
+        '''
+        running = asyncio.get_running_loop()
+        for loop, (_, _, closer) in list(self._clients.items()):
+            if loop is running:
+                await closer.aclose()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(
+                    closer.aclose(), loop))
+            # Otherwise the client is closed when its loop shuts down.
+
     def _curl_cmd(
                 self,
                 url: str,
@@ -89,6 +353,86 @@ class ApiRequester:
         :returns: data or empty :class:`dict` if not found.
         :rtype: :class:`dict` or :class:`List` of :class:`dict`
         '''
+        if self._cache is not None:
+            method = 'POST' if payload else 'GET'
+            content = await self._cache.get_async(
+                self._cache.key(method, url, parameters, payload))
+            if content is not None:
+                return self._decode(content)
+
+        if not self._coalesce_requests:
+            return await self._fetch(url, parameters, headers, payload)
+
+        loop = asyncio.get_running_loop()
+        key = self._request_key(url, parameters, headers, payload)
+        flight = self._in_flight.get(key)
+        if flight is not None and flight[0].get_loop() is loop:
+            self._coalesced_calls += 1
+            return await self._wait_for_flight(key, flight)
+
+        task = loop.create_task(
+            self._fetch(url, parameters, headers, payload))
+        flight = [task, 0]
+        self._in_flight[key] = flight
+
+        def land(_) -> None:
+            if self._in_flight.get(key) is flight:
+                del self._in_flight[key]
+
+        task.add_done_callback(land)
+        return await self._wait_for_flight(key, flight)
+
+    @staticmethod
+    def _request_key(
+                url: str,
+                parameters: str,
+                headers: dict,
+                payload: dict = None
+            ) -> tuple:
+        '''
+        Identifies a request regardless of the order of its parameters.
+        '''
+        method = 'POST' if payload else 'GET'
+        parameters = '&'.join(sorted(
+            param for param in parameters.split('&') if param))
+        return (
+            method,
+            url,
+            parameters,
+            json.dumps(headers, sort_keys=True),
+            json.dumps(payload, sort_keys=True) if payload else None
+        )
+
+    async def _wait_for_flight(self, key: tuple, flight: list):
+        '''
+        Waits for a shared request. The request is only cancelled when all
+        its callers have been cancelled. Each caller gets its own copy of the
+        data, so that they can't affect each other, except the last one to
+        resume, which gets the data itself.
+        '''
+        task = flight[0]
+        flight[1] += 1
+        try:
+            data = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            flight[1] -= 1
+            if not flight[1]:
+                task.cancel()
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+            raise
+        # No caller can join once the request is done, as it is removed
+        # from the requests in flight before any caller resumes.
+        flight[1] -= 1
+        return copy.deepcopy(data) if flight[1] else data
+
+    async def _fetch(
+                self,
+                url: str,
+                parameters: str,
+                headers: dict,
+                payload: dict = None
+            ) -> Union[dict, List[dict]]:
         if self.retry:
             return await self._get_data_async(
                 url, parameters, headers, payload)
@@ -97,7 +441,7 @@ class ApiRequester:
             )(self, url, parameters, headers, payload)
 
     @rerun(
-        wait=wait_exponential(min=5, max=60),
+        wait=_wait_for_retry,
         retry=retry_if_exception_type(ConnectionRefusedError),
         stop=stop_after_attempt(10)
     )
@@ -118,35 +462,71 @@ class ApiRequester:
         logger.debug(f'Payload: {payload}')
         logger.debug(f'cURL command: {self._curl_cmd(url, parameters, method, headers, payload)}')
 
-        async with httpx.AsyncClient() as client:
-            r = await client.request(
-                method, url, params=parameters,timeout=self._timeout, headers=headers,
-                json=payload)
+        r = await self._send(method, url, parameters, headers, payload)
 
         data = {}
         if r.status_code == 200:
-            data = r.json()
-            if len(data) == 1 and 'error' in data:
-                data = {}
+            data = self._decode(r.content)
+            if self._cache is not None:
+                await self._cache.set_async(
+                    self._cache.key(method, url, parameters, payload),
+                    url, r.content)
         elif r.status_code == 400:
-            data = r.json()
+            data = self._loads(r.content)
             raise BadQueryParametersException(data['error'])
         elif r.status_code == 403:
             raise PermissionError('HTTP status 403 Forbidden.')
         elif r.status_code == 404:
-            data = r.json()
+            data = self._loads(r.content)
             raise ObjectNotFoundException(data['error'])
         elif r.status_code == 429:
-            raise ConnectionRefusedError('HTTP status 429 Too Many Requests.')
+            exception = ConnectionRefusedError(
+                'HTTP status 429 Too Many Requests.')
+            if 'Retry-After' in r.headers:
+                exception.retry_after = _parse_retry_after(
+                    r.headers['Retry-After'])
+            raise exception
         elif r.status_code == 500:
-            data = r.json()
+            data = self._loads(r.content)
             raise InternalServerErrorException(data['message'])
         elif r.status_code == 504:
-            data = r.json()
+            data = self._loads(r.content)
             raise GatewayTimeoutException(data['message'])
 
         return data
 
+    def _decode(self, content: bytes) -> Union[dict, List[dict]]:
+        data = self._loads(content)
+        if len(data) == 1 and 'error' in data:
+            data = {}
+        return data
+
+    async def _send(
+                self,
+                method: str,
+                url: str,
+                parameters: str,
+                headers: dict,
+                payload: dict = None
+            ) -> httpx.Response:
+        limiter = self._concurrency_limiter
+        if limiter:
+            started_round = await limiter.acquire()
+        status_code = None
+        try:
+            if self._rate_limiter:
+                await self._rate_limiter.acquire()
+            client, streams = await self._get_client()
+            async with streams:
+                r = await client.request(
+                    method, url, params=parameters, timeout=self._timeout,
+                    headers=headers, json=payload)
+            status_code = r.status_code
+        finally:
+            if limiter:
+                limiter.release(started_round, status_code)
+        return r
+
     def get_data(
                 self,
                 url: str,
@@ -1,20 +1,36 @@
+import asyncio
+import itertools
 import logging
 import re
 import warnings
-from typing import List, Literal, Tuple, Union
+from datetime import date
+from typing import Any, AsyncIterator, Iterable, List, Literal, Tuple, Union
 
 from semanticscholar.ApiRequester import ApiRequester
 from semanticscholar.Author import Author
 from semanticscholar.BaseReference import BaseReference
+from semanticscholar.BatchLoader import BatchLoader
 from semanticscholar.Citation import Citation
 from semanticscholar.Dataset import Dataset
 from semanticscholar.DatasetDiff import DatasetDiff
 from semanticscholar.PaginatedResults import PaginatedResults
+from semanticscholar.AdaptiveConcurrencyLimiter import \
+    AdaptiveConcurrencyLimiter
+from semanticscholar.NotFoundCache import NotFoundCache
 from semanticscholar.Paper import Paper
+from semanticscholar.PaperCache import PaperCache
+from semanticscholar.RateLimiter import RateLimiter
 from semanticscholar.Reference import Reference
 from semanticscholar.Release import Release
+from semanticscholar.ResponseCache import ResponseCache
 from semanticscholar.Autocomplete import Autocomplete
+from semanticscholar.SQLiteResponseCache import SQLiteResponseCache
+from semanticscholar.SemanticScholarException import \
+    NoMorePagesException, ObjectNotFoundException
 from semanticscholar.Snippet import Snippet
+from semanticscholar._utils import (
+    _format_date_range, _format_year_range, _parse_date_range,
+    _parse_year_range, _split_range)
 
 logger = logging.getLogger('semanticscholar')
 
@@ -39,6 +55,26 @@ class AsyncSemanticScholar:
                 api_url: str = None,
                 debug: bool = False,
                 retry: bool = True,
+                max_connections: int = 100,
+                max_keepalive_connections: int = 20,
+                keepalive_expiry: float = 5.0,
+                http2: bool = False,
+                max_concurrent_streams: int = 100,
+                rate_limit: Union[float, str, RateLimiter] = None,
+                adaptive_concurrency: Union[
+                    bool, AdaptiveConcurrencyLimiter] = False,
+                coalesce_requests: bool = True,
+                max_concurrent_batches: int = 4,
+                batch_lookups: bool = False,
+                batch_delay: float = 0.005,
+                page_concurrency: int = 1,
+                read_ahead: int = 0,
+                lazy_items: bool = False,
+                json_decoder: str = None,
+                raw: bool = False,
+                cache: Union[bool, str, ResponseCache] = False,
+                paper_cache: Union[bool, PaperCache] = False,
+                not_found_cache: Union[bool, str, NotFoundCache] = False
             ) -> None:
         '''
         :param float timeout: (optional) an exception is raised
@@ -47,6 +83,69 @@ class AsyncSemanticScholar:
         :param str api_url: (optional) custom API url.
         :param bool debug: (optional) enable debug mode.
         :param bool retry: enable retry mode.
+        :param int max_connections: (optional) maximum number of concurrent
+               connections in the pool.
+        :param int max_keepalive_connections: (optional) maximum number of
+               idle connections kept alive in the pool.
+        :param float keepalive_expiry: (optional) time in seconds an idle
+               connection is kept alive before being closed.
+        :param bool http2: (optional) multiplex requests over HTTP/2
+               connections. Requires the ``h2`` package, installed with
+               ``pip install semanticscholar[http2]``.
+        :param int max_concurrent_streams: (optional) maximum number of
+               requests in flight on each HTTP/2 connection.
+        :param rate_limit: (optional) pace requests on the client side to
+               stay under the API rate limit. Either a number of requests
+               per second, the name of a preset ("unauthenticated" or
+               "api_key"), or a
+               :class:`semanticscholar.RateLimiter.RateLimiter` instance.
+        :param adaptive_concurrency: (optional) adapt the number of requests
+               in flight to the API responses, backing off on HTTP 429 and
+               5xx. Either True, to use the default settings, or a
+               :class:`semanticscholar.AdaptiveConcurrencyLimiter.\
+               AdaptiveConcurrencyLimiter` instance.
+        :param bool coalesce_requests: (optional) share a single HTTP call
+               between identical requests made at the same time.
+        :param int max_concurrent_batches: (optional) maximum number of
+               batch requests sent at the same time when a call to
+               :meth:`get_papers` or :meth:`get_authors` is split into
+               several batches.
+        :param bool batch_lookups: (optional) send :meth:`get_paper` and
+               :meth:`get_author` calls made at about the same time as a
+               single batch request.
+        :param float batch_delay: (optional) time in seconds to wait for
+               more lookups before sending a batch.
+        :param int page_concurrency: (optional) number of pages requested
+               at the same time when iterating over offset-based paginated
+               results.
+        :param int read_ahead: (optional) number of pages fetched in the
+               background while iterating over paginated results, ahead of
+               the page being consumed.
+        :param bool lazy_items: (optional) keep the raw data of paginated
+               results and build each item object only when the item is
+               first accessed.
+        :param str json_decoder: (optional) library decoding the response
+               bodies: "orjson", "msgspec" or "json". Defaults to the
+               fastest one installed.
+        :param bool raw: (optional) return the response data as
+               :class:`dict` objects, without building the API objects.
+        :param cache: (optional) answer identical requests from previous
+               responses. Either True, to keep them in memory with the
+               default settings, the path of a SQLite database file to
+               keep them on disk, shared across processes, or a
+               :class:`semanticscholar.ResponseCache.ResponseCache`
+               instance.
+        :param paper_cache: (optional) keep the papers returned by any
+               method, so that lookups by any of their IDs are answered
+               locally. Either True, to use the default settings, or a
+               :class:`semanticscholar.PaperCache.PaperCache` instance.
+        :param not_found_cache: (optional) remember the paper and author
+               IDs reported as not found, and don't request them again
+               until they expire. Either True, to use the default
+               settings, the path of a file where they are saved for later
+               runs, or a
+               :class:`semanticscholar.NotFoundCache.NotFoundCache`
+               instance.
         '''
 
         if debug:
@@ -65,9 +164,87 @@ class AsyncSemanticScholar:
 
         self._timeout = timeout
         self._retry = retry
-        self._requester = ApiRequester(self._timeout, self._retry)
+        self._requester = ApiRequester(
+            self._timeout,
+            self._retry,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            max_concurrent_streams=max_concurrent_streams,
+            coalesce_requests=coalesce_requests,
+            json_decoder=json_decoder
+        )
         self.debug = debug
 
+        if cache is True:
+            cache = ResponseCache()
+        elif cache is False:
+            cache = None
+        elif isinstance(cache, str):
+            cache = SQLiteResponseCache(cache)
+        self.cache = cache
+
+        if paper_cache is True:
+            paper_cache = PaperCache()
+        elif paper_cache is False:
+            paper_cache = None
+        self.paper_cache = paper_cache
+
+        if not_found_cache is True:
+            not_found_cache = NotFoundCache()
+        elif not_found_cache is False:
+            not_found_cache = None
+        elif isinstance(not_found_cache, str):
+            not_found_cache = NotFoundCache(path=not_found_cache)
+        self.not_found_cache = not_found_cache
+
+        if isinstance(rate_limit, str):
+            rate_limit = RateLimiter.from_preset(rate_limit)
+        elif rate_limit is not None and \
+                not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(rate_limit)
+        self.rate_limiter = rate_limit
+
+        if adaptive_concurrency is True:
+            adaptive_concurrency = AdaptiveConcurrencyLimiter()
+        self.concurrency_limiter = adaptive_concurrency or None
+        self.max_concurrent_batches = max_concurrent_batches
+        self.page_concurrency = page_concurrency
+        self.read_ahead = read_ahead
+        self.raw = raw
+        self.lazy_items = lazy_items
+
+        self._paper_loader = None
+        self._author_loader = None
+        if batch_lookups:
+            self._paper_loader = BatchLoader(
+                self._load_paper_batch, 500, batch_delay)
+            self._author_loader = BatchLoader(
+                self._load_author_batch, 1000, batch_delay)
+
+    async def __aenter__(self) -> 'AsyncSemanticScholar':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        '''
+        Close the underlying HTTP connection pool and the response cache if
+        it can be closed, such as a
+        :class:`semanticscholar.SQLiteResponseCache.SQLiteResponseCache`,
+        and save the not found cache if it has a path. The client can still
+        be used afterwards, in which case a new pool is created.
+        '''
+        await self._requester.aclose()
+        close = getattr(self.cache, 'close', None)
+        if close is not None:
+            await asyncio.to_thread(close)
+        if self._not_found_cache is not None and \
+                self._not_found_cache.path is not None:
+            await asyncio.to_thread(self._not_found_cache.save)
+
     @property
     def timeout(self) -> int:
         '''
@@ -125,6 +302,232 @@ class AsyncSemanticScholar:
         self._retry = retry
         self._requester.retry = retry
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        '''
+        Client-side rate limiter, or None if requests are not paced. Exposes
+        the live state: available tokens, queue depth and time spent
+        waiting.
+
+        :type: :class:`semanticscholar.RateLimiter.RateLimiter`
+        '''
+        return self._requester.rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, rate_limiter: RateLimiter) -> None:
+        '''
+        :param RateLimiter rate_limiter:
+        '''
+        self._requester.rate_limiter = rate_limiter
+
+    @property
+    def concurrency_limiter(self) -> AdaptiveConcurrencyLimiter:
+        '''
+        Adaptive concurrency limiter shared by all requests of this client,
+        or None if disabled.
+
+        :type: :class:`semanticscholar.AdaptiveConcurrencyLimiter.\
+            AdaptiveConcurrencyLimiter`
+        '''
+        return self._requester.concurrency_limiter
+
+    @concurrency_limiter.setter
+    def concurrency_limiter(
+                self,
+                concurrency_limiter: AdaptiveConcurrencyLimiter
+            ) -> None:
+        '''
+        :param AdaptiveConcurrencyLimiter concurrency_limiter:
+        '''
+        self._requester.concurrency_limiter = concurrency_limiter
+
+    @property
+    def cache(self) -> ResponseCache:
+        '''
+        Response cache shared by all requests of this client, or None if
+        disabled.
+
+        :type: :class:`semanticscholar.ResponseCache.ResponseCache`
+        '''
+        return self._requester.cache
+
+    @cache.setter
+    def cache(self, cache: ResponseCache) -> None:
+        '''
+        :param ResponseCache cache:
+        '''
+        self._requester.cache = cache
+
+    @property
+    def paper_cache(self) -> PaperCache:
+        '''
+        Cache of the papers returned by this client, or None if disabled.
+
+        :type: :class:`semanticscholar.PaperCache.PaperCache`
+        '''
+        return self._paper_cache
+
+    @paper_cache.setter
+    def paper_cache(self, paper_cache: PaperCache) -> None:
+        '''
+        :param PaperCache paper_cache:
+        '''
+        self._paper_cache = paper_cache
+
+    @property
+    def not_found_cache(self) -> NotFoundCache:
+        '''
+        Cache of the paper and author IDs reported as not found, or None if
+        disabled.
+
+        :type: :class:`semanticscholar.NotFoundCache.NotFoundCache`
+        '''
+        return self._not_found_cache
+
+    @not_found_cache.setter
+    def not_found_cache(self, not_found_cache: NotFoundCache) -> None:
+        '''
+        :param NotFoundCache not_found_cache:
+        '''
+        self._not_found_cache = not_found_cache
+
+    @property
+    def coalesced_calls(self) -> int:
+        '''
+        Number of HTTP calls saved by sharing the response of an identical
+        request already in flight.
+
+        :type: :class:`int`
+        '''
+        return self._requester.coalesced_calls
+
+    @property
+    def max_concurrent_batches(self) -> int:
+        '''
+        Maximum number of batch requests sent at the same time.
+
+        :type: :class:`int`
+        '''
+        return self._max_concurrent_batches
+
+    @max_concurrent_batches.setter
+    def max_concurrent_batches(self, max_concurrent_batches: int) -> None:
+        '''
+        :param int max_concurrent_batches:
+        '''
+        if max_concurrent_batches < 1:
+            raise ValueError(
+                'The max_concurrent_batches parameter must be at least 1.')
+        self._max_concurrent_batches = max_concurrent_batches
+
+    @property
+    def page_concurrency(self) -> int:
+        '''
+        Number of pages requested at the same time when iterating over
+        offset-based paginated results.
+
+        :type: :class:`int`
+        '''
+        return self._page_concurrency
+
+    @page_concurrency.setter
+    def page_concurrency(self, page_concurrency: int) -> None:
+        '''
+        :param int page_concurrency:
+        '''
+        if page_concurrency < 1:
+            raise ValueError(
+                'The page_concurrency parameter must be at least 1.')
+        self._page_concurrency = page_concurrency
+
+    @property
+    def read_ahead(self) -> int:
+        '''
+        Number of pages fetched in the background while iterating over
+        paginated results.
+
+        :type: :class:`int`
+        '''
+        return self._read_ahead
+
+    @read_ahead.setter
+    def read_ahead(self, read_ahead: int) -> None:
+        '''
+        :param int read_ahead:
+        '''
+        if read_ahead < 0:
+            raise ValueError(
+                'The read_ahead parameter must not be negative.')
+        self._read_ahead = read_ahead
+
+    @property
+    def lazy_items(self) -> bool:
+        '''
+        Whether paginated results build each item object only when the
+        item is first accessed.
+
+        :type: :class:`bool`
+        '''
+        return self._lazy_items
+
+    @lazy_items.setter
+    def lazy_items(self, lazy_items: bool) -> None:
+        '''
+        :param bool lazy_items:
+        '''
+        self._lazy_items = lazy_items
+
+    @property
+    def raw(self) -> bool:
+        '''
+        Whether methods return the response data as :class:`dict` objects
+        instead of API objects.
+
+        :type: :class:`bool`
+        '''
+        return self._raw
+
+    @raw.setter
+    def raw(self, raw: bool) -> None:
+        '''
+        :param bool raw:
+        '''
+        self._raw = raw
+
+    def _build(self, data_type: Any, data: dict) -> Any:
+        '''
+        Builds the API object of data_type from its data, or returns the
+        data itself in raw mode.
+        '''
+        return data if self._raw else data_type(data)
+
+    def _build_all(self, data_type: Any, items: List[dict]) -> list:
+        '''
+        Builds the API objects of data_type from a list of data, or returns
+        the list itself in raw mode.
+        '''
+        return items if self._raw else [data_type(item) for item in items]
+
+    @property
+    def paper_loader(self) -> BatchLoader:
+        '''
+        Batches :meth:`get_paper` calls when ``batch_lookups`` is enabled,
+        None otherwise.
+
+        :type: :class:`semanticscholar.BatchLoader.BatchLoader`
+        '''
+        return self._paper_loader
+
+    @property
+    def author_loader(self) -> BatchLoader:
+        '''
+        Batches :meth:`get_author` calls when ``batch_lookups`` is enabled,
+        None otherwise.
+
+        :type: :class:`semanticscholar.BatchLoader.BatchLoader`
+        '''
+        return self._author_loader
+
     async def get_paper(
                 self,
                 paper_id: str,
@@ -155,17 +558,68 @@ class AsyncSemanticScholar:
         if not fields:
             fields = Paper.FIELDS
 
-        base_url = self.api_url + self.BASE_PATH_GRAPH
-        url = f'{base_url}/paper/{paper_id}'
+        if self._paper_cache is not None:
+            data = self._paper_cache.get(str(paper_id), fields)
+            if data is not None:
+                return self._build(Paper, data)
 
-        fields = ','.join(fields)
-        parameters = f'&fields={fields}'
+        data = await self._get_object('paper', paper_id, fields)
 
-        data = await self._requester.get_data_async(url, parameters, self.auth_header)
-        paper = Paper(data)
+        if self._paper_cache is not None:
+            self._paper_cache.put(data, fields)
+
+        paper = self._build(Paper, data)
 
         return paper
 
+    async def _load_paper_batch(
+                self,
+                paper_ids: List[str],
+                fields: Tuple[str, ...]
+            ) -> List[dict]:
+        url = f'{self.api_url}{self.BASE_PATH_GRAPH}/paper/batch'
+        parameters = f'&fields={",".join(fields)}'
+        return await self._requester.get_data_async(
+            url, parameters, self.auth_header, {'ids': paper_ids})
+
+    async def _get_object(
+                self,
+                kind: str,
+                object_id: str,
+                fields: list
+            ) -> dict:
+        '''
+        Fetches a paper or an author, through the batch loader when enabled.
+        IDs reported as not found are remembered by the not found cache.
+        '''
+        not_found = ObjectNotFoundException(
+            f'{kind.capitalize()} with id {object_id} not found')
+        if self._not_found_cache is not None and \
+                self._not_found_cache.contains(kind, object_id):
+            raise not_found
+
+        loader = self._paper_loader if kind == 'paper' else \
+            self._author_loader
+        try:
+            if loader:
+                data = await loader.load(
+                    str(object_id), tuple(sorted(fields)))
+                if data is None:
+                    raise not_found
+            else:
+                base_url = self.api_url + self.BASE_PATH_GRAPH
+                url = f'{base_url}/{kind}/{object_id}'
+                parameters = f'&fields={",".join(fields)}'
+                data = await self._requester.get_data_async(
+                    url, parameters, self.auth_header)
+        except ObjectNotFoundException:
+            if self._not_found_cache is not None:
+                self._not_found_cache.add(kind, object_id)
+                await self._save_not_found_cache()
+            raise
+
+        return data
+
     async def get_papers(
                 self,
                 paper_ids: List[str],
@@ -179,8 +633,8 @@ class AsyncSemanticScholar:
             <https://api.semanticscholar.org/api-docs/graph#tag/Paper-Data\
             /operation/post_graph_get_papers>`_
 
-        :param str paper_ids: list of IDs (must be <= 500) - S2PaperId, 
-            CorpusId, DOI, ArXivId, MAG, ACL, PMID, PMCID, or URL from:
+        :param str paper_ids: list of IDs - S2PaperId, CorpusId, DOI,
+            ArXivId, MAG, ACL, PMID, PMCID, or URL from:
 
             - semanticscholar.org
             - arxiv.org
@@ -188,6 +642,9 @@ class AsyncSemanticScholar:
             - acm.org
             - biorxiv.org
 
+            Lists of more than 500 IDs are split into several batch
+            requests, sent concurrently.
+
         :param list fields: (optional) list of the fields to be returned.
         :param bool return_not_found: (optional) flag to include not found IDs 
                in the return, except for IDs in URL:<url> format.
@@ -199,9 +656,10 @@ class AsyncSemanticScholar:
         :raises: BadQueryParametersException: if no paper was found.
         '''
 
-        if len(paper_ids) > 500 or len(paper_ids) == 0:
+        paper_ids = list(paper_ids)
+        if len(paper_ids) == 0:
             raise ValueError(
-                'The paper_ids parameter must be a list of 1 to 500 IDs.')
+                'The paper_ids parameter must be a list of at least 1 ID.')
 
         if not fields:
             fields = Paper.SEARCH_FIELDS
@@ -209,45 +667,136 @@ class AsyncSemanticScholar:
         base_url = self.api_url + self.BASE_PATH_GRAPH
         url = f'{base_url}/paper/batch'
 
-        fields = ','.join(fields)
-        parameters = f'&fields={fields}'
-
-        payload = { "ids": paper_ids }
-
-        data = await self._requester.get_data_async(
-            url, parameters, self.auth_header, payload)
-        papers = [Paper(item) for item in data if item is not None]
-
-        not_found_ids = self._get_not_found_ids(paper_ids, papers)
+        parameters = f'&fields={",".join(fields)}'
+
+        # Data of each paper, by the ID it was requested with: first the
+        # papers found in the cache, then the ones fetched.
+        found = {}
+        if self._paper_cache is not None:
+            for paper_id in paper_ids:
+                data = self._paper_cache.get(paper_id, fields)
+                if data is not None:
+                    found[paper_id] = data
+        missing_ids = [id for id in paper_ids if id not in found]
+
+        not_found_ids = []
+        results = []
+        if missing_ids:
+            results = [
+                result async for result in
+                self._iter_batches(
+                    url, parameters, missing_ids, 500, 'paper')]
+        for _, batch, data in sorted(results, key=lambda result: result[0]):
+            items = [item for item in data if item is not None]
+            found.update(
+                (id, item) for id, item in zip(batch, data)
+                if item is not None)
+            not_found_ids += self._get_not_found_ids(batch, items)
+            if self._paper_cache is not None:
+                self._paper_cache.put_all(items, fields)
+
+        papers = self._build_all(
+            Paper, [found[id] for id in paper_ids if id in found])
 
         if not_found_ids:
             logger.warning(f"IDs not found: {not_found_ids}")
 
         return papers if not return_not_found else (papers, not_found_ids)
 
-    def _get_not_found_ids(self, paper_ids, papers):
+    async def _iter_batches(
+                self,
+                url: str,
+                parameters: str,
+                ids: Iterable[str],
+                batch_size: int,
+                kind: str = None
+            ) -> AsyncIterator[Tuple[int, List[str], List[dict]]]:
+        '''
+        Sends one batch request per batch_size IDs, at most
+        max_concurrent_batches at a time, and yields the index of each
+        batch, its IDs and the response as soon as it is received. IDs are
+        read from the iterable only when a new batch can be sent.
+
+        When kind is given and the not found cache enabled, IDs known to be
+        missing are left out of the requests, with None in the response as
+        for any ID not found, and the IDs not found are added to the cache.
+        '''
+        ids = iter(ids)
+        pending = set()
+        next_index = 0
+        not_found_cache = self._not_found_cache if kind else None
+
+        def next_batch() -> Tuple[List[str], List[str]]:
+            # The IDs of the batch and the ones to request. Batches of IDs
+            # known to be missing are bounded too, so that iterables are
+            # still read a few batches at a time.
+            batch = []
+            requested = []
+            for id in ids:
+                batch.append(id)
+                if not_found_cache is None or \
+                        not not_found_cache.contains(kind, id):
+                    requested.append(id)
+                if len(requested) == batch_size or \
+                        len(batch) == 10 * batch_size:
+                    break
+            return batch, requested
+
+        async def post(
+                    index: int,
+                    batch: List[str],
+                    requested: List[str]
+                ) -> tuple:
+            data = []
+            if requested:
+                data = await self._requester.get_data_async(
+                    url, parameters, self.auth_header, {'ids': requested})
+            if not_found_cache is not None:
+                not_found_cache.add_all(
+                    kind,
+                    [id for id, item in zip(requested, data) if item is None])
+                await self._save_not_found_cache()
+                found = dict(zip(requested, data))
+                data = [found.get(id) for id in batch]
+            return index, batch, data
+
+        try:
+            while True:
+                while len(pending) < self._max_concurrent_batches:
+                    batch, requested = next_batch()
+                    if not batch:
+                        break
+                    pending.add(asyncio.ensure_future(
+                        post(next_index, batch, requested)))
+                    next_index += 1
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda task: task.result()[0]):
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _save_not_found_cache(self) -> None:
+        '''
+        Saves the not found cache when its save interval has elapsed, on
+        another thread so that the file I/O doesn't block the event loop.
+        '''
+        if self._not_found_cache.save_due:
+            await asyncio.to_thread(self._not_found_cache.save)
 
-        prefix_mapping = {
-            'ARXIV': 'ArXiv',
-            'DOI': 'DOI',
-            'MAG': 'MAG',
-            'ACL': 'ACL',
-            'PMID': 'PubMed',
-            'PMCID': 'PubMedCentral',
-            'CorpusId': 'CorpusId'
-        }
-        prefix_mapping = {v.lower(): k for k, v in prefix_mapping.items()}
+    def _get_not_found_ids(self, paper_ids, papers):
 
         found_ids = set()
         for paper in papers:
-            found_ids.add(paper.paperId)
-            if paper.externalIds:
-                for prefix, value in paper.externalIds.items():
-                    found_ids.add(f'{value}')
-                    if prefix.lower() in prefix_mapping:
-                        found_ids.add(
-                            f'{prefix_mapping[prefix.lower()]}:{value}')
-        found_ids = {id.lower() for id in found_ids}
+            # Works on the response data as well as on Paper objects.
+            if isinstance(paper, Paper):
+                paper = paper.raw_data
+            found_ids.update(
+                alias.lower()
+                for alias in PaperCache.aliases(paper, bare=True))
 
         not_found_ids = [id for id in paper_ids if id.lower() not in found_ids]
 
@@ -296,7 +845,11 @@ class AsyncSemanticScholar:
                 data_type=Author,
                 url=url,
                 fields=fields,
-                limit=limit
+                limit=limit,
+                page_concurrency=self._page_concurrency,
+                read_ahead=self._read_ahead,
+                lazy=self._lazy_items,
+                raw=self._raw
             )
 
         return results
@@ -343,7 +896,11 @@ class AsyncSemanticScholar:
                 data_type=Citation,
                 url=url,
                 fields=fields,
-                limit=limit
+                limit=limit,
+                page_concurrency=self._page_concurrency,
+                read_ahead=self._read_ahead,
+                lazy=self._lazy_items,
+                raw=self._raw
             )
 
         return results
@@ -390,7 +947,11 @@ class AsyncSemanticScholar:
                 data_type=Reference,
                 url=url,
                 fields=fields,
-                limit=limit
+                limit=limit,
+                page_concurrency=self._page_concurrency,
+                read_ahead=self._read_ahead,
+                lazy=self._lazy_items,
+                raw=self._raw
             )
 
         return results
@@ -409,7 +970,8 @@ class AsyncSemanticScholar:
                 limit: int = 100,
                 bulk: bool = False,
                 sort: str = None,
-                match_title: bool = False
+                match_title: bool = False,
+                stream: bool = False
             ) -> Union[PaginatedResults, Paper]:
         '''
         Search for papers by keyword. Performs a search query based on the 
@@ -454,6 +1016,9 @@ class AsyncSemanticScholar:
                (ascending) or desc (descending).
         :param bool match_title: (optional) retrieve a single paper whose 
                title best matches the given query.
+        :param bool stream: (optional) keep only the current page of
+               results in memory while iterating, instead of accumulating
+               every page in items.
         :returns: query results.
         :rtype: :class:`semanticscholar.PaginatedResults.PaginatedResults` or 
             :class:`semanticscholar.Paper.Paper`
@@ -523,11 +1088,180 @@ class AsyncSemanticScholar:
                 fields,
                 limit,
                 self.auth_header,
-                max_results=max_results
+                max_results=max_results,
+                page_concurrency=self._page_concurrency,
+                read_ahead=self._read_ahead,
+                stream=stream,
+                lazy=self._lazy_items,
+                raw=self._raw,
+                paper_cache=self._paper_cache
             )
 
         return results if not match_title else results[0]
 
+    async def search_paper_partitioned(
+                self,
+                query: str,
+                partitions: int = 4,
+                publication_date_or_year: str = None,
+                year: str = None,
+                publication_types: list = None,
+                open_access_pdf: bool = None,
+                venue: list = None,
+                fields_of_study: list = None,
+                fields: list = None,
+                min_citation_count: int = None
+            ) -> AsyncIterator[Paper]:
+        '''
+        Bulk search for papers, split into disjoint publication date or
+        year ranges that are iterated over concurrently. Ranges with more
+        results are split further, until there are as many ranges as
+        partitions. The papers of all ranges are yielded as soon as their
+        pages are received, in no particular order.
+
+        :calls: `GET /graph/v1/paper/search/bulk \
+            <https://api.semanticscholar.org/api-docs/graph#tag/Paper-Data\
+            /operation/get_graph_paper_bulk_search>`_
+
+        :param str query: plain-text search query string.
+        :param int partitions: (optional) maximum number of ranges iterated
+               over at the same time.
+        :param str publication_date_or_year: (optional) range of
+               publication date to split, in the format
+               <start_date>:<end_date>, where dates are in the format
+               YYYY-MM-DD, YYYY-MM, or YYYY. Either this or year is
+               required.
+        :param str year: (optional) range of years to split, in the format
+               <year>, <start_year>-<end_year>, <start_year>- or
+               -<end_year>. Either this or publication_date_or_year is
+               required.
+        :param list publication_types: (optional) restrict results to the
+               given publication type list.
+        :param bool open_access_pdf: (optional) restrict results to papers
+               with public PDFs.
+        :param list venue: (optional) restrict results to the given venue
+               list.
+        :param list fields_of_study: (optional) restrict results to given
+               field-of-study list, using the s2FieldsOfStudy paper field.
+        :param list fields: (optional) list of the fields to be returned.
+        :param int min_citation_count: (optional) restrict results to
+               papers with at least the given number of citations.
+        :returns: papers of all ranges.
+        :rtype: :class:`AsyncIterator` of :class:`semanticscholar.Paper.Paper`
+        '''
+
+        async for page in self._iter_partition_pages(
+                query, partitions, publication_date_or_year, year,
+                publication_types, open_access_pdf, venue, fields_of_study,
+                fields, min_citation_count):
+            for paper in page:
+                yield paper
+
+    async def _iter_partition_pages(
+                self,
+                query: str,
+                partitions: int,
+                publication_date_or_year: str,
+                year: str,
+                publication_types: list,
+                open_access_pdf: bool,
+                venue: list,
+                fields_of_study: list,
+                fields: list,
+                min_citation_count: int
+            ) -> AsyncIterator[List[Paper]]:
+
+        if partitions < 1:
+            raise ValueError('The partitions parameter must be at least 1.')
+        if (publication_date_or_year is None) == (year is None):
+            raise ValueError(
+                'Exactly one of the publication_date_or_year and year '
+                'parameters is required.')
+
+        today = date.today()
+        if year is not None:
+            bounds = _parse_year_range(year)
+            defaults = (1900, today.year)
+            format_range = _format_year_range
+            key = 'year'
+        else:
+            bounds = _parse_date_range(publication_date_or_year)
+            defaults = (date(1900, 1, 1).toordinal(), today.toordinal())
+            format_range = _format_date_range
+            key = 'publication_date_or_year'
+
+        async def search(bounds: tuple) -> tuple:
+            results = await self.search_paper(
+                query,
+                publication_types=publication_types,
+                open_access_pdf=open_access_pdf,
+                venue=venue,
+                fields_of_study=fields_of_study,
+                fields=fields,
+                min_citation_count=min_citation_count,
+                bulk=True,
+                stream=True,
+                **{key: format_range(*bounds)}
+            )
+            return bounds, results
+
+        # Split the ranges with the most results, each split costing the
+        # first page of the range, until no range holds more than its
+        # share of the results or there are enough ranges.
+        parts = [await search(bounds)]
+        while len(parts) < partitions:
+            splittable = sorted(
+                (part for part in parts
+                 if part[1].total and _split_range(*part[0], *defaults)),
+                key=lambda part: part[1].total,
+                reverse=True)
+            share = sum(results.total for _, results in parts) / partitions
+            to_split = [
+                part for part in splittable[:partitions - len(parts)]
+                if part[1].total > share] or splittable[:1]
+            if not to_split:
+                break
+            for part in to_split:
+                parts.remove(part)
+            parts += await asyncio.gather(*(
+                search(half) for part in to_split
+                for half in _split_range(*part[0], *defaults)))
+
+        logger.debug('Bulk search partitions: %s', [
+            (format_range(*bounds), results.total)
+            for bounds, results in parts])
+
+        queue = asyncio.Queue(len(parts))
+
+        async def read(results: PaginatedResults) -> None:
+            try:
+                while True:
+                    await queue.put(results.items)
+                    try:
+                        await results.async_next_page()
+                    except NoMorePagesException:
+                        break
+            except Exception as exception:
+                await queue.put(exception)
+                return
+            await queue.put(None)
+
+        tasks = [
+            asyncio.ensure_future(read(results)) for _, results in parts]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                page = await queue.get()
+                if page is None:
+                    remaining -= 1
+                elif isinstance(page, BaseException):
+                    raise page
+                else:
+                    yield page
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def get_author(
                 self,
                 author_id: str,
@@ -549,20 +1283,24 @@ class AsyncSemanticScholar:
         if not fields:
             fields = Author.FIELDS
 
-        base_url = self.api_url + self.BASE_PATH_GRAPH
-        url = f'{base_url}/author/{author_id}'
-
-        fields = ','.join(fields)
-        parameters = f'&fields={fields}'
-
-        data = await self._requester.get_data_async(url, parameters, self.auth_header)
-        author = Author(data)
+        data = await self._get_object('author', author_id, fields)
+        author = self._build(Author, data)
 
         return author
 
-    async def get_authors(
+    async def _load_author_batch(
                 self,
                 author_ids: List[str],
+                fields: Tuple[str, ...]
+            ) -> List[dict]:
+        url = f'{self.api_url}{self.BASE_PATH_GRAPH}/author/batch'
+        parameters = f'&fields={",".join(fields)}'
+        return await self._requester.get_data_async(
+            url, parameters, self.auth_header, {'ids': author_ids})
+
+    async def get_authors(
+                self,
+                author_ids: Iterable[str],
                 fields: list = None,
                 return_not_found: bool = False
             ) -> Union[List[Author], Tuple[List[Author], List[str]]]:
@@ -573,8 +1311,14 @@ class AsyncSemanticScholar:
             <https://api.semanticscholar.org/api-docs/graph#tag/Author-Data\
             /operation/get_graph_get_author>`_
 
-        :param str author_ids: list of S2AuthorId (must be <= 1000).
-        :returns: author data, and optionally list of IDs not found.
+        :param str author_ids: list or any iterable of S2AuthorId. More than
+               1000 IDs are split into several batch requests, sent
+               concurrently.
+        :param list fields: (optional) list of the fields to be returned.
+        :param bool return_not_found: (optional) flag to include not found IDs 
+               in the return.
+        :returns: author data in the order of the input IDs, and optionally
+                  list of IDs not found.
         :rtype: :class:`List` of :class:`semanticscholar.Author.Author` 
                 or :class:`Tuple` [:class:`List` of 
                 :class:`semanticscholar.Author.Author`, 
@@ -582,9 +1326,63 @@ class AsyncSemanticScholar:
         :raises: BadQueryParametersException: if no author was found.
         '''
 
-        if len(author_ids) > 1000 or len(author_ids) == 0:
+        authors = []
+        not_found_ids = []
+        results = [
+            result async for result in
+            self._iter_author_batches(author_ids, fields)]
+        for _, batch_authors, batch_not_found_ids in sorted(
+                results, key=lambda result: result[0]):
+            authors += batch_authors
+            not_found_ids += batch_not_found_ids
+
+        if not_found_ids:
+            logger.warning(f"IDs not found: {not_found_ids}")
+
+        return authors if not return_not_found else (authors, not_found_ids)
+
+    async def iter_authors(
+                self,
+                author_ids: Iterable[str],
+                fields: list = None
+            ) -> AsyncIterator[Tuple[List[Author], List[str]]]:
+        '''
+        Get details for any number of authors, one batch of up to 1000 IDs
+        at a time. Batches are fetched concurrently and each one is yielded
+        as soon as it is received, so only a few batches are held in memory.
+
+        :calls: `POST /graph/v1/author/batch \
+            <https://api.semanticscholar.org/api-docs/graph#tag/Author-Data\
+            /operation/get_graph_get_author>`_
+
+        :param str author_ids: list or any iterable of S2AuthorId, read as
+               batches are sent.
+        :param list fields: (optional) list of the fields to be returned.
+        :returns: for each batch, the authors found, in the order of the
+                  input IDs, and the IDs not found.
+        :rtype: :class:`AsyncIterator` of :class:`Tuple` [:class:`List` of
+                :class:`semanticscholar.Author.Author`,
+                :class:`List` of :class:`str`]
+        '''
+
+        async for _, authors, not_found_ids in self._iter_author_batches(
+                author_ids, fields):
+            if not_found_ids:
+                logger.warning(f"IDs not found: {not_found_ids}")
+            yield authors, not_found_ids
+
+    async def _iter_author_batches(
+                self,
+                author_ids: Iterable[str],
+                fields: list = None
+            ) -> AsyncIterator[Tuple[int, List[Author], List[str]]]:
+
+        author_ids = iter(author_ids)
+        first_id = next(author_ids, None)
+        if first_id is None:
             raise ValueError(
-                'The author_ids parameter must be a list of 1 to 1000 IDs.')
+                'The author_ids parameter must contain at least 1 ID.')
+        author_ids = itertools.chain([first_id], author_ids)
 
         if not fields:
             fields = Author.SEARCH_FIELDS
@@ -595,19 +1393,14 @@ class AsyncSemanticScholar:
         fields = ','.join(fields)
         parameters = f'&fields={fields}'
 
-        payload = { "ids": author_ids }
-
-        data = await self._requester.get_data_async(
-            url, parameters, self.auth_header, payload)
-        authors = [Author(item) for item in data if item is not None]
-
-        found_ids = [author.authorId for author in authors]
-        not_found_ids = list(set(author_ids) - set(found_ids))
-
-        if not_found_ids:
-            logger.warning(f"IDs not found: {not_found_ids}")
-
-        return authors if not return_not_found else (authors, not_found_ids)
+        batches = self._iter_batches(
+            url, parameters, author_ids, 1000, 'author')
+        async for index, batch, data in batches:
+            items = [item for item in data if item is not None]
+            found_ids = {item.get('authorId') for item in items}
+            authors = self._build_all(Author, items)
+            not_found_ids = [id for id in batch if id not in found_ids]
+            yield index, authors, not_found_ids
 
     async def get_author_papers(
                 self,
@@ -651,7 +1444,12 @@ class AsyncSemanticScholar:
                 data_type=Paper,
                 url=url,
                 fields=fields,
-                limit=limit
+                limit=limit,
+                page_concurrency=self._page_concurrency,
+                read_ahead=self._read_ahead,
+                lazy=self._lazy_items,
+                raw=self._raw,
+                paper_cache=self._paper_cache
             )
 
         return results
@@ -695,7 +1493,56 @@ class AsyncSemanticScholar:
                 fields,
                 limit,
                 self.auth_header,
-                max_results=1000
+                max_results=1000,
+                page_concurrency=self._page_concurrency,
+                read_ahead=self._read_ahead,
+                lazy=self._lazy_items,
+                raw=self._raw
+            )
+
+        return results
+
+    async def resume_results(
+                self,
+                state: dict,
+                checkpoint: str = None,
+                checkpoint_interval: float = None
+            ) -> PaginatedResults:
+        '''
+        Resume paginated results from a cursor state, such as one saved in
+        a checkpoint file, starting with the item following the last one
+        returned when the state was taken.
+
+        :param dict state: cursor state returned by
+               :meth:`semanticscholar.PaginatedResults.PaginatedResults.state`.
+        :param str checkpoint: (optional) path of a file where the cursor
+               state is saved each time all the items of a page have been
+               iterated over.
+        :param float checkpoint_interval: (optional) also save the cursor
+               state within a page, once an item has been processed and at
+               least this many seconds have passed since the last save.
+        :returns: resumed results.
+        :rtype: :class:`semanticscholar.PaginatedResults.PaginatedResults`
+        '''
+
+        data_types = {
+            data_type.__name__: data_type
+            for data_type in (Author, Citation, Paper, Reference)
+        }
+
+        data_type = data_types[state['data_type']]
+        results = await PaginatedResults.from_state(
+                self._requester,
+                data_type,
+                state,
+                self.auth_header,
+                page_concurrency=self._page_concurrency,
+                read_ahead=self._read_ahead,
+                checkpoint=checkpoint,
+                checkpoint_interval=checkpoint_interval,
+                lazy=self._lazy_items,
+                raw=self._raw,
+                paper_cache=self._paper_cache if data_type is Paper else None
             )
 
         return results
@@ -750,7 +1597,7 @@ class AsyncSemanticScholar:
         parameters = f'&fields={fields}&limit={limit}&from={pool_from}'
 
         data = await self._requester.get_data_async(url, parameters, self.auth_header)
-        papers = [Paper(item) for item in data['recommendedPapers']]
+        papers = self._build_all(Paper, data['recommendedPapers'])
 
         return papers
 
@@ -799,7 +1646,7 @@ class AsyncSemanticScholar:
 
         data = await self._requester.get_data_async(
             url, parameters, self.auth_header, payload)
-        papers = [Paper(item) for item in data['recommendedPapers']]
+        papers = self._build_all(Paper, data['recommendedPapers'])
 
         return papers
     
@@ -828,7 +1675,7 @@ class AsyncSemanticScholar:
         if not data or "matches" not in data:
             return []
 
-        return [Autocomplete(suggestion) for suggestion in data["matches"]]
+        return self._build_all(Autocomplete, data['matches'])
 
     async def search_snippet(
                 self,
@@ -919,7 +1766,7 @@ class AsyncSemanticScholar:
         if not data or 'data' not in data:
             return []
 
-        return [Snippet(item) for item in data['data']]
+        return self._build_all(Snippet, data['data'])
 
     async def get_available_releases(self) -> List[Release]:
         """
@@ -961,7 +1808,7 @@ class AsyncSemanticScholar:
         data = await self._requester.get_data_async(
             url, "", self.auth_header)
 
-        return Release(data)
+        return self._build(Release, data)
 
     async def get_dataset_download_links(
             self,
@@ -987,7 +1834,7 @@ class AsyncSemanticScholar:
         data = await self._requester.get_data_async(
             url, "", self.auth_header)
 
-        return Dataset(data)
+        return self._build(Dataset, data)
 
     async def get_dataset_diffs(
             self, 
@@ -1019,4 +1866,4 @@ class AsyncSemanticScholar:
         data = await self._requester.get_data_async(
             url, "", self.auth_header)
 
-        return DatasetDiff(data)
\ No newline at end of file
+        return self._build(DatasetDiff, data)
\ No newline at end of file
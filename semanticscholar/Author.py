@@ -7,6 +7,8 @@ class Author(SemanticScholarObject):
     This class abstracts an author.
     '''
 
+    __slots__ = ('_papers',)
+
     FIELDS = [
         'affiliations',
         'authorId',
@@ -44,16 +46,7 @@ class Author(SemanticScholarObject):
 
     def __init__(self, data) -> None:
         super().__init__()
-        self._affiliations = None
-        self._authorId = None
-        self._citationCount = None
-        self._externalIds = None
-        self._hIndex = None
-        self._homepage = None
-        self._name = None
-        self._paperCount = None
         self._papers = None
-        self._url = None
         self._init_attributes(data)
 
     @property
@@ -61,56 +54,56 @@ class Author(SemanticScholarObject):
         '''
         :type: :class:`list`
         '''
-        return self._affiliations
+        return self._data.get('affiliations')
 
     @property
     def authorId(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._authorId
+        return self._data.get('authorId')
 
     @property
     def citationCount(self) -> int:
         '''
         :type: :class:`int`
         '''
-        return self._citationCount
+        return self._data.get('citationCount')
 
     @property
     def externalIds(self) -> dict:
         '''
         :type: :class:`dict`
         '''
-        return self._externalIds
+        return self._data.get('externalIds')
 
     @property
     def hIndex(self) -> int:
         '''
         :type: :class:`int`
         '''
-        return self._hIndex
+        return self._data.get('hIndex')
 
     @property
     def homepage(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._homepage
+        return self._data.get('homepage')
 
     @property
     def name(self) -> str:
         '''
         :type: :class:`int`
         '''
-        return self._name
+        return self._data.get('name')
 
     @property
     def paperCount(self) -> int:
         '''
         :type: :class:`int`
         '''
-        return self._paperCount
+        return self._data.get('paperCount')
 
     @property
     def papers(self) -> list:
@@ -124,30 +117,12 @@ class Author(SemanticScholarObject):
         '''
         :type: :class:`str`
         '''
-        return self._url
+        return self._data.get('url')
 
     def _init_attributes(self, data):
         self._data = data
-        if 'affiliations' in data:
-            self._affiliations = data['affiliations']
-        if 'authorId' in data:
-            self._authorId = data['authorId']
-        if 'citationCount' in data:
-            self._citationCount = data['citationCount']
-        if 'externalIds' in data:
-            self._externalIds = data['externalIds']
-        if 'hIndex' in data:
-            self._hIndex = data['hIndex']
-        if 'homepage' in data:
-            self._homepage = data['homepage']
-        if 'name' in data:
-            self._name = data['name']
-        if 'paperCount' in data:
-            self._paperCount = data['paperCount']
         if 'papers' in data:
             items = []
             for item in data['papers']:
                 items.append(semanticscholar.Paper.Paper(item))
             self._papers = items
-        if 'url' in data:
-            self._url = data['url']
@@ -6,11 +6,10 @@ class Autocomplete(SemanticScholarObject):
     This class abstracts an autocomplete suggestion.
     '''
 
+    __slots__ = ()
+
     def __init__(self, data: dict) -> None:
         super().__init__()
-        self._id = None
-        self._title = None
-        self._authors_year = None
         self._init_attributes(data)
 
     @property
@@ -18,30 +17,21 @@ class Autocomplete(SemanticScholarObject):
         '''
         :type: :class:`str`
         '''
-        return self._id
+        return self._data.get("id")
 
     @property
     def title(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._title
+        return self._data.get("title")
 
     @property
     def authors_year(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._authors_year
+        return self._data.get("authorsYear")
 
     def _init_attributes(self, data: dict) -> None:
         self._data = data
-
-        if "id" in data:
-            self._id = data["id"]
-
-        if "title" in data:
-            self._title = data["title"]
-
-        if "authorsYear" in data:
-            self._authors_year = data["authorsYear"]
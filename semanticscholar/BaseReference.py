@@ -7,6 +7,8 @@ class BaseReference(SemanticScholarObject):
     Base class for both Citation and Reference classes.
     '''
 
+    __slots__ = ('_paper',)
+
     FIELDS = [
         'contexts',
         'intents',
@@ -16,10 +18,6 @@ class BaseReference(SemanticScholarObject):
 
     def __init__(self, data: dict) -> None:
         super().__init__()
-        self._contexts = None
-        self._intents = None
-        self._contextsWithIntent = None
-        self._isInfluential = None
         self._paper = None
         self._init_attributes(data)
 
@@ -28,28 +26,28 @@ class BaseReference(SemanticScholarObject):
         '''
         :type: :class:`list`
         '''
-        return self._contexts
+        return self._data.get('contexts')
 
     @property
     def intents(self) -> list:
         '''
         :type: :class:`list`
         '''
-        return self._intents
+        return self._data.get('intents')
 
     @property
     def contextsWithIntent(self) -> list:
         '''
         :type: :class:`list`
         '''
-        return self._contextsWithIntent
+        return self._data.get('contextsWithIntent')
 
     @property
     def isInfluential(self) -> bool:
         '''
         :type: :class:`bool`
         '''
-        return self._isInfluential
+        return self._data.get('isInfluential')
 
     @property
     def paper(self) -> Paper:
@@ -60,11 +58,3 @@ class BaseReference(SemanticScholarObject):
 
     def _init_attributes(self, data: dict) -> None:
         self._data = data
-        if 'contexts' in data:
-            self._contexts = data['contexts']
-        if 'intents' in data:
-            self._intents = data['intents']
-        if 'contextsWithIntent' in data:
-            self._contextsWithIntent = data['contextsWithIntent']
-        if 'isInfluential' in data:
-            self._isInfluential = data['isInfluential']
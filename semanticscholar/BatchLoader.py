@@ -0,0 +1,136 @@
+import asyncio
+from typing import Awaitable, Callable, List, Tuple
+
+from semanticscholar.SemanticScholarException import SemanticScholarException
+
+
+class BatchLoader:
+    '''
+    Collects single item lookups made at about the same time and sends them
+    as one batch request, in the manner of a DataLoader.
+
+    The first lookup opens a batch that is sent after ``max_delay`` seconds,
+    or as soon as it holds ``max_batch_size`` distinct IDs. Lookups with
+    different fields go into separate batches. Each caller receives the
+    item for its own ID, or None if the API did not find it.
+    '''
+
+    def __init__(
+                self,
+                load_batch: Callable[
+                    [List[str], Tuple[str, ...]], Awaitable[List[dict]]],
+                max_batch_size: int,
+                max_delay: float = 0.005
+            ) -> None:
+        '''
+        :param load_batch: coroutine function called with a list of IDs and
+               a tuple of fields, returning one item or None per ID, in the
+               same order.
+        :param int max_batch_size: maximum number of IDs in a batch.
+        :param float max_delay: (optional) time in seconds to wait for more
+               lookups before sending a batch.
+        '''
+        if max_batch_size < 1:
+            raise ValueError(
+                'The max_batch_size parameter must be at least 1.')
+        if max_delay < 0:
+            raise ValueError('The max_delay parameter must not be negative.')
+        self._load_batch = load_batch
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._pending = {}
+        self._timers = {}
+        self._tasks = set()
+        self._loads = 0
+        self._batches = 0
+
+    @property
+    def max_batch_size(self) -> int:
+        '''
+        Maximum number of IDs in a batch.
+
+        :type: :class:`int`
+        '''
+        return self._max_batch_size
+
+    @property
+    def max_delay(self) -> float:
+        '''
+        Time in seconds to wait for more lookups before sending a batch.
+
+        :type: :class:`float`
+        '''
+        return self._max_delay
+
+    @property
+    def loads(self) -> int:
+        '''
+        Number of lookups received.
+
+        :type: :class:`int`
+        '''
+        return self._loads
+
+    @property
+    def batches(self) -> int:
+        '''
+        Number of batch requests sent.
+
+        :type: :class:`int`
+        '''
+        return self._batches
+
+    async def load(self, item_id: str, fields: Tuple[str, ...]) -> dict:
+        '''
+        Look up a single item as part of the next batch.
+
+        :param str item_id: ID of the item.
+        :param tuple fields: fields to be returned.
+        :returns: item data, or None if not found.
+        :rtype: :class:`dict`
+        '''
+        loop = asyncio.get_running_loop()
+        key = (loop, fields)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = {}
+            self._timers[key] = loop.call_later(
+                self._max_delay, self._flush, key)
+        future = loop.create_future()
+        batch.setdefault(item_id, []).append(future)
+        self._loads += 1
+        if len(batch) >= self._max_batch_size:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: tuple) -> None:
+        loop, fields = key
+        batch = self._pending.pop(key)
+        self._timers.pop(key).cancel()
+        self._batches += 1
+        task = loop.create_task(self._dispatch(fields, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, fields: Tuple[str, ...], batch: dict) -> None:
+        ids = list(batch)
+        try:
+            items = await self._load_batch(ids, fields)
+            if not isinstance(items, list) or len(items) != len(ids):
+                raise SemanticScholarException(
+                    'Unexpected response from batch endpoint.')
+        except asyncio.CancelledError:
+            for futures in batch.values():
+                for future in futures:
+                    future.cancel()
+            raise
+        except Exception as exception:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exception)
+            return
+        for item_id, item in zip(ids, items):
+            for future in batch[item_id]:
+                if not future.done():
+                    future.set_result(item)
@@ -7,6 +7,8 @@ class Citation(BaseReference):
     This class abstracts a citation.
     '''
 
+    __slots__ = ()
+
     def __init__(self, data: dict) -> None:
         super().__init__(data)
         if 'citingPaper' in data:
@@ -6,6 +6,8 @@ class Dataset(SemanticScholarObject):
     This class represents a particular dataset in a release version of the Semantic Scholar Datasets.
     '''
 
+    __slots__ = ()
+
     FIELDS = [
         'name',
         'description',
@@ -20,10 +22,6 @@ class Dataset(SemanticScholarObject):
         :param dict data: Dataset data from the API.
         '''
         super().__init__()
-        self._name = None
-        self._description = None
-        self._readme = None
-        self._files = None
         self._init_attributes(data)
 
     @property
@@ -33,7 +31,7 @@ class Dataset(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._name
+        return self._data.get('name')
 
     @property
     def description(self) -> str:
@@ -42,7 +40,7 @@ class Dataset(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._description
+        return self._data.get('description')
 
     @property
     def readme(self) -> str:
@@ -51,7 +49,7 @@ class Dataset(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._readme
+        return self._data.get('README')
 
     @property
     def files(self) -> list:
@@ -60,15 +58,7 @@ class Dataset(SemanticScholarObject):
 
         :type: :class:`list` of :class:`str`
         '''
-        return self._files
+        return self._data.get('files')
 
     def _init_attributes(self, data) -> None:
         self._data = data
-        if 'name' in data:
-            self._name = data['name']
-        if 'description' in data:
-            self._description = data['description']
-        if 'README' in data:
-            self._readme = data['README']
-        if 'files' in data:
-            self._files = data['files']
@@ -6,6 +6,8 @@ class IncrementalUpdate(SemanticScholarObject):
     This class represents a single diff between two sequential releases of a dataset.
     '''
 
+    __slots__ = ()
+
     FIELDS = [
         'from_release',
         'to_release',
@@ -20,10 +22,6 @@ class IncrementalUpdate(SemanticScholarObject):
         :param dict data: Dataset diff data from the API.
         '''
         super().__init__()
-        self._from_release = None
-        self._to_release = None
-        self._update_files = None
-        self._delete_files = None
         self._init_attributes(data)
 
     @property
@@ -33,7 +31,7 @@ class IncrementalUpdate(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._from_release
+        return self._data.get('from_release')
 
     @property
     def to_release(self) -> str:
@@ -42,7 +40,7 @@ class IncrementalUpdate(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._to_release
+        return self._data.get('to_release')
 
     @property
     def update_files(self) -> list:
@@ -51,7 +49,7 @@ class IncrementalUpdate(SemanticScholarObject):
 
         :type: :class:`list` of :class:`str`
         '''
-        return self._update_files
+        return self._data.get('update_files')
 
     @property
     def delete_files(self) -> list:
@@ -60,18 +58,10 @@ class IncrementalUpdate(SemanticScholarObject):
 
         :type: :class:`list` of :class:`str`
         '''
-        return self._delete_files
+        return self._data.get('delete_files')
 
     def _init_attributes(self, data) -> None:
         self._data = data
-        if 'from_release' in data:
-            self._from_release = data['from_release']
-        if 'to_release' in data:
-            self._to_release = data['to_release']
-        if 'update_files' in data:
-            self._update_files = data['update_files']
-        if 'delete_files' in data:
-            self._delete_files = data['delete_files']
 
 
 class DatasetDiff(SemanticScholarObject):
@@ -80,6 +70,8 @@ class DatasetDiff(SemanticScholarObject):
     including the dataset name, release information, and list of individual diffs.
     '''
 
+    __slots__ = ('_diffs',)
+
     FIELDS = [
         'dataset',
         'start_release',
@@ -94,9 +86,6 @@ class DatasetDiff(SemanticScholarObject):
         :param dict data: Dataset diffs data from the API.
         '''
         super().__init__()
-        self._dataset = None
-        self._start_release = None
-        self._end_release = None
         self._diffs = None
         self._init_attributes(data)
 
@@ -107,7 +96,7 @@ class DatasetDiff(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._dataset
+        return self._data.get('dataset')
 
     @property
     def start_release(self) -> str:
@@ -116,7 +105,7 @@ class DatasetDiff(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._start_release
+        return self._data.get('start_release')
 
     @property
     def end_release(self) -> str:
@@ -125,7 +114,7 @@ class DatasetDiff(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._end_release
+        return self._data.get('end_release')
 
     @property
     def diffs(self) -> list:
@@ -138,11 +127,5 @@ class DatasetDiff(SemanticScholarObject):
 
     def _init_attributes(self, data) -> None:
         self._data = data
-        if 'dataset' in data:
-            self._dataset = data['dataset']
-        if 'start_release' in data:
-            self._start_release = data['start_release']
-        if 'end_release' in data:
-            self._end_release = data['end_release']
         if 'diffs' in data:
             self._diffs = [IncrementalUpdate(diff) for diff in data['diffs']]
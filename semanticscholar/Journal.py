@@ -6,11 +6,10 @@ class Journal(SemanticScholarObject):
     This class represents the Journal where the paper was published.
     '''
 
+    __slots__ = ()
+
     def __init__(self, data) -> None:
         super().__init__()
-        self._name = None
-        self._pages = None
-        self._volume = None
         self._init_attributes(data)
 
     @property
@@ -18,27 +17,21 @@ class Journal(SemanticScholarObject):
         '''
         :type: :class:`str`
         '''
-        return self._name
+        return self._data.get('name')
 
     @property
     def pages(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._pages
+        return self._data.get('pages')
 
     @property
     def volume(self) -> int:
         '''
         :type: :class:`int`
         '''
-        return self._volume
+        return self._data.get('volume')
 
     def _init_attributes(self, data):
         self._data = data
-        if 'name' in data:
-            self._name = data['name']
-        if 'pages' in data:
-            self._pages = data['pages']
-        if 'volume' in data:
-            self._volume = data['volume']
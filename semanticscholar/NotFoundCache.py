@@ -0,0 +1,432 @@
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
+
+class NotFoundCache:
+    '''
+    Cache of the paper and author IDs the API reported as not found, so
+    that they are not requested again until they expire.
+
+    IDs are stored in Bloom filters, a few bytes per ID whatever its
+    length, so that tens of millions of them fit in memory. A Bloom
+    filter can't remove an ID: IDs are added to the newest of
+    ``generations`` generations, and every ``ttl / generations`` seconds
+    the oldest generation is dropped and a new one started. An ID thus
+    expires between ``ttl * (generations - 1) / generations`` and ``ttl``
+    seconds after being added.
+
+    Each generation is made of filters of ``capacity`` IDs, a new one being
+    started once the current one is full. A Bloom filter may answer that an
+    ID was added when it was not, with a probability of ``error_rate`` per
+    filter. Such an ID is reported as not found without being requested.
+    Filters filled past their capacity, e.g. by an older version merging
+    them, are ignored, so that their IDs are requested again.
+
+    With a ``path``, the filters are loaded from that file, and saved to it
+    by :meth:`save` or :meth:`close`, so that later runs don't request the
+    IDs again. Each save merges the filters with the ones the file holds,
+    so that processes sharing the file keep each other's IDs.
+    '''
+
+    def __init__(
+                self,
+                ttl: float = 24 * 60 * 60,
+                capacity: int = 1000000,
+                error_rate: float = 0.0001,
+                generations: int = 2,
+                path: str = None,
+                save_interval: float = 60.0
+            ) -> None:
+        '''
+        :param float ttl: (optional) time in seconds an ID is kept.
+        :param int capacity: (optional) number of IDs held by each filter.
+        :param float error_rate: (optional) probability that an ID not
+               added is taken as not found, per filter.
+        :param int generations: (optional) number of generations the TTL is
+               split into.
+        :param str path: (optional) path of a file where the filters are
+               saved, loaded if it exists.
+        :param float save_interval: (optional) time in seconds after which
+               :attr:`save_due` tells that the filters should be saved.
+        '''
+        if capacity < 1:
+            raise ValueError('The capacity parameter must be at least 1.')
+        if not 0 < error_rate < 1:
+            raise ValueError(
+                'The error_rate parameter must be between 0 and 1.')
+        if generations < 1:
+            raise ValueError(
+                'The generations parameter must be at least 1.')
+        self._ttl = ttl
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._generations = generations
+        # Optimal number of bits and of hash functions for the capacity
+        # and error rate.
+        self._bits = math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._hashes = max(1, round(self._bits / capacity * math.log(2)))
+        # Number of bits set past which a filter answers wrongly more than
+        # twice as often as expected.
+        self._max_ones = self._bits * min(1, 2 * error_rate) ** (
+            1 / self._hashes)
+        self._span = ttl / generations
+        self._generation = self._current_generation()
+        # Newest generation first, each a list of filters
+        # [bits, IDs added, bits set], the last one receiving new IDs.
+        self._filters = [[self._new_filter()] for _ in range(generations)]
+        self._hits = 0
+        self._path = path
+        self._save_interval = save_interval
+        self._saved = time.monotonic()
+        self._lock = threading.Lock()
+        # Held while saving, so that contains() and add_all() only wait
+        # for the filters to be copied.
+        self._save_lock = threading.Lock()
+        if path is not None:
+            saved = self._read()
+            if saved is not None:
+                self._merge(self._filters, self._generation, *saved)
+                self._generation = max(self._generation, saved[0])
+
+    @property
+    def ttl(self) -> float:
+        '''
+        Time in seconds an ID is kept.
+
+        :type: :class:`float`
+        '''
+        return self._ttl
+
+    @property
+    def capacity(self) -> int:
+        '''
+        Number of IDs held by each filter.
+
+        :type: :class:`int`
+        '''
+        return self._capacity
+
+    @property
+    def error_rate(self) -> float:
+        '''
+        Probability that an ID not added is taken as not found, per filter.
+
+        :type: :class:`float`
+        '''
+        return self._error_rate
+
+    @property
+    def generations(self) -> int:
+        '''
+        Number of generations the TTL is split into.
+
+        :type: :class:`int`
+        '''
+        return self._generations
+
+    @property
+    def path(self) -> Optional[str]:
+        '''
+        Path of the file where the filters are saved, or None.
+
+        :type: :class:`str`
+        '''
+        return self._path
+
+    @property
+    def save_due(self) -> bool:
+        '''
+        Whether the cache has a path and was last loaded or saved at least
+        ``save_interval`` seconds ago.
+
+        :type: :class:`bool`
+        '''
+        return self._path is not None and \
+            time.monotonic() - self._saved >= self._save_interval
+
+    @property
+    def hits(self) -> int:
+        '''
+        Number of lookups of IDs known to be missing.
+
+        :type: :class:`int`
+        '''
+        return self._hits
+
+    @property
+    def entries(self) -> int:
+        '''
+        Number of IDs added to the filters not expired yet, counting an ID
+        added several times once per addition. Estimated from the filters
+        for the IDs merged from a file.
+
+        :type: :class:`int`
+        '''
+        with self._lock:
+            self._rotate()
+            return sum(count for filters in self._filters
+                       for _, count, _ in filters)
+
+    @property
+    def size(self) -> int:
+        '''
+        Size in bytes of the filters.
+
+        :type: :class:`int`
+        '''
+        return sum(len(bloom) for filters in self._filters
+                   for bloom, _, _ in filters)
+
+    @property
+    def stats(self) -> dict:
+        '''
+        Hits, entries and size of the cache.
+
+        :type: :class:`dict`
+        '''
+        return {
+            'hits': self._hits,
+            'entries': self.entries,
+            'size': self.size
+        }
+
+    def add(self, kind: str, object_id: str) -> None:
+        '''
+        Records an ID as not found.
+
+        :param str kind: kind of object, e.g. "paper" or "author".
+        :param str object_id: ID reported as not found.
+        '''
+        self.add_all(kind, [object_id])
+
+    def add_all(self, kind: str, object_ids: Iterable[str]) -> None:
+        '''
+        Records IDs as not found.
+
+        :param str kind: kind of object, e.g. "paper" or "author".
+        :param object_ids: IDs reported as not found.
+        '''
+        with self._lock:
+            self._rotate()
+            filters = self._filters[0]
+            for object_id in object_ids:
+                current = filters[-1]
+                if current[1] >= self._capacity:
+                    current = self._new_filter()
+                    filters.append(current)
+                bloom = current[0]
+                for position in self._positions(kind, object_id):
+                    bit = 1 << (position & 7)
+                    if not bloom[position >> 3] & bit:
+                        bloom[position >> 3] |= bit
+                        current[2] += 1
+                current[1] += 1
+
+    def contains(self, kind: str, object_id: str) -> bool:
+        '''
+        Whether an ID is known to be missing.
+
+        :param str kind: kind of object, e.g. "paper" or "author".
+        :param str object_id: ID looked up.
+        :rtype: :class:`bool`
+        '''
+        positions = self._positions(kind, object_id)
+        with self._lock:
+            self._rotate()
+            for filters in self._filters:
+                for bloom, _, ones in filters:
+                    if ones <= self._max_ones and \
+                            all(bloom[position >> 3] & (1 << (position & 7))
+                                for position in positions):
+                        self._hits += 1
+                        return True
+        return False
+
+    def save(self) -> None:
+        '''
+        Saves the filters to ``path``, merged with the ones saved by other
+        processes since they were loaded. The file is read and written
+        without blocking the other methods, which an event loop should
+        still run on another thread, e.g. with :func:`asyncio.to_thread`.
+        '''
+        if self._path is None:
+            raise ValueError('The cache has no path to be saved to.')
+        with self._save_lock:
+            with self._lock:
+                self._rotate()
+                generation = self._generation
+                filters = [[[bytearray(bloom), count, ones]
+                            for bloom, count, ones in generation_filters]
+                           for generation_filters in self._filters]
+                self._saved = time.monotonic()
+            saved = self._read()
+            new = None
+            if saved is not None:
+                new = self._merge(filters, generation, *saved)
+                generation = max(generation, saved[0])
+            self._write(generation, filters)
+            if new is not None and any(new):
+                # The IDs saved by other processes.
+                with self._lock:
+                    self._merge(self._filters, self._generation,
+                                generation, new)
+                    self._generation = max(self._generation, generation)
+
+    def close(self) -> None:
+        '''
+        Saves the filters if the cache has a ``path``.
+        '''
+        if self._path is not None:
+            self.save()
+
+    def clear(self) -> None:
+        '''
+        Removes all IDs from the cache, and the file it is saved to.
+        '''
+        with self._save_lock, self._lock:
+            self._filters = [
+                [self._new_filter()] for _ in range(self._generations)]
+            if self._path is not None:
+                try:
+                    os.remove(self._path)
+                except FileNotFoundError:
+                    pass
+
+    def _header(self) -> dict:
+        # Filters can only be merged with filters of the same shape.
+        return {
+            'bits': self._bits,
+            'hashes': self._hashes,
+            'span': self._span,
+            'generations': self._generations
+        }
+
+    def _read(self) -> Optional[Tuple[int, List[list]]]:
+        # The generation and filters saved in the file, or None if it is
+        # missing or holds filters of another shape.
+        size = (self._bits + 7) // 8
+        try:
+            with open(self._path, 'rb') as file:
+                header = json.loads(file.readline())
+                shape = {key: header[key] for key in self._header()}
+                if shape != self._header():
+                    return None
+                filters = []
+                for counts in header['counts']:
+                    generation_filters = []
+                    for count in counts:
+                        bloom = bytearray(file.read(size))
+                        if len(bloom) != size:
+                            return None
+                        ones = int.from_bytes(bloom, 'little').bit_count()
+                        generation_filters.append([bloom, int(count), ones])
+                    filters.append(generation_filters)
+            generation = int(header['generation'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if len(filters) != self._generations:
+            return None
+        return generation, filters
+
+    def _write(self, generation: int, filters: List[list]) -> None:
+        header = {
+            **self._header(),
+            'generation': generation,
+            'counts': [[count for _, count, _ in generation_filters]
+                       for generation_filters in filters]
+        }
+        # Written to another file first, so that readers never see a
+        # partial file.
+        temporary = f'{self._path}.{os.getpid()}.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(json.dumps(header).encode() + b'\n')
+            for generation_filters in filters:
+                for bloom, _, _ in generation_filters:
+                    file.write(bloom)
+        os.replace(temporary, self._path)
+
+    def _merge(
+                self,
+                filters: List[list],
+                generation: int,
+                other_generation: int,
+                others: List[list]
+            ) -> List[list]:
+        '''
+        Merges the filters of another generation into filters of the given
+        generation, shifting them if the other one is newer, and returns
+        the other filters that held IDs not in them yet.
+        '''
+        if other_generation > generation:
+            self._shift(filters, other_generation - generation)
+            generation = other_generation
+        new = [[] for _ in range(self._generations)]
+        # Filter i of the others is filter i + shift of ours.
+        shift = generation - other_generation
+        for i, other_filters in enumerate(others):
+            if not 0 <= i + shift < self._generations:
+                continue
+            ours = filters[i + shift]
+            held = [int.from_bytes(bloom, 'little') for bloom, _, _ in ours]
+            for bloom, count, ones in other_filters:
+                bits = int.from_bytes(bloom, 'little')
+                if any(not bits & ~mine for mine in held):
+                    continue
+                new[i + shift].append([bloom, count, ones])
+                # Merged into the current filter if they fit together,
+                # added before it otherwise.
+                current = ours[-1]
+                merged = held[-1] | bits
+                merged_ones = merged.bit_count()
+                if self._estimate(merged_ones) <= self._capacity:
+                    current[0] = bytearray(
+                        merged.to_bytes(len(current[0]), 'little'))
+                    current[1] = max(current[1], count,
+                                     round(self._estimate(merged_ones)))
+                    current[2] = merged_ones
+                    held[-1] = merged
+                else:
+                    ours.insert(len(ours) - 1, [bytearray(bloom), count, ones])
+                    held.insert(len(held) - 1, bits)
+        return new
+
+    def _estimate(self, ones: int) -> float:
+        # Number of IDs added to a filter with this many bits set.
+        if ones >= self._bits:
+            return math.inf
+        return -self._bits / self._hashes * math.log(1 - ones / self._bits)
+
+    def _new_filter(self) -> list:
+        return [bytearray((self._bits + 7) // 8), 0, 0]
+
+    def _current_generation(self) -> int:
+        return int(time.time() // self._span)
+
+    def _rotate(self) -> None:
+        # Drop the generations that have ended since the last call.
+        generation = self._current_generation()
+        if generation > self._generation:
+            self._shift(self._filters, generation - self._generation)
+            self._generation = generation
+
+    def _shift(self, filters: List[list], ended: int) -> None:
+        ended = min(ended, self._generations)
+        filters[:] = [[self._new_filter()] for _ in range(ended)] + \
+            filters[:len(filters) - ended]
+
+    def _positions(self, kind: str, object_id: str) -> list:
+        # Double hashing: the positions are h1 + i * h2, from the two
+        # halves of one digest. Paper IDs such as DOIs are
+        # case-insensitive.
+        digest = hashlib.blake2b(
+            f'{kind}:{str(object_id).lower()}'.encode(),
+            digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self._bits for i in range(self._hashes)]
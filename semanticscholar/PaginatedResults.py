@@ -1,6 +1,10 @@
+import asyncio
+import json
+import os
+import time
 from typing import Any, Union, List
 
-from semanticscholar._utils import _run_async
+from semanticscholar._utils import _LazyList, _run_async
 from semanticscholar.ApiRequester import ApiRequester
 from semanticscholar.SemanticScholarException import NoMorePagesException
 
@@ -20,8 +24,45 @@ class PaginatedResults:
                 fields: str = None,
                 limit: int = None,
                 headers: dict = None,
-                max_results: int = 10000
+                max_results: int = 10000,
+                page_concurrency: int = 1,
+                read_ahead: int = 0,
+                stream: bool = False,
+                checkpoint: str = None,
+                checkpoint_interval: float = None,
+                lazy: bool = False,
+                raw: bool = False,
+                paper_cache: Any = None
             ) -> None:
+        '''
+        :param int page_concurrency: (optional) number of pages requested
+               at the same time while iterating over offset-based results.
+               Pages are still returned in order.
+        :param int read_ahead: (optional) number of pages fetched in the
+               background, ahead of the page being iterated over.
+        :param bool stream: (optional) keep only the current page in items,
+               dropping each page once the next one is fetched, so that
+               iterating over a large number of results uses constant memory.
+        :param str checkpoint: (optional) path of a file where the cursor
+               state is saved each time all the items of a page have been
+               iterated over.
+        :param float checkpoint_interval: (optional) also save the cursor
+               state within a page, once an item has been processed and at
+               least this many seconds have passed since the last save.
+        :param bool lazy: (optional) keep the raw data of each item and
+               build its object only when the item is first accessed.
+        :param bool raw: (optional) return the data of each item as a
+               :class:`dict` instead of building its object.
+        :param PaperCache paper_cache: (optional) cache where the papers of
+               each page are stored, when the items are papers.
+        '''
+
+        if page_concurrency < 1:
+            raise ValueError(
+                'The page_concurrency parameter must be at least 1.')
+        if read_ahead < 0:
+            raise ValueError(
+                'The read_ahead parameter must not be negative.')
 
         self._requester = requester
         self._data_type = data_type
@@ -31,14 +72,31 @@ class PaginatedResults:
         self._limit = limit
         self._headers = headers
         self._max_results = max_results
+        self._page_concurrency = page_concurrency
+        self._read_ahead = read_ahead
+        self._stream = stream
+        self._checkpoint = checkpoint
+        self._checkpoint_interval = checkpoint_interval
+        self._checkpointed = time.monotonic()
+        self._lazy = lazy
+        self._raw = raw
+        self._paper_cache = paper_cache
 
         self._data = []
         self._total = 0
         self._offset = 0 - self._limit
         self._next = 0
         self._parameters = ''
-        self._items = []
+        self._items = _LazyList(data_type, []) if lazy and not raw else []
         self._continuation_token = None
+        self._loop = None
+
+        # Number of items of the current page returned by the iteration,
+        # which can be requested again with the token used to get it.
+        self._page_token = None
+        self._page_size = 0
+        self._page_start = 0
+        self._position = 0
 
     @classmethod
     async def create(
@@ -51,10 +109,67 @@ class PaginatedResults:
             *args,
             **kwargs
         )
+        # Sync iteration sends the next requests to the same loop, which
+        # keeps using its connection pool if it runs in another thread.
+        obj._loop = asyncio.get_running_loop()
         await obj._async_get_next_page()
 
         return obj
 
+    @classmethod
+    async def from_state(
+                cls,
+                requester: ApiRequester,
+                data_type: Any,
+                state: dict,
+                headers: dict = None,
+                **kwargs
+            ):
+        '''
+        Resume iterating over results from a state returned by
+        :meth:`state`, starting with the item following the last one
+        returned when the state was taken.
+
+        :param requester: requester used to fetch the following pages.
+        :param data_type: class of the items.
+        :param dict state: cursor state.
+        :param dict headers: (optional) headers sent with each request.
+        :returns: the resumed results.
+        :rtype: :class:`semanticscholar.PaginatedResults.PaginatedResults`
+        '''
+
+        obj = cls(
+            requester,
+            data_type,
+            state['url'],
+            state['query'],
+            state['fields'],
+            state['limit'],
+            headers,
+            max_results=state['max_results'],
+            stream=state['stream'],
+            **kwargs
+        )
+        obj._loop = asyncio.get_running_loop()
+        obj._total = state['total']
+        if state['complete']:
+            obj._offset = 0
+            return obj
+
+        # Request the page holding the next item again, as the next page
+        # of the one before it.
+        obj._offset = state['offset'] - obj._limit
+        obj._next = state['offset']
+        obj._continuation_token = state['token']
+        await obj._async_get_next_page()
+
+        position = min(state['position'], obj._page_size)
+        obj._items = obj._items[position:]
+        obj._page_start = position
+        obj._position = position
+
+        return obj
+
     @property
     def total(self) -> int:
         '''
@@ -86,11 +201,70 @@ class PaginatedResults:
         '''
         return self._next
 
+    @property
+    def stream(self) -> bool:
+        '''
+        Whether only the current page of results is kept in memory.
+
+        :type: :class:`bool`
+        '''
+        return self._stream
+
+    @property
+    def lazy(self) -> bool:
+        '''
+        Whether item objects are built only when first accessed.
+
+        :type: :class:`bool`
+        '''
+        return self._lazy
+
+    @property
+    def raw(self) -> bool:
+        '''
+        Whether items are the data of each result as a :class:`dict`
+        instead of objects.
+
+        :type: :class:`bool`
+        '''
+        return self._raw
+
+    @property
+    def checkpoint(self) -> str:
+        '''
+        Path of the file where the cursor state is saved each time all the
+        items of a page have been iterated over, or None.
+
+        :type: :class:`str`
+        '''
+        return self._checkpoint
+
+    @checkpoint.setter
+    def checkpoint(self, checkpoint: str) -> None:
+        self._checkpoint = checkpoint
+
+    @property
+    def checkpoint_interval(self) -> float:
+        '''
+        Minimum time in seconds between two saves of the cursor state within
+        a page, or None to save it only once each page has been iterated
+        over.
+
+        :type: :class:`float`
+        '''
+        return self._checkpoint_interval
+
+    @checkpoint_interval.setter
+    def checkpoint_interval(self, checkpoint_interval: float) -> None:
+        self._checkpoint_interval = checkpoint_interval
+
     @property
     def items(self) -> list:
         '''
         Accumulated items across all fetched pages of results up to the
-        current page.
+        current page, or only the items of the current page in stream mode.
+        In lazy mode, each item object is built when first accessed.
+        In raw mode, items are the data of each result as a :class:`dict`.
 
         :type: :class:`list`
         '''
@@ -107,16 +281,119 @@ class PaginatedResults:
         return self._data
 
     def __iter__(self) -> Any:
-        yield from self._items
+        yield from self._iter_fetched_items()
+        if self._reads_ahead() and self._loop_in_other_thread():
+            # The background requests need a loop that outlives each call.
+            pages = self._async_read_ahead_pages()
+            try:
+                while True:
+                    try:
+                        items = _run_async(pages.__anext__(), self._loop)
+                    except StopAsyncIteration:
+                        return
+                    yield from self._iter_page(items)
+            finally:
+                _run_async(pages.aclose(), self._loop)
         while self._has_next_page():
-            yield from self._get_next_page()
+            if self._fetches_concurrently():
+                pages = _run_async(
+                    self._async_request_next_pages(), self._loop)
+                for page in pages:
+                    if not self._has_next_page():
+                        break
+                    self._build_params()
+                    yield from self._iter_page(self._update_params(page))
+            else:
+                yield from self._iter_page(self._get_next_page())
 
     async def __aiter__(self) -> Any:
-        for item in self._items:
+        for item in self._iter_fetched_items():
             yield item
+        if self._reads_ahead():
+            async for items in self._async_read_ahead_pages():
+                for item in self._iter_page(items):
+                    yield item
+            return
         while self._has_next_page():
-            for item in await self._async_get_next_page():
-                yield item
+            if self._fetches_concurrently():
+                pages = await self._async_request_next_pages()
+                for page in pages:
+                    if not self._has_next_page():
+                        break
+                    self._build_params()
+                    for item in self._iter_page(self._update_params(page)):
+                        yield item
+            else:
+                items = await self._async_get_next_page()
+                for item in self._iter_page(items):
+                    yield item
+
+    def _iter_fetched_items(self) -> Any:
+        # Items of the earlier pages come first unless streaming.
+        current = len(self._items) - (self._page_size - self._page_start)
+        yield from self._items[:current]
+        yield from self._iter_page(self._items[current:])
+
+    def _iter_page(self, items: list) -> Any:
+        for index, item in enumerate(items, self._page_start + 1):
+            # The previous item has been processed once the next one is
+            # requested.
+            if index > self._page_start + 1 and \
+                    self._checkpoint_interval is not None and \
+                    time.monotonic() - self._checkpointed >= \
+                    self._checkpoint_interval:
+                self._save_checkpoint()
+            self._position = index
+            yield item
+        # Only reached once the last item has been processed.
+        self._save_checkpoint()
+
+    def state(self) -> dict:
+        '''
+        Serializable state of the cursor, from which :meth:`from_state`
+        resumes with the item following the last one returned by the
+        iteration in progress.
+
+        :returns: cursor state.
+        :rtype: :class:`dict`
+        '''
+        if self._position < self._page_size:
+            offset = self._offset
+            token = self._page_token
+            position = self._position
+            complete = False
+        else:
+            offset = self._offset + self._limit
+            token = self._continuation_token
+            position = 0
+            complete = not self._has_next_page()
+        return {
+            'data_type': self._data_type.__name__,
+            'url': self._url,
+            'query': self._query,
+            'fields': list(self._fields),
+            'limit': self._limit,
+            'max_results': self._max_results,
+            'stream': self._stream,
+            'total': self._total,
+            'offset': offset,
+            'token': token,
+            'position': position,
+            'complete': complete
+        }
+
+    def _save_checkpoint(self) -> None:
+        if self._checkpoint is None:
+            return
+        # Replace the previous checkpoint at once, so that it is never
+        # left half written.
+        temporary = f'{self._checkpoint}.tmp'
+        with open(temporary, 'w') as file:
+            json.dump(self.state(), file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self._checkpoint)
+        self._checkpointed = time.monotonic()
 
     def __len__(self) -> int:
         return len(self._items)
@@ -125,19 +402,105 @@ class PaginatedResults:
         return self._items[key]
 
     def _has_next_page(self) -> bool:
-        has_token = self._continuation_token is not None
-        next_page_offset = self._offset + self._limit
-        has_more_results = next_page_offset == self._next or has_token
+        return self._cursor_has_next_page(
+            self._offset, self._next, self._continuation_token)
+
+    def _cursor_has_next_page(
+                self,
+                offset: int,
+                next_offset: int,
+                continuation_token: str
+            ) -> bool:
+        has_token = continuation_token is not None
+        next_page_offset = offset + self._limit
+        has_more_results = next_page_offset == next_offset or has_token
         is_under_limit = next_page_offset < (self._max_results - 1)
         return has_more_results and is_under_limit
 
-    async def _request_data(self) -> Union[dict, List[dict]]:
+    async def _request_data(
+                self,
+                parameters: str = None
+            ) -> Union[dict, List[dict]]:
         return await self._requester.get_data_async(
             self._url,
-            self._parameters,
+            parameters if parameters is not None else self._parameters,
             self._headers
         )
 
+    def _fetches_concurrently(self) -> bool:
+        # Pages of token-based results can only be requested one by one.
+        return self._page_concurrency > 1 and \
+            self._continuation_token is None
+
+    def _reads_ahead(self) -> bool:
+        return self._read_ahead > 0 and not self._fetches_concurrently()
+
+    def _loop_in_other_thread(self) -> bool:
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        return self._loop is not None and self._loop.is_running() and \
+            self._loop is not running_loop
+
+    async def _async_read_ahead_pages(self) -> Any:
+        '''
+        Yields the items of each following page. A background task requests
+        each page as soon as the previous one is received, keeping up to
+        read_ahead pages ready while the current one is consumed.
+        '''
+        queue = asyncio.Queue(self._read_ahead)
+        task = asyncio.ensure_future(self._read_ahead_into(queue))
+        try:
+            while True:
+                page = await queue.get()
+                if page is None:
+                    break
+                if isinstance(page, BaseException):
+                    raise page
+                self._build_params()
+                yield self._update_params(page)
+        finally:
+            task.cancel()
+
+    async def _read_ahead_into(self, queue: asyncio.Queue) -> None:
+        offset = self._offset
+        next_offset = self._next
+        continuation_token = self._continuation_token
+        try:
+            while self._cursor_has_next_page(
+                    offset, next_offset, continuation_token):
+                page = await self._request_data(self._page_parameters(
+                    offset + self._limit, continuation_token))
+                await queue.put(page)
+                if 'data' not in page:
+                    break
+                offset = page.get('offset', 0)
+                next_offset = page.get('next', 0)
+                continuation_token = page.get('token')
+        except Exception as exception:
+            await queue.put(exception)
+            return
+        await queue.put(None)
+
+    async def _async_request_next_pages(self) -> List[dict]:
+        '''
+        Requests the next page_concurrency offset windows at once. The
+        pages are then processed in order, as long as each one announces a
+        next page.
+        '''
+        offsets = []
+        offset = self._offset + self._limit
+        while len(offsets) < self._page_concurrency and \
+                offset < self._max_results - 1 and \
+                (not self._total or offset < self._total):
+            offsets.append(offset)
+            offset += self._limit
+
+        return await asyncio.gather(*(
+            self._request_data(self._page_parameters(offset))
+            for offset in offsets))
+
     async def _async_get_next_page(self) -> Union[dict, List[dict]]:
 
         if not self._has_next_page():
@@ -156,27 +519,42 @@ class PaginatedResults:
 
         self._build_params()
 
-        results = _run_async(self._request_data())
+        results = _run_async(self._request_data(), self._loop)
 
         return self._update_params(results)
 
     def _build_params(self) -> None:
 
-        self._parameters = f'query={self._query}' if self._query else ''
-
-        if self._continuation_token:
-            self._parameters += f'&token={self._continuation_token}'
-
-        fields = ','.join(self._fields)
-        self._parameters += f'&fields={fields}'
-
         offset = self._offset + self._limit
-        self._parameters += f'&offset={offset}'
+        self._parameters = self._page_parameters(
+            offset, self._continuation_token)
 
         total = offset + self._limit
         if total == 10000:
             self._limit -= 1
-        self._parameters += f'&limit={self._limit}'
+
+    def _page_parameters(
+                self,
+                offset: int,
+                continuation_token: str = None
+            ) -> str:
+
+        parameters = f'query={self._query}' if self._query else ''
+
+        if continuation_token:
+            parameters += f'&token={continuation_token}'
+
+        fields = ','.join(self._fields)
+        parameters += f'&fields={fields}'
+
+        parameters += f'&offset={offset}'
+
+        limit = self._limit
+        if offset + limit == 10000:
+            limit -= 1
+        parameters += f'&limit={limit}'
+
+        return parameters
 
     def _update_params(self, results: Union[dict, List[dict]]) -> list:
 
@@ -184,16 +562,32 @@ class PaginatedResults:
 
         if 'data' in results:
 
+            self._page_token = self._continuation_token
             self._data = results['data']
             self._total = results['total'] if 'total' in results else 0
             self._offset = results['offset'] if 'offset' in results else 0
             self._next = results['next'] if 'next' in results else 0
             self._continuation_token = results['token'] if 'token' in results else None
 
-            for item in results['data']:
-                result_items.append(self._data_type(item))
-
-            self._items += result_items
+            if self._paper_cache is not None:
+                self._paper_cache.put_all(results['data'], self._fields)
+
+            if self._raw:
+                result_items = results['data']
+            elif self._lazy:
+                result_items = _LazyList(self._data_type, results['data'])
+            else:
+                for item in results['data']:
+                    result_items.append(self._data_type(item))
+
+            self._page_size = len(result_items)
+            self._page_start = 0
+            self._position = 0
+
+            if self._stream:
+                self._items = result_items
+            else:
+                self._items += result_items
 
         return result_items
 
@@ -12,6 +12,11 @@ class Paper(SemanticScholarObject):
     This class abstracts a paper.
     '''
 
+    __slots__ = (
+        '_authors', '_citations', '_journal', '_publicationDate',
+        '_publicationVenue', '_references', '_tldr'
+    )
+
     FIELDS = [
         'abstract',
         'authors',
@@ -117,30 +122,13 @@ class Paper(SemanticScholarObject):
 
     def __init__(self, data) -> None:
         super().__init__()
-        self._abstract = None
         self._authors = None
-        self._citationCount = None
-        self._citationStyles = None
         self._citations = None
-        self._corpusId = None
-        self._embedding = None
-        self._externalIds = None
-        self._fieldsOfStudy = None
-        self._influentialCitationCount = None
-        self._isOpenAccess = None
         self._journal = None
-        self._openAccessPdf = None
-        self._paperId = None
         self._publicationDate = None
-        self._publicationTypes = None
         self._publicationVenue = None
-        self._referenceCount = None
         self._references = None
-        self._s2FieldsOfStudy = None
-        self._title = None
         self._tldr = None
-        self._venue = None
-        self._year = None
         self._init_attributes(data)
 
     @property
@@ -148,13 +136,17 @@ class Paper(SemanticScholarObject):
         '''
         :type: :class:`str`
         '''
-        return self._abstract
+        return self._data.get('abstract')
 
     @property
     def authors(self) -> list:
         '''
         :type: :class:`list`
         '''
+        if self._authors is None and 'authors' in self._data:
+            self._authors = [
+                semanticscholar.Author.Author(item)
+                for item in self._data['authors'] or []]
         return self._authors
 
     @property
@@ -162,20 +154,23 @@ class Paper(SemanticScholarObject):
         '''
         :type: :class:`int`
         '''
-        return self._citationCount
+        return self._data.get('citationCount')
 
     @property
     def citationStyles(self) -> dict:
         '''
         :type: :class:`dict`
         '''
-        return self._citationStyles
+        return self._data.get('citationStyles')
 
     @property
     def citations(self) -> list:
         '''
         :type: :class:`list`
         '''
+        if self._citations is None and 'citations' in self._data:
+            self._citations = [
+                Paper(item) for item in self._data['citations'] or []]
         return self._citations
 
     @property
@@ -183,48 +178,52 @@ class Paper(SemanticScholarObject):
         '''
         :type: :class:`str`
         '''
-        return self._corpusId
+        return self._data.get('corpusId')
 
     @property
     def embedding(self) -> dict:
         '''
         :type: :class:`dict`
         '''
-        return self._embedding
+        return self._data.get('embedding')
 
     @property
     def externalIds(self) -> dict:
         '''
         :type: :class:`dict`
         '''
-        return self._externalIds
+        return self._data.get('externalIds')
 
     @property
     def fieldsOfStudy(self) -> list:
         '''
         :type: :class:`list`
         '''
-        return self._fieldsOfStudy
+        return self._data.get('fieldsOfStudy')
 
     @property
     def influentialCitationCount(self) -> int:
         '''
         :type: :class:`int`
         '''
-        return self._influentialCitationCount
+        return self._data.get('influentialCitationCount')
 
     @property
     def isOpenAccess(self) -> bool:
         '''
         :type: :class:`bool`
         '''
-        return self._isOpenAccess
+        return self._data.get('isOpenAccess')
 
     @property
     def journal(self) -> semanticscholar.Journal.Journal:
         '''
         :type: :class:`semanticscholar.Journal.Journal`
         '''
+        if self._journal is None and \
+                self._data.get('journal') is not None:
+            self._journal = semanticscholar.Journal.Journal(
+                self._data['journal'])
         return self._journal
 
     @property
@@ -232,20 +231,24 @@ class Paper(SemanticScholarObject):
         '''
         :type: :class:`dict`
         '''
-        return self._openAccessPdf
+        return self._data.get('openAccessPdf')
 
     @property
     def paperId(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._paperId
+        return self._data.get('paperId')
 
     @property
     def publicationDate(self) -> datetime:
         '''
         :type: :class:`datetime`
         '''
+        if self._publicationDate is None and \
+                self._data.get('publicationDate') is not None:
+            self._publicationDate = datetime.strptime(
+                self._data['publicationDate'], '%Y-%m-%d')
         return self._publicationDate
 
     @property
@@ -253,7 +256,7 @@ class Paper(SemanticScholarObject):
         '''
         :type: :class:`list`
         '''
-        return self._publicationTypes
+        return self._data.get('publicationTypes')
 
     @property
     def publicationVenue(self) -> \
@@ -261,6 +264,10 @@ class Paper(SemanticScholarObject):
         '''
         :type: :class:`semanticscholar.PublicationVenue.PublicationVenue`
         '''
+        if self._publicationVenue is None and \
+                self._data.get('publicationVenue') is not None:
+            self._publicationVenue = semanticscholar.PublicationVenue.\
+                PublicationVenue(self._data['publicationVenue'])
         return self._publicationVenue
 
     @property
@@ -268,13 +275,16 @@ class Paper(SemanticScholarObject):
         '''
         :type: :class:`int`
         '''
-        return self._referenceCount
+        return self._data.get('referenceCount')
 
     @property
     def references(self) -> list:
         '''
         :type: :class:`list`
         '''
+        if self._references is None and 'references' in self._data:
+            self._references = [
+                Paper(item) for item in self._data['references'] or []]
         return self._references
 
     @property
@@ -282,20 +292,22 @@ class Paper(SemanticScholarObject):
         '''
         :type: :class:`list`
         '''
-        return self._s2FieldsOfStudy
+        return self._data.get('s2FieldsOfStudy')
 
     @property
     def title(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._title
+        return self._data.get('title')
 
     @property
     def tldr(self) -> semanticscholar.Tldr.Tldr:
         '''
         :type: :class:`semanticscholar.Tldr.Tldr`
         '''
+        if self._tldr is None and self._data.get('tldr') is not None:
+            self._tldr = semanticscholar.Tldr.Tldr(self._data['tldr'])
         return self._tldr
 
     @property
@@ -303,89 +315,23 @@ class Paper(SemanticScholarObject):
         '''
         :type: :class:`str`
         '''
-        return self._url
+        return self._data.get('url')
 
     @property
     def venue(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._venue
+        return self._data.get('venue')
 
     @property
     def year(self) -> int:
         '''
         :type: :class:`int`
         '''
-        return self._year
+        return self._data.get('year')
 
     def _init_attributes(self, data) -> None:
+        # Plain fields are read from the data by their property. Nested
+        # objects, lists of objects and dates are decoded on first access.
         self._data = data
-        if 'abstract' in data:
-            self._abstract = data['abstract']
-        if 'authors' in data:
-            items = []
-            if data['authors'] is not None:
-                for item in data['authors']:
-                    items.append(semanticscholar.Author.Author(item))
-            self._authors = items
-        if 'citationCount' in data:
-            self._citationCount = data['citationCount']
-        if 'citationStyles' in data:
-            self._citationStyles = data['citationStyles']
-        if 'citations' in data:
-            items = []
-            if data['citations'] is not None:
-                for item in data['citations']:
-                    items.append(Paper(item))
-            self._citations = items
-        if 'corpusId' in data:
-            self._corpusId = data['corpusId']
-        if 'embedding' in data:
-            self._embedding = data['embedding']
-        if 'externalIds' in data:
-            self._externalIds = data['externalIds']
-        if 'fieldsOfStudy' in data:
-            self._fieldsOfStudy = data['fieldsOfStudy']
-        if 'influentialCitationCount' in data:
-            self._influentialCitationCount = data['influentialCitationCount']
-        if 'isOpenAccess' in data:
-            self._isOpenAccess = data['isOpenAccess']
-        if 'journal' in data:
-            if data['journal'] is not None:
-                self._journal = semanticscholar.Journal.Journal(data['journal'])
-        if 'openAccessPdf' in data:
-            self._openAccessPdf = data['openAccessPdf']
-        if 'paperId' in data:
-            self._paperId = data['paperId']
-        if 'publicationDate' in data:
-            if data['publicationDate'] is not None:
-                self._publicationDate = datetime.strptime(
-                    data['publicationDate'], '%Y-%m-%d')
-        if 'publicationTypes' in data:
-            self._publicationTypes = data['publicationTypes']
-        if 'publicationVenue' in data:
-            if data['publicationVenue'] is not None:
-                self._publicationVenue = semanticscholar.PublicationVenue.\
-                    PublicationVenue(data['publicationVenue'])
-        if 'referenceCount' in data:
-            self._referenceCount = data['referenceCount']
-        if 'references' in data:
-            items = []
-            if data['references'] is not None:
-                for item in data['references']:
-                    items.append(Paper(item))
-            self._references = items
-        if 's2FieldsOfStudy' in data:
-            self._s2FieldsOfStudy = data['s2FieldsOfStudy']
-        if 'title' in data:
-            self._title = data['title']
-        if 'tldr' in data:
-            if data['tldr'] is not None:
-                self._tldr = semanticscholar.Tldr.Tldr(data['tldr'])
-        if 'url' in data:
-            self._url = data['url']
-        if 'venue' in data:
-            self._venue = data['venue']
-        if 'year' in data:
-            self._year = data['year']
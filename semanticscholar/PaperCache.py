@@ -0,0 +1,264 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+
+
+class PaperCache:
+    '''
+    In-memory cache of papers, stored once by paperId and found by any of
+    their IDs: paperId, CorpusId and every external ID with its prefix
+    (DOI, ARXIV, MAG, ACL, PMID, PMCID). A paper fetched by one ID then
+    answers lookups by all the others known from its ``externalIds`` and
+    ``corpusId`` fields. Bare external IDs, such as a MAG or PubMed number
+    without prefix, are ambiguous and never found.
+
+    Each paper is kept with the fields it was fetched with, and answers
+    lookups requesting any subset of these fields with the data of the
+    requested fields only. Storing a paper already cached adds its new
+    fields to the ones kept. A paper expires ``ttl`` seconds after the
+    oldest of its kept fields was stored. The least recently used papers
+    are evicted when the cache holds more than ``max_entries`` of them.
+    '''
+
+    # Prefixes of the paper IDs accepted by the API, by externalIds key.
+    ID_PREFIXES = {
+        'ArXiv': 'ARXIV',
+        'DOI': 'DOI',
+        'MAG': 'MAG',
+        'ACL': 'ACL',
+        'PubMed': 'PMID',
+        'PubMedCentral': 'PMCID',
+        'CorpusId': 'CorpusId'
+    }
+
+    def __init__(
+                self,
+                max_entries: int = 100000,
+                ttl: float = 60 * 60
+            ) -> None:
+        '''
+        :param int max_entries: (optional) maximum number of papers kept in
+               the cache.
+        :param float ttl: (optional) time in seconds a paper is kept.
+        '''
+        if max_entries < 1:
+            raise ValueError(
+                'The max_entries parameter must be at least 1.')
+        self._max_entries = max_entries
+        self._ttl = ttl
+        # paperId: (data, fields, expires, aliases)
+        self._entries = OrderedDict()
+        # Lowercase alias: paperId
+        self._aliases = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        '''
+        Maximum number of papers kept in the cache.
+
+        :type: :class:`int`
+        '''
+        return self._max_entries
+
+    @property
+    def ttl(self) -> float:
+        '''
+        Time in seconds a paper is kept.
+
+        :type: :class:`float`
+        '''
+        return self._ttl
+
+    @property
+    def hits(self) -> int:
+        '''
+        Number of lookups answered from the cache.
+
+        :type: :class:`int`
+        '''
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        '''
+        Number of lookups not answered from the cache.
+
+        :type: :class:`int`
+        '''
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        '''
+        Number of papers removed to stay within ``max_entries``.
+
+        :type: :class:`int`
+        '''
+        return self._evictions
+
+    @property
+    def stats(self) -> dict:
+        '''
+        Hits, misses, evictions and entries of the cache.
+
+        :type: :class:`dict`
+        '''
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'entries': len(self)
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def aliases(cls, data: dict, bare: bool = False) -> List[str]:
+        '''
+        All the IDs by which the API can look up a paper, as far as its
+        data tells.
+
+        :param dict data: paper data.
+        :param bool bare: (optional) also include each external ID without
+               its prefix. A bare ID may name a paper of another kind,
+               e.g. MAG 12345 and PubMed 12345.
+        :rtype: :class:`List` of :class:`str`
+        '''
+        aliases = []
+        if data.get('paperId'):
+            aliases.append(data['paperId'])
+        if data.get('corpusId') is not None:
+            aliases.append(f'CorpusId:{data["corpusId"]}')
+        prefixes = {key.lower(): prefix
+                    for key, prefix in cls.ID_PREFIXES.items()}
+        for key, value in (data.get('externalIds') or {}).items():
+            if bare:
+                aliases.append(f'{value}')
+            if key.lower() in prefixes:
+                aliases.append(f'{prefixes[key.lower()]}:{value}')
+        return aliases
+
+    def get(self, paper_id: str, fields: Iterable[str]) -> Optional[dict]:
+        '''
+        Returns a copy of the cached data of a paper restricted to the given
+        fields, or None if the paper was not fetched with all of them.
+
+        :param str paper_id: any ID of the paper.
+        :param fields: fields requested.
+        :rtype: :class:`dict`
+        '''
+        fields = frozenset(fields)
+        with self._lock:
+            entry = self._find(paper_id)
+            if entry is None or not fields <= entry[1]:
+                self._misses += 1
+                return None
+            self._hits += 1
+            keys = {self._key(field) for field in fields} | {'paperId'}
+            return copy.deepcopy(
+                {key: value for key, value in entry[0].items()
+                 if key in keys})
+
+    def put(self, data: dict, fields: Iterable[str]) -> None:
+        '''
+        Caches the data of a paper fetched with the given fields.
+
+        :param dict data: paper data.
+        :param fields: fields requested.
+        '''
+        self.put_all([data], fields)
+
+    def put_all(self, items: Iterable[dict], fields: Iterable[str]) -> None:
+        '''
+        Caches the data of papers fetched with the given fields, e.g. a
+        page of search results. Items without a paperId are ignored. The
+        fields of papers already cached are merged.
+
+        :param items: data of the papers.
+        :param fields: fields requested.
+        '''
+        fields = frozenset(fields)
+        keys = {self._key(field) for field in fields}
+        expires = time.time() + self._ttl
+        with self._lock:
+            for data in items:
+                if not data or not data.get('paperId'):
+                    continue
+                paper_id = data['paperId']
+                data = copy.deepcopy(data)
+                entry_fields, entry_expires = fields, expires
+                entry = self._find(paper_id)
+                if entry is not None:
+                    # Keep the fields of the cached data not replaced by the
+                    # new data, e.g. 'authors' when 'authors.url' is new.
+                    kept = frozenset(
+                        field for field in entry[1]
+                        if self._key(field) not in keys)
+                    if kept:
+                        data = {
+                            **{key: value for key, value in entry[0].items()
+                               if key not in keys},
+                            **data}
+                        entry_fields = kept | fields
+                        entry_expires = min(entry[2], expires)
+                self._delete(paper_id)
+                aliases = [alias.lower() for alias in self.aliases(data)]
+                self._entries[paper_id] = (
+                    data, entry_fields, entry_expires, aliases)
+                for alias in aliases:
+                    self._aliases[alias] = paper_id
+            while len(self._entries) > self._max_entries:
+                self._delete(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, paper_id: str) -> None:
+        '''
+        Removes a paper from the cache.
+
+        :param str paper_id: any ID of the paper.
+        '''
+        with self._lock:
+            paper_id = self._aliases.get(str(paper_id).lower())
+            if paper_id is not None:
+                self._delete(paper_id)
+
+    def clear(self) -> None:
+        '''
+        Removes all papers from the cache.
+        '''
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+
+    @staticmethod
+    def _key(field: str) -> str:
+        # Key of the paper data holding a field, e.g. 'authors' for
+        # 'authors.name'.
+        return field.split('.')[0]
+
+    def _find(self, paper_id: str) -> Optional[tuple]:
+        paper_id = self._aliases.get(str(paper_id).lower())
+        if paper_id is None:
+            return None
+        entry = self._entries[paper_id]
+        if entry[2] <= time.time():
+            self._delete(paper_id)
+            return None
+        self._entries.move_to_end(paper_id)
+        return entry
+
+    def _delete(self, paper_id: str) -> None:
+        entry = self._entries.pop(paper_id, None)
+        if entry is None:
+            return
+        for alias in entry[3]:
+            # Another paper may have claimed the alias since.
+            if self._aliases.get(alias) == paper_id:
+                del self._aliases[alias]
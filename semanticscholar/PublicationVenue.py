@@ -6,15 +6,10 @@ class PublicationVenue(SemanticScholarObject):
     This class abstracts a publication venue.
     '''
 
+    __slots__ = ()
+
     def __init__(self, data: dict) -> None:
         super().__init__()
-        self._alternate_names = None
-        self._alternate_urls = None
-        self._id = None
-        self._issn = None
-        self._name = None
-        self._type = None
-        self._url = None
         self._init_attributes(data)
 
     @property
@@ -22,63 +17,49 @@ class PublicationVenue(SemanticScholarObject):
         '''
         :type: :class:`list`
         '''
-        return self._alternate_names
+        return self._data.get('alternate_names')
 
     @property
     def alternate_urls(self) -> list:
         '''
         :type: :class:`list`
         '''
-        return self._alternate_urls
+        return self._data.get('alternate_urls')
 
     @property
     def id(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._id
+        return self._data.get('id')
 
     @property
     def issn(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._issn
+        return self._data.get('issn')
 
     @property
     def name(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._name
+        return self._data.get('name')
 
     @property
     def type(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._type
+        return self._data.get('type')
 
     @property
     def url(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._url
+        return self._data.get('url')
 
     def _init_attributes(self, data):
         self._data = data
-        if 'alternate_names' in data:
-            self._alternate_names = data['alternate_names']
-        if 'alternate_urls' in data:
-            self._alternate_urls = data['alternate_urls']
-        if 'id' in data:
-            self._id = data['id']
-        if 'issn' in data:
-            self._issn = data['issn']
-        if 'name' in data:
-            self._name = data['name']
-        if 'type' in data:
-            self._type = data['type']
-        if 'url' in data:
-            self._url = data['url']
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    '''
+    Token bucket that paces requests on the client side, so they stay under
+    the API rate limit instead of being rejected with HTTP 429.
+
+    Each request takes one token. Tokens are refilled at ``rate`` per
+    second, up to ``burst`` tokens. When the bucket is empty, requests wait
+    in arrival order until a token is available.
+    '''
+
+    PRESETS = {
+        # Unauthenticated requests share a global pool, so be conservative.
+        'unauthenticated': (1 / 3, 5),
+        # Default rate granted to API keys: 1 request per second.
+        'api_key': (1.0, 1),
+    }
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        '''
+        :param float rate: tokens added to the bucket per second, i.e. the
+               sustained number of requests per second.
+        :param int burst: (optional) bucket capacity, i.e. the number of
+               requests that can be sent at once after a quiet period.
+        '''
+        if rate <= 0:
+            raise ValueError('The rate parameter must be greater than 0.')
+        if burst < 1:
+            raise ValueError('The burst parameter must be at least 1.')
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._queue_depth = 0
+        self._wait_time = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_preset(cls, name: str) -> 'RateLimiter':
+        '''
+        Create a rate limiter from one of the :attr:`PRESETS`.
+
+        :param str name: either "unauthenticated" or "api_key".
+        :rtype: :class:`semanticscholar.RateLimiter.RateLimiter`
+        '''
+        if name not in cls.PRESETS:
+            raise ValueError(
+                f'Unknown rate limit preset "{name}". Must be one of: '
+                f'{", ".join(cls.PRESETS)}.')
+        rate, burst = cls.PRESETS[name]
+        return cls(rate, burst)
+
+    @property
+    def rate(self) -> float:
+        '''
+        Sustained requests per second.
+
+        :type: :class:`float`
+        '''
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        '''
+        Maximum number of tokens in the bucket.
+
+        :type: :class:`int`
+        '''
+        return self._burst
+
+    @property
+    def tokens(self) -> float:
+        '''
+        Tokens currently available. Negative values mean tokens already
+        reserved by waiting requests.
+
+        :type: :class:`float`
+        '''
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    @property
+    def queue_depth(self) -> int:
+        '''
+        Number of requests currently waiting for a token.
+
+        :type: :class:`int`
+        '''
+        return self._queue_depth
+
+    @property
+    def wait_time(self) -> float:
+        '''
+        Total time in seconds requests have spent waiting for a token.
+
+        :type: :class:`float`
+        '''
+        return self._wait_time
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        '''
+        Wait until a token is available and take it.
+        '''
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            delay = max(0.0, -self._tokens / self._rate)
+            if delay:
+                self._queue_depth += 1
+        if not delay:
+            return
+        start = time.monotonic()
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            with self._lock:
+                self._tokens += 1
+            raise
+        finally:
+            with self._lock:
+                self._queue_depth -= 1
+                self._wait_time += time.monotonic() - start
@@ -7,6 +7,8 @@ class Reference(BaseReference):
     This class abstracts a reference.
     '''
 
+    __slots__ = ()
+
     def __init__(self, data: dict) -> None:
         super().__init__(data)
         if 'citedPaper' in data:
@@ -6,6 +6,8 @@ class Release(SemanticScholarObject):
     This class represents a release version of the Semantic Scholar Datasets.
     '''
 
+    __slots__ = ('_datasets',)
+
     FIELDS = [
         'release_id',
         'readme',
@@ -19,8 +21,6 @@ class Release(SemanticScholarObject):
         :param dict data: Release data from the API.
         '''
         super().__init__()
-        self._release_id = None
-        self._readme = None
         self._datasets = None
         self._init_attributes(data)
 
@@ -31,7 +31,7 @@ class Release(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._release_id
+        return self._data.get('release_id')
 
     @property
     def readme(self) -> str:
@@ -40,7 +40,7 @@ class Release(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._readme
+        return self._data.get('README')
 
     @property
     def datasets(self) -> list:
@@ -53,9 +53,5 @@ class Release(SemanticScholarObject):
 
     def _init_attributes(self, data) -> None:
         self._data = data
-        if 'release_id' in data:
-            self._release_id = data['release_id']
-        if 'README' in data:
-            self._readme = data['README']
         if 'datasets' in data:
             self._datasets = [Dataset(dataset) for dataset in data['datasets']]
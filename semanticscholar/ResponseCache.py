@@ -0,0 +1,272 @@
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class ResponseCache:
+    '''
+    In-memory cache of API response bodies, evicting the least recently
+    used entries when it holds more than ``max_entries`` responses or more
+    than ``max_bytes`` bytes.
+
+    Responses are cached by request: method, URL, parameters in any order
+    and payload. Each entry expires after the TTL of its endpoint, the
+    first pattern of ``ttls`` found in the URL path, or ``default_ttl``.
+    Bodies are stored as received, so each hit is decoded into new objects
+    that callers can modify freely.
+    '''
+
+    TTLS = (
+        # Releases never change once published.
+        (r'/datasets/v1/release/(?!latest$)[^/]+$', 24 * 60 * 60),
+        # Download links are pre-signed URLs that expire.
+        (r'/datasets/v1/(release/[^/]+/dataset|diffs)/', 0),
+        (r'/datasets/v1/', 60 * 60),
+        # Search results change as papers are added and citations counted.
+        (r'/search|/autocomplete', 5 * 60),
+        (r'/recommendations/v1/', 5 * 60),
+    )
+
+    def __init__(
+                self,
+                max_entries: int = 1000,
+                max_bytes: int = 64 * 1024 * 1024,
+                default_ttl: float = 60 * 60,
+                ttls: Tuple[Tuple[str, float], ...] = TTLS
+            ) -> None:
+        '''
+        :param int max_entries: (optional) maximum number of responses
+               kept in the cache.
+        :param int max_bytes: (optional) maximum total size in bytes of the
+               response bodies kept in the cache.
+        :param float default_ttl: (optional) time in seconds a response is
+               kept when its endpoint matches none of the ``ttls``.
+        :param ttls: (optional) pairs of a regular expression searched in
+               the URL path and the time in seconds responses from matching
+               endpoints are kept. A TTL of 0 disables caching.
+        '''
+        if max_entries < 1:
+            raise ValueError(
+                'The max_entries parameter must be at least 1.')
+        if max_bytes < 1:
+            raise ValueError('The max_bytes parameter must be at least 1.')
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._default_ttl = default_ttl
+        self._ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls]
+        self._entries = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        '''
+        Maximum number of responses kept in the cache.
+
+        :type: :class:`int`
+        '''
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> int:
+        '''
+        Maximum total size in bytes of the response bodies kept in the
+        cache.
+
+        :type: :class:`int`
+        '''
+        return self._max_bytes
+
+    @property
+    def size(self) -> int:
+        '''
+        Total size in bytes of the response bodies in the cache.
+
+        :type: :class:`int`
+        '''
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        '''
+        Number of requests answered from the cache.
+
+        :type: :class:`int`
+        '''
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        '''
+        Number of requests not found in the cache, or found expired.
+
+        :type: :class:`int`
+        '''
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        '''
+        Number of responses removed to stay within the size limits.
+
+        :type: :class:`int`
+        '''
+        return self._evictions
+
+    @property
+    def stats(self) -> dict:
+        '''
+        Hits, misses, evictions, entries and size of the cache.
+
+        :type: :class:`dict`
+        '''
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'entries': len(self),
+            'size': self.size
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(
+                method: str,
+                url: str,
+                parameters: str,
+                payload: dict = None
+            ) -> str:
+        '''
+        Identifies a request regardless of the order of its parameters.
+        Headers are left out, so that API keys are never stored.
+
+        :param str method: HTTP method.
+        :param str url: absolute URL to API endpoint.
+        :param str parameters: the parameters added in the URL.
+        :param dict payload: (optional) data of POST requests.
+        :rtype: :class:`str`
+        '''
+        parameters = '&'.join(sorted(
+            param for param in parameters.split('&') if param))
+        key = f'{method} {url}?{parameters}'
+        if payload:
+            key += ' ' + json.dumps(payload, sort_keys=True)
+        return key
+
+    def ttl(self, url: str) -> float:
+        '''
+        Time in seconds responses from an endpoint are kept.
+
+        :param str url: absolute URL to API endpoint.
+        :rtype: :class:`float`
+        '''
+        path = url.split('://', 1)[-1].partition('/')[2]
+        for pattern, ttl in self._ttls:
+            if pattern.search('/' + path):
+                return ttl
+        return self._default_ttl
+
+    def get(self, key: str) -> Optional[bytes]:
+        '''
+        Returns the cached response body of a request, or None if it is
+        missing or expired.
+
+        :param str key: request key returned by :meth:`key`.
+        :rtype: :class:`bytes`
+        '''
+        with self._lock:
+            entry = self._load(key)
+            if entry is not None and entry[1] <= time.time():
+                self._delete(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry[0]
+
+    def set(self, key: str, url: str, content: bytes) -> None:
+        '''
+        Caches the response body of a request for the TTL of its endpoint.
+
+        :param str key: request key returned by :meth:`key`.
+        :param str url: absolute URL to API endpoint.
+        :param bytes content: response body.
+        '''
+        ttl = self.ttl(url)
+        if ttl <= 0 or len(content) > self._max_bytes:
+            return
+        with self._lock:
+            self._store(key, content, time.time() + ttl)
+
+    async def get_async(self, key: str) -> Optional[bytes]:
+        '''
+        Same as :meth:`get`, for callers running on an event loop.
+        Subclasses storing responses outside memory run the lookup off the
+        loop.
+
+        :param str key: request key returned by :meth:`key`.
+        :rtype: :class:`bytes`
+        '''
+        return self.get(key)
+
+    async def set_async(self, key: str, url: str, content: bytes) -> None:
+        '''
+        Same as :meth:`set`, for callers running on an event loop.
+        Subclasses storing responses outside memory write them off the
+        loop.
+
+        :param str key: request key returned by :meth:`key`.
+        :param str url: absolute URL to API endpoint.
+        :param bytes content: response body.
+        '''
+        self.set(key, url, content)
+
+    def invalidate(self, key: str) -> None:
+        '''
+        Removes the response of a request from the cache.
+
+        :param str key: request key returned by :meth:`key`.
+        '''
+        with self._lock:
+            self._delete(key)
+
+    def clear(self) -> None:
+        '''
+        Removes all responses from the cache.
+        '''
+        with self._lock:
+            self._clear()
+
+    def _load(self, key: str) -> Optional[Tuple[bytes, float]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, content: bytes, expires: float) -> None:
+        self._delete(key)
+        self._entries[key] = (content, expires)
+        self._size += len(content)
+        while len(self._entries) > self._max_entries or \
+                self._size > self._max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+            self._evictions += 1
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[0])
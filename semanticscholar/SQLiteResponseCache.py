@@ -0,0 +1,294 @@
+import asyncio
+import os
+import sqlite3
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from semanticscholar.ResponseCache import ResponseCache
+
+
+class SQLiteResponseCache(ResponseCache):
+    '''
+    Response cache stored in a SQLite database file, so that responses
+    are reused across runs and shared by all the processes of a host.
+
+    The database is opened in write-ahead logging (WAL) mode, where
+    readers don't block the writer. Other processes may read and write
+    the same file at the same time. Expired responses are removed when
+    read or when space is needed. The least recently used ones are
+    evicted once the cache holds more than ``max_entries`` responses or
+    more than ``max_bytes`` bytes of stored bodies. Bodies are compressed
+    with zlib unless ``compress`` is False.
+
+    Reads don't write to the database: the time a response was last used
+    is recorded at most once per ``access_interval`` seconds, and written
+    with the next response stored, or once ``MAX_PENDING_ACCESSES`` are
+    pending. Requests made on an event loop read and
+    write the database on a thread of the cache, so that waiting for
+    another process to release its lock doesn't block the loop.
+    '''
+
+    # Number of times of use kept in memory before they are written, when
+    # no response is stored in the meantime.
+    MAX_PENDING_ACCESSES = 1000
+
+    def __init__(
+                self,
+                path: str,
+                max_entries: int = 100000,
+                max_bytes: int = 1024 * 1024 * 1024,
+                default_ttl: float = 60 * 60,
+                ttls: Tuple[Tuple[str, float], ...] = ResponseCache.TTLS,
+                compress: bool = True,
+                timeout: float = 30.0,
+                access_interval: float = 60.0
+            ) -> None:
+        '''
+        :param str path: path of the database file, created if missing.
+        :param int max_entries: (optional) maximum number of responses
+               kept in the cache.
+        :param int max_bytes: (optional) maximum total size in bytes of the
+               stored response bodies, after compression.
+        :param float default_ttl: (optional) time in seconds a response is
+               kept when its endpoint matches none of the ``ttls``.
+        :param ttls: (optional) pairs of a regular expression searched in
+               the URL path and the time in seconds responses from matching
+               endpoints are kept. A TTL of 0 disables caching.
+        :param bool compress: (optional) compress stored bodies with zlib.
+        :param float timeout: (optional) time in seconds to wait for
+               another process to release its lock on the database.
+        :param float access_interval: (optional) time in seconds under
+               which a new use of a response is not recorded, for the least
+               recently used eviction.
+        '''
+        super().__init__(max_entries, max_bytes, default_ttl, ttls)
+        self._path = path
+        self._compress = compress
+        self._timeout = timeout
+        self._access_interval = access_interval
+        # Key: time of last use, not written yet.
+        self._accessed = {}
+        self._connection = None
+        self._executor = None
+        self._pid = None
+        with self._lock:
+            self._connect()
+
+    @property
+    def path(self) -> str:
+        '''
+        Path of the database file.
+
+        :type: :class:`str`
+        '''
+        return self._path
+
+    @property
+    def compress(self) -> bool:
+        '''
+        Whether stored bodies are compressed.
+
+        :type: :class:`bool`
+        '''
+        return self._compress
+
+    @property
+    def size(self) -> int:
+        '''
+        Total size in bytes of the stored response bodies.
+
+        :type: :class:`int`
+        '''
+        with self._lock:
+            return self._totals(self._connect())[1]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._totals(self._connect())[0]
+
+    async def get_async(self, key: str) -> Optional[bytes]:
+        return await self._run_in_executor(self.get, key)
+
+    async def set_async(self, key: str, url: str, content: bytes) -> None:
+        await self._run_in_executor(self.set, key, url, content)
+
+    def close(self) -> None:
+        '''
+        Write the pending times of use and close the connection to the
+        database.
+        '''
+        with self._lock:
+            if self._connection is not None:
+                if self._pid == os.getpid() and self._accessed:
+                    self._flush_accessed(self._connection)
+                self._connection.close()
+                self._connection = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    async def _run_in_executor(self, function, *args):
+        with self._lock:
+            self._connect()
+            if self._executor is None:
+                # A single thread, as the connection is used by one thread
+                # at a time anyway.
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix='semanticscholar-cache')
+            executor = self._executor
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, function, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        '''
+        Returns the connection to the database, opening it on first use and
+        again in a forked process, since connections and threads can't be
+        shared across processes.
+        '''
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+        # The thread of the parent process doesn't exist in a forked one.
+        self._executor = None
+        self._accessed = {}
+        connection = sqlite3.connect(
+            self._path, timeout=self._timeout, isolation_level=None,
+            check_same_thread=False)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, content BLOB NOT NULL, '
+                'compressed INTEGER NOT NULL, size INTEGER NOT NULL, '
+                'expires REAL NOT NULL, accessed REAL NOT NULL)')
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS responses_accessed '
+                'ON responses (accessed)')
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS responses_expires '
+                'ON responses (expires)')
+            # Running totals, kept by triggers so that all processes see
+            # them, instead of scanning the table on each insert.
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS totals ('
+                'id INTEGER PRIMARY KEY CHECK (id = 0), '
+                'entries INTEGER NOT NULL, size INTEGER NOT NULL)')
+            connection.execute(
+                'INSERT OR IGNORE INTO totals '
+                'SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM responses')
+            connection.execute(
+                'CREATE TRIGGER IF NOT EXISTS responses_insert '
+                'AFTER INSERT ON responses BEGIN '
+                'UPDATE totals SET entries = entries + 1, '
+                'size = size + NEW.size; END')
+            connection.execute(
+                'CREATE TRIGGER IF NOT EXISTS responses_delete '
+                'AFTER DELETE ON responses BEGIN '
+                'UPDATE totals SET entries = entries - 1, '
+                'size = size - OLD.size; END')
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        self._connection = connection
+        self._pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def _totals(connection: sqlite3.Connection) -> Tuple[int, int]:
+        return connection.execute(
+            'SELECT entries, size FROM totals').fetchone()
+
+    def _load(self, key: str) -> Optional[Tuple[bytes, float]]:
+        connection = self._connect()
+        row = connection.execute(
+            'SELECT content, compressed, expires, accessed FROM responses '
+            'WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        content, compressed, expires, accessed = row
+        now = time.time()
+        if expires > now and \
+                self._accessed.get(key, accessed) + self._access_interval \
+                <= now:
+            self._accessed[key] = now
+            if len(self._accessed) >= self.MAX_PENDING_ACCESSES:
+                self._flush_accessed(connection)
+        if compressed:
+            content = zlib.decompress(content)
+        return content, expires
+
+    def _store(self, key: str, content: bytes, expires: float) -> None:
+        compressed = False
+        if self._compress:
+            packed = zlib.compress(content)
+            if len(packed) < len(content):
+                content, compressed = packed, True
+        connection = self._connect()
+        # Insert and evict in one transaction, so that processes sharing
+        # the database never see it above its limits.
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            self._accessed.pop(key, None)
+            self._write_accessed(connection)
+            # Not INSERT OR REPLACE, whose deletion doesn't fire triggers.
+            connection.execute(
+                'DELETE FROM responses WHERE key = ?', (key,))
+            connection.execute(
+                'INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                (key, content, compressed, len(content), expires,
+                 time.time()))
+            self._evict(connection)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def _flush_accessed(self, connection: sqlite3.Connection) -> None:
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            self._write_accessed(connection)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def _write_accessed(self, connection: sqlite3.Connection) -> None:
+        connection.executemany(
+            'UPDATE responses SET accessed = ? WHERE key = ?',
+            [(accessed, key) for key, accessed in self._accessed.items()])
+        self._accessed = {}
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        count, size = self._totals(connection)
+        if count <= self._max_entries and size <= self._max_bytes:
+            return
+        connection.execute(
+            'DELETE FROM responses WHERE expires <= ?', (time.time(),))
+        count, size = self._totals(connection)
+        evicted = []
+        rows = connection.execute(
+            'SELECT key, size FROM responses ORDER BY accessed')
+        for key, row_size in rows:
+            if count <= self._max_entries and size <= self._max_bytes:
+                break
+            evicted.append((key,))
+            count -= 1
+            size -= row_size
+        rows.close()
+        connection.executemany(
+            'DELETE FROM responses WHERE key = ?', evicted)
+        self._evictions += len(evicted)
+
+    def _clear(self) -> None:
+        self._accessed = {}
+        self._connect().execute('DELETE FROM responses')
+
+    def _delete(self, key: str) -> None:
+        self._accessed.pop(key, None)
+        self._connect().execute(
+            'DELETE FROM responses WHERE key = ?', (key,))
@@ -1,13 +1,21 @@
-from typing import List, Literal, Tuple, Union
+import weakref
+from typing import Iterable, Iterator, List, Literal, Tuple, Union
 
-from semanticscholar._utils import _run_async
+from semanticscholar._utils import _EventLoopThread
 from semanticscholar.PaginatedResults import PaginatedResults
 from semanticscholar.AsyncSemanticScholar import AsyncSemanticScholar
 from semanticscholar.Author import Author
+from semanticscholar.BatchLoader import BatchLoader
 from semanticscholar.Dataset import Dataset
 from semanticscholar.DatasetDiff import DatasetDiff
+from semanticscholar.AdaptiveConcurrencyLimiter import \
+    AdaptiveConcurrencyLimiter
+from semanticscholar.NotFoundCache import NotFoundCache
 from semanticscholar.Paper import Paper
+from semanticscholar.PaperCache import PaperCache
+from semanticscholar.RateLimiter import RateLimiter
 from semanticscholar.Release import Release
+from semanticscholar.ResponseCache import ResponseCache
 from semanticscholar.Autocomplete import Autocomplete
 from semanticscholar.Snippet import Snippet
 
@@ -24,6 +32,26 @@ class SemanticScholar():
                 api_url: str = None,
                 debug: bool = False,
                 retry: bool = True,
+                max_connections: int = 100,
+                max_keepalive_connections: int = 20,
+                keepalive_expiry: float = 5.0,
+                http2: bool = False,
+                max_concurrent_streams: int = 100,
+                rate_limit: Union[float, str, RateLimiter] = None,
+                adaptive_concurrency: Union[
+                    bool, AdaptiveConcurrencyLimiter] = False,
+                coalesce_requests: bool = True,
+                max_concurrent_batches: int = 4,
+                batch_lookups: bool = False,
+                batch_delay: float = 0.005,
+                page_concurrency: int = 1,
+                read_ahead: int = 0,
+                lazy_items: bool = False,
+                json_decoder: str = None,
+                raw: bool = False,
+                cache: Union[bool, str, ResponseCache] = False,
+                paper_cache: Union[bool, PaperCache] = False,
+                not_found_cache: Union[bool, str, NotFoundCache] = False
             ) -> None:
         '''
         :param float timeout: (optional) an exception is raised
@@ -32,18 +60,119 @@ class SemanticScholar():
         :param str api_url: (optional) custom API url.
         :param bool debug: (optional) enable debug mode.
         :param bool retry: enable retry mode.
+        :param int max_connections: (optional) maximum number of concurrent
+               connections in the pool.
+        :param int max_keepalive_connections: (optional) maximum number of
+               idle connections kept alive in the pool.
+        :param float keepalive_expiry: (optional) time in seconds an idle
+               connection is kept alive before being closed.
+        :param bool http2: (optional) multiplex requests over HTTP/2
+               connections. Requires the ``h2`` package, installed with
+               ``pip install semanticscholar[http2]``.
+        :param int max_concurrent_streams: (optional) maximum number of
+               requests in flight on each HTTP/2 connection.
+        :param rate_limit: (optional) pace requests on the client side to
+               stay under the API rate limit. Either a number of requests
+               per second, the name of a preset ("unauthenticated" or
+               "api_key"), or a
+               :class:`semanticscholar.RateLimiter.RateLimiter` instance.
+        :param adaptive_concurrency: (optional) adapt the number of requests
+               in flight to the API responses, backing off on HTTP 429 and
+               5xx. Either True, to use the default settings, or a
+               :class:`semanticscholar.AdaptiveConcurrencyLimiter.\
+               AdaptiveConcurrencyLimiter` instance.
+        :param bool coalesce_requests: (optional) share a single HTTP call
+               between identical requests made at the same time.
+        :param int max_concurrent_batches: (optional) maximum number of
+               batch requests sent at the same time when a call to
+               :meth:`get_papers` or :meth:`get_authors` is split into
+               several batches.
+        :param bool batch_lookups: (optional) send :meth:`get_paper` and
+               :meth:`get_author` calls made at about the same time, e.g.
+               from several threads, as a single batch request.
+        :param float batch_delay: (optional) time in seconds to wait for
+               more lookups before sending a batch.
+        :param int page_concurrency: (optional) number of pages requested
+               at the same time when iterating over offset-based paginated
+               results.
+        :param int read_ahead: (optional) number of pages fetched in the
+               background while iterating over paginated results, ahead of
+               the page being consumed.
+        :param bool lazy_items: (optional) keep the raw data of paginated
+               results and build each item object only when the item is
+               first accessed.
+        :param str json_decoder: (optional) library decoding the response
+               bodies: "orjson", "msgspec" or "json". Defaults to the
+               fastest one installed.
+        :param bool raw: (optional) return the response data as
+               :class:`dict` objects, without building the API objects.
+        :param cache: (optional) answer identical requests from previous
+               responses. Either True, to keep them in memory with the
+               default settings, the path of a SQLite database file to
+               keep them on disk, shared across processes, or a
+               :class:`semanticscholar.ResponseCache.ResponseCache`
+               instance.
+        :param paper_cache: (optional) keep the papers returned by any
+               method, so that lookups by any of their IDs are answered
+               locally. Either True, to use the default settings, or a
+               :class:`semanticscholar.PaperCache.PaperCache` instance.
+        :param not_found_cache: (optional) remember the paper and author
+               IDs reported as not found, and don't request them again
+               until they expire. Either True, to use the default
+               settings, the path of a file where they are saved for later
+               runs, or a
+               :class:`semanticscholar.NotFoundCache.NotFoundCache`
+               instance.
         '''
         self._timeout = timeout
         self._retry = retry
+        # All calls run on one event loop, so they share connections.
+        self._loop_thread = _EventLoopThread()
+        weakref.finalize(self, self._loop_thread.stop)
         self._AsyncSemanticScholar = AsyncSemanticScholar(
             timeout=timeout,
             api_key=api_key,
             api_url=api_url,
             debug=debug,
-            retry=retry
+            retry=retry,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            max_concurrent_streams=max_concurrent_streams,
+            rate_limit=rate_limit,
+            adaptive_concurrency=adaptive_concurrency,
+            coalesce_requests=coalesce_requests,
+            max_concurrent_batches=max_concurrent_batches,
+            batch_lookups=batch_lookups,
+            batch_delay=batch_delay,
+            page_concurrency=page_concurrency,
+            read_ahead=read_ahead,
+            lazy_items=lazy_items,
+            json_decoder=json_decoder,
+            raw=raw,
+            cache=cache,
+            paper_cache=paper_cache,
+            not_found_cache=not_found_cache
         )
         self.debug = debug
 
+    def __enter__(self) -> 'SemanticScholar':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        '''
+        Close the underlying HTTP connection pool and the response cache if
+        it can be closed, save the not found cache if it has a path, and
+        stop the event loop thread running the requests. The pool and the thread are started again if the client
+        is used afterwards.
+        '''
+        self._loop_thread.run(self._AsyncSemanticScholar.aclose())
+        self._loop_thread.stop()
+
     @property
     def timeout(self) -> int:
         '''
@@ -98,6 +227,210 @@ class SemanticScholar():
         self._retry = retry
         self._AsyncSemanticScholar.retry = retry
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        '''
+        Client-side rate limiter, or None if requests are not paced. Exposes
+        the live state: available tokens, queue depth and time spent
+        waiting.
+
+        :type: :class:`semanticscholar.RateLimiter.RateLimiter`
+        '''
+        return self._AsyncSemanticScholar.rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, rate_limiter: RateLimiter) -> None:
+        '''
+        :param RateLimiter rate_limiter:
+        '''
+        self._AsyncSemanticScholar.rate_limiter = rate_limiter
+
+    @property
+    def concurrency_limiter(self) -> AdaptiveConcurrencyLimiter:
+        '''
+        Adaptive concurrency limiter shared by all requests of this client,
+        or None if disabled.
+
+        :type: :class:`semanticscholar.AdaptiveConcurrencyLimiter.\
+            AdaptiveConcurrencyLimiter`
+        '''
+        return self._AsyncSemanticScholar.concurrency_limiter
+
+    @concurrency_limiter.setter
+    def concurrency_limiter(
+                self,
+                concurrency_limiter: AdaptiveConcurrencyLimiter
+            ) -> None:
+        '''
+        :param AdaptiveConcurrencyLimiter concurrency_limiter:
+        '''
+        self._AsyncSemanticScholar.concurrency_limiter = concurrency_limiter
+
+    @property
+    def cache(self) -> ResponseCache:
+        '''
+        Response cache shared by all requests of this client, or None if
+        disabled.
+
+        :type: :class:`semanticscholar.ResponseCache.ResponseCache`
+        '''
+        return self._AsyncSemanticScholar.cache
+
+    @cache.setter
+    def cache(self, cache: ResponseCache) -> None:
+        '''
+        :param ResponseCache cache:
+        '''
+        self._AsyncSemanticScholar.cache = cache
+
+    @property
+    def paper_cache(self) -> PaperCache:
+        '''
+        Cache of the papers returned by this client, or None if disabled.
+
+        :type: :class:`semanticscholar.PaperCache.PaperCache`
+        '''
+        return self._AsyncSemanticScholar.paper_cache
+
+    @paper_cache.setter
+    def paper_cache(self, paper_cache: PaperCache) -> None:
+        '''
+        :param PaperCache paper_cache:
+        '''
+        self._AsyncSemanticScholar.paper_cache = paper_cache
+
+    @property
+    def not_found_cache(self) -> NotFoundCache:
+        '''
+        Cache of the paper and author IDs reported as not found, or None if
+        disabled.
+
+        :type: :class:`semanticscholar.NotFoundCache.NotFoundCache`
+        '''
+        return self._AsyncSemanticScholar.not_found_cache
+
+    @not_found_cache.setter
+    def not_found_cache(self, not_found_cache: NotFoundCache) -> None:
+        '''
+        :param NotFoundCache not_found_cache:
+        '''
+        self._AsyncSemanticScholar.not_found_cache = not_found_cache
+
+    @property
+    def coalesced_calls(self) -> int:
+        '''
+        Number of HTTP calls saved by sharing the response of an identical
+        request already in flight.
+
+        :type: :class:`int`
+        '''
+        return self._AsyncSemanticScholar.coalesced_calls
+
+    @property
+    def max_concurrent_batches(self) -> int:
+        '''
+        Maximum number of batch requests sent at the same time.
+
+        :type: :class:`int`
+        '''
+        return self._AsyncSemanticScholar.max_concurrent_batches
+
+    @max_concurrent_batches.setter
+    def max_concurrent_batches(self, max_concurrent_batches: int) -> None:
+        '''
+        :param int max_concurrent_batches:
+        '''
+        self._AsyncSemanticScholar.max_concurrent_batches = \
+            max_concurrent_batches
+
+    @property
+    def page_concurrency(self) -> int:
+        '''
+        Number of pages requested at the same time when iterating over
+        offset-based paginated results.
+
+        :type: :class:`int`
+        '''
+        return self._AsyncSemanticScholar.page_concurrency
+
+    @page_concurrency.setter
+    def page_concurrency(self, page_concurrency: int) -> None:
+        '''
+        :param int page_concurrency:
+        '''
+        self._AsyncSemanticScholar.page_concurrency = page_concurrency
+
+    @property
+    def read_ahead(self) -> int:
+        '''
+        Number of pages fetched in the background while iterating over
+        paginated results.
+
+        :type: :class:`int`
+        '''
+        return self._AsyncSemanticScholar.read_ahead
+
+    @read_ahead.setter
+    def read_ahead(self, read_ahead: int) -> None:
+        '''
+        :param int read_ahead:
+        '''
+        self._AsyncSemanticScholar.read_ahead = read_ahead
+
+    @property
+    def lazy_items(self) -> bool:
+        '''
+        Whether paginated results build each item object only when the
+        item is first accessed.
+
+        :type: :class:`bool`
+        '''
+        return self._AsyncSemanticScholar.lazy_items
+
+    @lazy_items.setter
+    def lazy_items(self, lazy_items: bool) -> None:
+        '''
+        :param bool lazy_items:
+        '''
+        self._AsyncSemanticScholar.lazy_items = lazy_items
+
+    @property
+    def raw(self) -> bool:
+        '''
+        Whether methods return the response data as :class:`dict` objects
+        instead of API objects.
+
+        :type: :class:`bool`
+        '''
+        return self._AsyncSemanticScholar.raw
+
+    @raw.setter
+    def raw(self, raw: bool) -> None:
+        '''
+        :param bool raw:
+        '''
+        self._AsyncSemanticScholar.raw = raw
+
+    @property
+    def paper_loader(self) -> BatchLoader:
+        '''
+        Batches :meth:`get_paper` calls when ``batch_lookups`` is enabled,
+        None otherwise.
+
+        :type: :class:`semanticscholar.BatchLoader.BatchLoader`
+        '''
+        return self._AsyncSemanticScholar.paper_loader
+
+    @property
+    def author_loader(self) -> BatchLoader:
+        '''
+        Batches :meth:`get_author` calls when ``batch_lookups`` is enabled,
+        None otherwise.
+
+        :type: :class:`semanticscholar.BatchLoader.BatchLoader`
+        '''
+        return self._AsyncSemanticScholar.author_loader
+
     def get_paper(
                 self,
                 paper_id: str,
@@ -125,7 +458,7 @@ class SemanticScholar():
         :raises: ObjectNotFoundException: if Paper ID not found.
         '''
 
-        paper = _run_async(
+        paper = self._loop_thread.run(
             self._AsyncSemanticScholar.get_paper(
                 paper_id=paper_id,
                 fields=fields
@@ -147,8 +480,8 @@ class SemanticScholar():
             <https://api.semanticscholar.org/api-docs/graph#tag/Paper-Data\
             /operation/post_graph_get_papers>`_
 
-        :param str paper_ids: list of IDs (must be <= 500) - S2PaperId, 
-            CorpusId, DOI, ArXivId, MAG, ACL, PMID, PMCID, or URL from:
+        :param str paper_ids: list of IDs - S2PaperId, CorpusId, DOI,
+            ArXivId, MAG, ACL, PMID, PMCID, or URL from:
 
             - semanticscholar.org
             - arxiv.org
@@ -156,6 +489,9 @@ class SemanticScholar():
             - acm.org
             - biorxiv.org
 
+            Lists of more than 500 IDs are split into several batch
+            requests, sent concurrently.
+
         :param list fields: (optional) list of the fields to be returned.
         :param bool return_not_found: (optional) flag to include not found IDs 
                in the return, except for IDs in URL:<url> format.
@@ -167,7 +503,7 @@ class SemanticScholar():
         :raises: BadQueryParametersException: if no paper was found.
         '''
 
-        papers = _run_async(
+        papers = self._loop_thread.run(
             self._AsyncSemanticScholar.get_papers(
                 paper_ids=paper_ids,
                 fields=fields,
@@ -204,7 +540,7 @@ class SemanticScholar():
                (must be <= 1000).
         '''
 
-        results = _run_async(
+        results = self._loop_thread.run(
             self._AsyncSemanticScholar.get_paper_authors(
                 paper_id=paper_id,
                 fields=fields,
@@ -241,7 +577,7 @@ class SemanticScholar():
                (must be <= 1000).
         '''
 
-        results = _run_async(
+        results = self._loop_thread.run(
             self._AsyncSemanticScholar.get_paper_citations(
                 paper_id=paper_id,
                 fields=fields,
@@ -278,7 +614,7 @@ class SemanticScholar():
                (must be <= 1000).
         '''
 
-        results = _run_async(
+        results = self._loop_thread.run(
             self._AsyncSemanticScholar.get_paper_references(
                 paper_id=paper_id,
                 fields=fields,
@@ -302,7 +638,8 @@ class SemanticScholar():
                 limit: int = 100,
                 bulk: bool = False,
                 sort: str = None,
-                match_title: bool = False
+                match_title: bool = False,
+                stream: bool = False
             ) -> Union[PaginatedResults, Paper]:
         '''
         Search for papers by keyword. Performs a search query based on the 
@@ -347,12 +684,15 @@ class SemanticScholar():
                (ascending) or desc (descending).
         :param bool match_title: (optional) retrieve a single paper whose 
                title best matches the given query.
+        :param bool stream: (optional) keep only the current page of
+               results in memory while iterating, instead of accumulating
+               every page in items.
         :returns: query results.
         :rtype: :class:`semanticscholar.PaginatedResults.PaginatedResults` or 
             :class:`semanticscholar.Paper.Paper`
         '''
 
-        results = _run_async(
+        results = self._loop_thread.run(
             self._AsyncSemanticScholar.search_paper(
                 query=query,
                 year=year,
@@ -366,12 +706,78 @@ class SemanticScholar():
                 limit=limit,
                 bulk=bulk,
                 sort=sort,
-                match_title=match_title
+                match_title=match_title,
+                stream=stream
                 )
         )
 
         return results
 
+    def search_paper_partitioned(
+                self,
+                query: str,
+                partitions: int = 4,
+                publication_date_or_year: str = None,
+                year: str = None,
+                publication_types: list = None,
+                open_access_pdf: bool = None,
+                venue: list = None,
+                fields_of_study: list = None,
+                fields: list = None,
+                min_citation_count: int = None
+            ) -> Iterator[Paper]:
+        '''
+        Bulk search for papers, split into disjoint publication date or
+        year ranges that are iterated over concurrently. Ranges with more
+        results are split further, until there are as many ranges as
+        partitions. The papers of all ranges are yielded as soon as their
+        pages are received, in no particular order.
+
+        :calls: `GET /graph/v1/paper/search/bulk \
+            <https://api.semanticscholar.org/api-docs/graph#tag/Paper-Data\
+            /operation/get_graph_paper_bulk_search>`_
+
+        :param str query: plain-text search query string.
+        :param int partitions: (optional) maximum number of ranges iterated
+               over at the same time.
+        :param str publication_date_or_year: (optional) range of
+               publication date to split, in the format
+               <start_date>:<end_date>, where dates are in the format
+               YYYY-MM-DD, YYYY-MM, or YYYY. Either this or year is
+               required.
+        :param str year: (optional) range of years to split, in the format
+               <year>, <start_year>-<end_year>, <start_year>- or
+               -<end_year>. Either this or publication_date_or_year is
+               required.
+        :param list publication_types: (optional) restrict results to the
+               given publication type list.
+        :param bool open_access_pdf: (optional) restrict results to papers
+               with public PDFs.
+        :param list venue: (optional) restrict results to the given venue
+               list.
+        :param list fields_of_study: (optional) restrict results to given
+               field-of-study list, using the s2FieldsOfStudy paper field.
+        :param list fields: (optional) list of the fields to be returned.
+        :param int min_citation_count: (optional) restrict results to
+               papers with at least the given number of citations.
+        :returns: papers of all ranges.
+        :rtype: :class:`Iterator` of :class:`semanticscholar.Paper.Paper`
+        '''
+
+        # Pages cross over from the event loop thread one at a time.
+        pages = self._AsyncSemanticScholar._iter_partition_pages(
+            query, partitions, publication_date_or_year, year,
+            publication_types, open_access_pdf, venue, fields_of_study,
+            fields, min_citation_count)
+        try:
+            while True:
+                try:
+                    yield from self._loop_thread.run(pages.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._loop_thread.run(pages.aclose())
+
     def get_author(
                 self,
                 author_id: str,
@@ -390,7 +796,7 @@ class SemanticScholar():
         :raises: ObjectNotFoundException: if Author ID not found.
         '''
 
-        author = _run_async(
+        author = self._loop_thread.run(
             self._AsyncSemanticScholar.get_author(
                 author_id=author_id,
                 fields=fields
@@ -401,7 +807,7 @@ class SemanticScholar():
 
     def get_authors(
                 self,
-                author_ids: List[str],
+                author_ids: Iterable[str],
                 fields: list = None,
                 return_not_found: bool = False
             ) -> Union[List[Author], Tuple[List[Author], List[str]]]:
@@ -412,8 +818,14 @@ class SemanticScholar():
             <https://api.semanticscholar.org/api-docs/graph#tag/Author-Data\
             /operation/get_graph_get_author>`_
 
-        :param str author_ids: list of S2AuthorId (must be <= 1000).
-        :returns: author data, and optionally list of IDs not found.
+        :param str author_ids: list or any iterable of S2AuthorId. More than
+               1000 IDs are split into several batch requests, sent
+               concurrently.
+        :param list fields: (optional) list of the fields to be returned.
+        :param bool return_not_found: (optional) flag to include not found IDs 
+               in the return.
+        :returns: author data in the order of the input IDs, and optionally
+                  list of IDs not found.
         :rtype: :class:`List` of :class:`semanticscholar.Author.Author` 
                 or :class:`Tuple` [:class:`List` of 
                 :class:`semanticscholar.Author.Author`, 
@@ -421,7 +833,7 @@ class SemanticScholar():
         :raises: BadQueryParametersException: if no author was found.
         '''
 
-        authors = _run_async(
+        authors = self._loop_thread.run(
             self._AsyncSemanticScholar.get_authors(
                 author_ids=author_ids,
                 fields=fields,
@@ -431,6 +843,43 @@ class SemanticScholar():
 
         return authors
 
+    def iter_authors(
+                self,
+                author_ids: Iterable[str],
+                fields: list = None
+            ) -> Iterator[Tuple[List[Author], List[str]]]:
+        '''
+        Get details for any number of authors, one batch of up to 1000 IDs
+        at a time. Batches are fetched concurrently and each one is yielded
+        as soon as it is received, so only a few batches are held in memory.
+
+        :calls: `POST /graph/v1/author/batch \
+            <https://api.semanticscholar.org/api-docs/graph#tag/Author-Data\
+            /operation/get_graph_get_author>`_
+
+        :param str author_ids: list or any iterable of S2AuthorId, read as
+               batches are sent.
+        :param list fields: (optional) list of the fields to be returned.
+        :returns: for each batch, the authors found, in the order of the
+                  input IDs, and the IDs not found.
+        :rtype: :class:`Iterator` of :class:`Tuple` [:class:`List` of
+                :class:`semanticscholar.Author.Author`,
+                :class:`List` of :class:`str`]
+        '''
+
+        batches = self._AsyncSemanticScholar.iter_authors(
+            author_ids=author_ids,
+            fields=fields
+        )
+        try:
+            while True:
+                try:
+                    yield self._loop_thread.run(batches.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._loop_thread.run(batches.aclose())
+
     def get_author_papers(
                 self,
                 author_id: str,
@@ -458,7 +907,7 @@ class SemanticScholar():
                (must be <= 1000).
         '''
 
-        results = _run_async(
+        results = self._loop_thread.run(
             self._AsyncSemanticScholar.get_author_papers(
                 author_id=author_id,
                 fields=fields,
@@ -489,7 +938,7 @@ class SemanticScholar():
         :rtype: :class:`semanticscholar.PaginatedResults.PaginatedResults`
         '''
 
-        results = _run_async(
+        results = self._loop_thread.run(
             self._AsyncSemanticScholar.search_author(
                 query=query,
                 fields=fields,
@@ -499,6 +948,39 @@ class SemanticScholar():
 
         return results
 
+    def resume_results(
+                self,
+                state: dict,
+                checkpoint: str = None,
+                checkpoint_interval: float = None
+            ) -> PaginatedResults:
+        '''
+        Resume paginated results from a cursor state, such as one saved in
+        a checkpoint file, starting with the item following the last one
+        returned when the state was taken.
+
+        :param dict state: cursor state returned by
+               :meth:`semanticscholar.PaginatedResults.PaginatedResults.state`.
+        :param str checkpoint: (optional) path of a file where the cursor
+               state is saved each time all the items of a page have been
+               iterated over.
+        :param float checkpoint_interval: (optional) also save the cursor
+               state within a page, once an item has been processed and at
+               least this many seconds have passed since the last save.
+        :returns: resumed results.
+        :rtype: :class:`semanticscholar.PaginatedResults.PaginatedResults`
+        '''
+
+        results = self._loop_thread.run(
+            self._AsyncSemanticScholar.resume_results(
+                state=state,
+                checkpoint=checkpoint,
+                checkpoint_interval=checkpoint_interval
+                )
+        )
+
+        return results
+
     def get_recommended_papers(
                 self,
                 paper_id: str,
@@ -531,7 +1013,7 @@ class SemanticScholar():
         :rtype: :class:`List` of :class:`semanticscholar.Paper.Paper`
         '''
 
-        papers = _run_async(
+        papers = self._loop_thread.run(
             self._AsyncSemanticScholar.get_recommended_papers(
                 paper_id=paper_id,
                 fields=fields,
@@ -567,7 +1049,7 @@ class SemanticScholar():
         :rtype: :class:`List` of :class:`semanticscholar.Paper.Paper`
         '''
 
-        papers = _run_async(
+        papers = self._loop_thread.run(
             self._AsyncSemanticScholar.get_recommended_papers_from_lists(
                 positive_paper_ids=positive_paper_ids,
                 negative_paper_ids=negative_paper_ids,
@@ -592,7 +1074,7 @@ class SemanticScholar():
                 :class:`semanticscholar.Autocomplete.Autocomplete`
         """
         
-        results = _run_async(
+        results = self._loop_thread.run(
             self._AsyncSemanticScholar.get_autocomplete(query=query)
         )
 
@@ -645,7 +1127,7 @@ class SemanticScholar():
                 :class:`semanticscholar.Snippet.Snippet`
         '''
 
-        results = _run_async(
+        results = self._loop_thread.run(
             self._AsyncSemanticScholar.search_snippet(
                 query=query,
                 paper_ids=paper_ids,
@@ -674,7 +1156,7 @@ class SemanticScholar():
         :rtype: :class:`List` of :class:`str`
         """
         
-        releases = _run_async(
+        releases = self._loop_thread.run(
             self._AsyncSemanticScholar.get_available_releases()
         )
 
@@ -693,7 +1175,7 @@ class SemanticScholar():
         :rtype: :class:`semanticscholar.Release.Release`
         """
         
-        release = _run_async(
+        release = self._loop_thread.run(
             self._AsyncSemanticScholar.get_release(release_id=release_id)
         )
 
@@ -717,7 +1199,7 @@ class SemanticScholar():
         :rtype: :class:`semanticscholar.Dataset.Dataset`
         """
         
-        dataset = _run_async(
+        dataset = self._loop_thread.run(
             self._AsyncSemanticScholar.get_dataset_download_links(
                 release_id=release_id,
                 dataset_name=dataset_name
@@ -750,7 +1232,7 @@ class SemanticScholar():
         :rtype: :class:`semanticscholar.DatasetDiff.DatasetDiff`
         """
         
-        result = _run_async(
+        result = self._loop_thread.run(
             self._AsyncSemanticScholar.get_dataset_diffs(
                 dataset_name=dataset_name,
                 start_release_id=start_release_id,
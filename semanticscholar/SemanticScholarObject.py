@@ -6,6 +6,8 @@ class SemanticScholarObject:
     Base class for all API objects.
     '''
 
+    __slots__ = ('_data',)
+
     def __init__(self) -> None:
         self._data = None
 
@@ -6,12 +6,10 @@ class SnippetPaper(SemanticScholarObject):
     Basic paper data returned by the snippet search endpoint.
     '''
 
+    __slots__ = ()
+
     def __init__(self, data: dict) -> None:
         super().__init__()
-        self._corpus_id = None
-        self._title = None
-        self._authors = None
-        self._open_access_info = None
         self._init_attributes(data)
 
     @property
@@ -19,21 +17,21 @@ class SnippetPaper(SemanticScholarObject):
         '''
         :type: :class:`str`
         '''
-        return self._corpus_id
+        return self._data.get('corpusId')
 
     @property
     def title(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._title
+        return self._data.get('title')
 
     @property
     def authors(self) -> list:
         '''
         :type: :class:`list` of :class:`str`
         '''
-        return self._authors
+        return self._data.get('authors')
 
     @property
     def open_access_info(self) -> dict:
@@ -42,36 +40,21 @@ class SnippetPaper(SemanticScholarObject):
 
         :type: :class:`dict`
         '''
-        return self._open_access_info
+        return self._data.get('openAccessInfo')
 
     def _init_attributes(self, data: dict) -> None:
         self._data = data
 
-        if 'corpusId' in data:
-            self._corpus_id = data['corpusId']
-
-        if 'title' in data:
-            self._title = data['title']
-
-        if 'authors' in data:
-            self._authors = data['authors']
-
-        if 'openAccessInfo' in data:
-            self._open_access_info = data['openAccessInfo']
-
 
 class SnippetText(SemanticScholarObject):
     '''
     Text snippet data returned by the snippet search endpoint.
     '''
 
+    __slots__ = ()
+
     def __init__(self, data: dict) -> None:
         super().__init__()
-        self._text = None
-        self._snippet_kind = None
-        self._section = None
-        self._snippet_offset = None
-        self._annotations = None
         self._init_attributes(data)
 
     @property
@@ -81,7 +64,7 @@ class SnippetText(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._text
+        return self._data.get('text')
 
     @property
     def snippet_kind(self) -> str:
@@ -90,7 +73,7 @@ class SnippetText(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._snippet_kind
+        return self._data.get('snippetKind')
 
     @property
     def section(self) -> str:
@@ -100,7 +83,7 @@ class SnippetText(SemanticScholarObject):
 
         :type: :class:`str`
         '''
-        return self._section
+        return self._data.get('section')
 
     @property
     def snippet_offset(self) -> dict:
@@ -109,7 +92,7 @@ class SnippetText(SemanticScholarObject):
 
         :type: :class:`dict`
         '''
-        return self._snippet_offset
+        return self._data.get('snippetOffset')
 
     @property
     def annotations(self) -> dict:
@@ -118,35 +101,21 @@ class SnippetText(SemanticScholarObject):
 
         :type: :class:`dict`
         '''
-        return self._annotations
+        return self._data.get('annotations')
 
     def _init_attributes(self, data: dict) -> None:
         self._data = data
 
-        if 'text' in data:
-            self._text = data['text']
-
-        if 'snippetKind' in data:
-            self._snippet_kind = data['snippetKind']
-
-        if 'section' in data:
-            self._section = data['section']
-
-        if 'snippetOffset' in data:
-            self._snippet_offset = data['snippetOffset']
-
-        if 'annotations' in data:
-            self._annotations = data['annotations']
-
 
 class Snippet(SemanticScholarObject):
     '''
     This class abstracts a snippet search result.
     '''
 
+    __slots__ = ('_paper', '_snippet')
+
     def __init__(self, data: dict) -> None:
         super().__init__()
-        self._score = None
         self._paper = None
         self._snippet = None
         self._init_attributes(data)
@@ -158,7 +127,7 @@ class Snippet(SemanticScholarObject):
 
         :type: :class:`float`
         '''
-        return self._score
+        return self._data.get('score')
 
     @property
     def paper(self) -> SnippetPaper:
@@ -192,9 +161,6 @@ class Snippet(SemanticScholarObject):
     def _init_attributes(self, data: dict) -> None:
         self._data = data
 
-        if 'score' in data:
-            self._score = data['score']
-
         if 'paper' in data:
             self._paper = SnippetPaper(data['paper'])
 
@@ -7,10 +7,10 @@ class Tldr(SemanticScholarObject):
     SciTLDR model.
     '''
 
+    __slots__ = ()
+
     def __init__(self, data) -> None:
         super().__init__()
-        self._model = None
-        self._text = None
         self._init_attributes(data)
 
     @property
@@ -18,18 +18,14 @@ class Tldr(SemanticScholarObject):
         '''
         :type: :class:`str`
         '''
-        return self._model
+        return self._data.get('model')
 
     @property
     def text(self) -> str:
         '''
         :type: :class:`str`
         '''
-        return self._text
+        return self._data.get('text')
 
     def _init_attributes(self, data):
         self._data = data
-        if 'model' in data:
-            self._model = data['model']
-        if 'text' in data:
-            self._text = data['text']
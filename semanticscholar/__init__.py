@@ -2,3 +2,10 @@ from .SemanticScholar import SemanticScholar
 from .AsyncSemanticScholar import AsyncSemanticScholar
 from .Dataset import Dataset
 from .Release import Release
+from .RateLimiter import RateLimiter
+from .AdaptiveConcurrencyLimiter import AdaptiveConcurrencyLimiter
+from .BatchLoader import BatchLoader
+from .ResponseCache import ResponseCache
+from .SQLiteResponseCache import SQLiteResponseCache
+from .PaperCache import PaperCache
+from .NotFoundCache import NotFoundCache
@@ -1,14 +1,245 @@
 import asyncio
+import calendar
 import concurrent.futures
+import json
+import re
+import threading
+import time
+from collections.abc import Sequence
+from datetime import date
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
 
-def _run_async(coro):
+def _run_async(coro, loop: asyncio.AbstractEventLoop = None):
     """Run an async coroutine from synchronous code, even if an event
-    loop is already running (e.g. Jupyter notebooks)."""
+    loop is already running (e.g. Jupyter notebooks). If ``loop`` is
+    running in another thread, the coroutine is submitted to it."""
     try:
-        asyncio.get_running_loop()
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if loop is not None and loop.is_running() and loop is not running_loop:
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    if running_loop is not None:
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
             future = pool.submit(asyncio.run, coro)
             return future.result()
-    except RuntimeError:
-        return asyncio.run(coro)
+    return asyncio.run(coro)
+
+
+class _EventLoopThread:
+    """Long-lived event loop running on a daemon thread, so synchronous
+    calls share one loop, and therefore one connection pool, instead of
+    creating a new loop per call. Safe to use from several threads."""
+
+    def __init__(self) -> None:
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop, started on first access."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                started = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run_forever,
+                    args=(self._loop, started),
+                    name='semanticscholar-event-loop',
+                    daemon=True)
+                self._thread.start()
+                started.wait()
+            return self._loop
+
+    @staticmethod
+    def _run_forever(
+                loop: asyncio.AbstractEventLoop,
+                started: threading.Event
+            ) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        try:
+            loop.run_forever()
+        finally:
+            # Lets asynchronous generators clean up, e.g. close pooled HTTP
+            # clients.
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def run(self, coro):
+        """Run a coroutine on the loop and wait for its result."""
+        return _run_async(coro, self.loop)
+
+    @staticmethod
+    def _shutdown(loop: asyncio.AbstractEventLoop) -> None:
+        # Cancel pending calls, so threads waiting for them don't hang.
+        for task in asyncio.all_tasks(loop):
+            task.cancel()
+        loop.call_soon(loop.stop)
+
+    def stop(self) -> None:
+        """Stop the loop and wait for its thread to finish. The loop is
+        started again on the next call to :meth:`run`."""
+        with self._lock:
+            thread, loop = self._thread, self._loop
+            self._thread = self._loop = None
+        if thread is None:
+            return
+        loop.call_soon_threadsafe(self._shutdown, loop)
+        if thread is not threading.current_thread():
+            thread.join()
+
+
+class _LazyList(Sequence):
+    """List of raw items that builds the object for each item the first
+    time it is accessed, then keeps it."""
+
+    def __init__(self, build: Callable[[dict], Any], data: List[dict]) -> None:
+        self._build = build
+        self._data = list(data)
+        self._built = [None] * len(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index) -> Any:
+        if isinstance(index, slice):
+            items = _LazyList(self._build, self._data[index])
+            items._built = self._built[index]
+            return items
+        item = self._built[index]
+        if item is None:
+            item = self._built[index] = self._build(self._data[index])
+        return item
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self._data)):
+            yield self[index]
+
+    def __iadd__(self, other: '_LazyList') -> '_LazyList':
+        self._data += other._data
+        self._built += other._built
+        return self
+
+    def __repr__(self) -> str:
+        return list(self).__repr__()
+
+
+def _parse_retry_after(value: str) -> float:
+    """Convert a Retry-After header, either in seconds or as an HTTP date,
+    to a number of seconds from now."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return max(0.0, date.timestamp() - time.time())
+
+
+_JSON_DECODERS = ('orjson', 'msgspec', 'json')
+
+
+def _json_decoder(name: str = None) -> Tuple[str, Callable[[bytes], Any]]:
+    """Return the name of a JSON library and its function decoding a JSON
+    document from bytes. Without a name, the fastest installed library is
+    used: orjson, then msgspec, then the standard library."""
+    if name is not None and name not in _JSON_DECODERS:
+        raise ValueError(
+            f'Unknown JSON decoder {name!r}, expected one of '
+            f'{", ".join(_JSON_DECODERS)}.')
+    for candidate in (name,) if name else _JSON_DECODERS:
+        try:
+            if candidate == 'orjson':
+                import orjson
+                return candidate, orjson.loads
+            if candidate == 'msgspec':
+                import msgspec
+                return candidate, msgspec.json.Decoder().decode
+        except ImportError:
+            if name:
+                raise ImportError(
+                    f'The {name} JSON decoder requires the {name} package. '
+                    f'Install it with: pip install {name}') from None
+    return 'json', json.loads
+
+
+def _parse_year_range(year: str) -> Tuple[Optional[int], Optional[int]]:
+    """Convert a year filter (``2019``, ``2016-2020``, ``2010-`` or
+    ``-2015``) to inclusive bounds, None standing for an open end."""
+    match = re.fullmatch(r'(\d{4})?(-)?(\d{4})?', year)
+    if not match or not (match[1] or match[3]) or \
+            (match[3] and not match[2]):
+        raise ValueError(
+            'The year parameter must be in the format <year>, '
+            '<start_year>-<end_year>, <start_year>- or -<end_year>.')
+    start = int(match[1]) if match[1] else None
+    end = int(match[3]) if match[3] else None
+    return start, end if match[2] else start
+
+
+def _format_year_range(start: Optional[int], end: Optional[int]) -> str:
+    if start is not None and start == end:
+        return str(start)
+    return '{}-{}'.format(
+        '' if start is None else start, '' if end is None else end)
+
+
+def _parse_date_range(
+            publication_date_or_year: str
+        ) -> Tuple[Optional[int], Optional[int]]:
+    """Convert a publication date filter (``<start_date>:<end_date>``, with
+    dates in the format YYYY-MM-DD, YYYY-MM or YYYY) to inclusive bounds
+    as date ordinals, None standing for an open end."""
+    single_date_regex = r'(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?'
+    match = re.fullmatch(
+        r'({0})?(:({0})?)?'.format(single_date_regex),
+        publication_date_or_year)
+    if not match or not publication_date_or_year:
+        raise ValueError(
+            'The publication_date_or_year parameter must be in the format '
+            '<start_date>:<end_date>, where dates are in the format '
+            'YYYY-MM-DD, YYYY-MM, or YYYY.')
+    start = end = None
+    if match[1]:
+        year, month, day = match[2], match[3] or 1, match[4] or 1
+        start = date(int(year), int(month), int(day)).toordinal()
+    if match[6]:
+        year, month, day = int(match[7]), match[8], match[9]
+        month = int(month) if month else 12
+        day = int(day) if day else calendar.monthrange(year, month)[1]
+        end = date(year, month, day).toordinal()
+    elif not match[5] and match[1]:
+        # A single date covers all the days it stands for.
+        return start, _parse_date_range(f':{match[1]}')[1]
+    return start, end
+
+
+def _format_date_range(start: Optional[int], end: Optional[int]) -> str:
+    return '{}:{}'.format(
+        '' if start is None else date.fromordinal(start).isoformat(),
+        '' if end is None else date.fromordinal(end).isoformat())
+
+
+def _split_range(
+            start: Optional[int],
+            end: Optional[int],
+            default_start: int,
+            default_end: int
+        ) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """Split inclusive bounds in two halves, keeping open ends open. The
+    defaults stand for open ends when choosing the middle. Returns None if
+    the range cannot be split."""
+    low = start
+    if low is None:
+        low = default_start if end is None else min(default_start, end)
+    high = end if end is not None else max(default_end, low)
+    if high <= low:
+        return None
+    middle = (low + high) // 2
+    return (start, middle), (middle + 1, end)
@@ -21,6 +21,11 @@ setup(
     packages=['semanticscholar'],
     python_requires='>=3.10',
     install_requires=['tenacity', 'httpx'],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'orjson': ['orjson'],
+        'msgspec': ['msgspec'],
+    },
     test_suite='tests',
     tests_require=['vcrpy>=8.0'],
     classifiers=[
@@ -1,29 +1,49 @@
+import asyncio
+import concurrent.futures
+import gc
 import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
 import unittest
+import warnings
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
+from urllib.parse import parse_qs
 
 import httpx
 import vcr
 from httpx import TimeoutException
 
+from semanticscholar.AdaptiveConcurrencyLimiter import \
+    AdaptiveConcurrencyLimiter
+from semanticscholar.ApiRequester import _wait_for_retry
 from semanticscholar.AsyncSemanticScholar import AsyncSemanticScholar
 from semanticscholar.Author import Author
 from semanticscholar.Citation import Citation
 from semanticscholar.Dataset import Dataset
 from semanticscholar.DatasetDiff import DatasetDiff
 from semanticscholar.Journal import Journal
+from semanticscholar.NotFoundCache import NotFoundCache
 from semanticscholar.Paper import Paper
+from semanticscholar.PaperCache import PaperCache
 from semanticscholar.PublicationVenue import PublicationVenue
+from semanticscholar.RateLimiter import RateLimiter
 from semanticscholar.Reference import Reference
 from semanticscholar.Release import Release
+from semanticscholar.ResponseCache import ResponseCache
 from semanticscholar.SemanticScholar import SemanticScholar
+from semanticscholar.SQLiteResponseCache import SQLiteResponseCache
 from semanticscholar.SemanticScholarException import (
     BadQueryParametersException, GatewayTimeoutException,
     InternalServerErrorException, NoMorePagesException,
     ObjectNotFoundException, ServerErrorException)
 from semanticscholar.Snippet import Snippet
 from semanticscholar.Tldr import Tldr
+from semanticscholar._utils import _parse_retry_after
 
 test_vcr = vcr.VCR(
     cassette_library_dir='tests/data',
@@ -180,7 +200,32 @@ class SemanticScholarTest(unittest.TestCase):
         self.assertEqual(item.keys(), data.keys())
         file.close()
 
-    
+    def test_paper_lazy_decoding(self) -> None:
+        with open('tests/data/Paper.json', encoding='utf-8') as file:
+            data = json.loads(file.read())
+        with mock.patch.object(
+                Paper, '_init_attributes', autospec=True,
+                side_effect=Paper._init_attributes) as init_attributes:
+            item = Paper(data)
+            self.assertEqual(init_attributes.call_count, 1)
+            self.assertIs(item.citations, item.citations)
+            self.assertEqual(
+                init_attributes.call_count, 1 + len(data['citations']))
+        self.assertIs(item.authors[0], item.authors[0])
+        self.assertIs(item.journal, item.journal)
+        self.assertIs(item.publicationDate, item.publicationDate)
+        self.assertIs(item.tldr, item.tldr)
+
+    def test_paper_slots(self) -> None:
+        data = {'paperId': '0', 'title': 'Title'}
+        item = Paper(data)
+        self.assertFalse(hasattr(item, '__dict__'))
+        self.assertEqual(item.title, 'Title')
+        self.assertIsNone(item.url)
+        data['title'] = 'New title'
+        self.assertEqual(item.title, 'New title')
+
+
     def test_paper_with_null_values_for_lists(self) -> None:
         fields = ['authors', 'citations', 'references']
         for field in fields:
@@ -257,9 +302,30 @@ class SemanticScholarTest(unittest.TestCase):
                 self.assertIn(
                     'E. Duflo', [author.name for author in item.authors])
 
-    def test_get_papers_list_size_exceeded(self):
-        list_of_paper_ids = [str(i) for i in range(501)]
-        self.assertRaises(ValueError, self.sch.get_papers, list_of_paper_ids)
+    @staticmethod
+    async def _batch_response(method, url, json=None, **kwargs):
+        return httpx.Response(status_code=200, json=[
+            None if id.startswith('missing')
+            else {'paperId': id, 'authorId': id}
+            for id in json['ids']])
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_get_papers_chunked(self, mock_request):
+        mock_request.side_effect = self._batch_response
+        list_of_paper_ids = [
+            f'missing{i}' if i % 100 == 0 else str(i) for i in range(1201)]
+        papers, not_found = self.sch.get_papers(
+            list_of_paper_ids, return_not_found=True)
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(
+            [len(call.kwargs['json']['ids'])
+             for call in mock_request.call_args_list],
+            [500, 500, 201])
+        self.assertEqual(
+            [paper.paperId for paper in papers],
+            [id for id in list_of_paper_ids if not id.startswith('missing')])
+        self.assertEqual(
+            not_found, [f'missing{i}' for i in range(0, 1201, 100)])
 
     def test_get_papers_list_empty(self):
         list_of_paper_ids = []
@@ -355,9 +421,38 @@ class SemanticScholarTest(unittest.TestCase):
         self.assertCountEqual(
             [item.name for item in data], list_of_author_names)
 
-    def test_get_authors_list_size_exceeded(self):
-        list_of_author_ids = [str(i) for i in range(1001)]
-        self.assertRaises(ValueError, self.sch.get_authors, list_of_author_ids)
+    @mock.patch('httpx.AsyncClient.request')
+    def test_get_authors_chunked(self, mock_request):
+        mock_request.side_effect = self._batch_response
+        list_of_author_ids = [
+            f'missing{i}' if i % 300 == 0 else str(i) for i in range(2001)]
+        authors, not_found = self.sch.get_authors(
+            (id for id in list_of_author_ids), return_not_found=True)
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(
+            [author.authorId for author in authors],
+            [id for id in list_of_author_ids if not id.startswith('missing')])
+        self.assertEqual(
+            not_found, [f'missing{i}' for i in range(0, 2001, 300)])
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_iter_authors(self, mock_request):
+        mock_request.side_effect = self._batch_response
+        read = 0
+
+        def author_ids():
+            nonlocal read
+            for i in range(10000):
+                read += 1
+                yield 'missing' if i == 0 else str(i)
+
+        self.sch.max_concurrent_batches = 2
+        batches = self.sch.iter_authors(author_ids())
+        authors, not_found = next(batches)
+        self.assertLessEqual(read, 3000)
+        self.assertEqual(len(authors) + len(not_found), 1000)
+        batches.close()
+        self.assertLess(mock_request.call_count, 10)
 
     def test_get_authors_list_empty(self):
         list_of_author_ids = []
@@ -721,6 +816,99 @@ class SemanticScholarTest(unittest.TestCase):
             with self.assertRaises(ServerErrorException):
                 self.sch.get_paper('10.1093/mind/lix.236.433')
 
+    @mock.patch('httpx.AsyncClient.request')
+    def test_close(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            status_code=200, json={'title': 'title'})
+        with SemanticScholar(max_connections=5) as sch:
+            sch.get_paper('10.1093/mind/lix.236.433')
+            requester = sch._AsyncSemanticScholar._requester
+            self.assertEqual(requester.limits.max_connections, 5)
+        self.assertEqual(len(requester._clients), 0)
+        self.assertIsNone(sch._loop_thread._thread)
+
+    def test_asyncio_run_closes_clients(self):
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                body = b'{"title": "title"}'
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address
+        sch = AsyncSemanticScholar(api_url=f'http://{host}:{port}')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for _ in range(3):
+                paper = asyncio.run(sch.get_paper('CorpusId:1'))
+                self.assertEqual(paper.title, 'title')
+            gc.collect()
+        server.shutdown()
+        server.server_close()
+        self.assertEqual(len(sch._requester._clients), 0)
+        self.assertEqual(
+            [w for w in caught if issubclass(w.category, ResourceWarning)],
+            [])
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_json_decoder(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            status_code=200, json={'title': 'title'})
+        for json_decoder in ('json', None):
+            with self.subTest(json_decoder=json_decoder), \
+                    SemanticScholar(json_decoder=json_decoder) as sch:
+                paper = sch.get_paper('10.1093/mind/lix.236.433')
+                self.assertEqual(paper.title, 'title')
+                requester = sch._AsyncSemanticScholar._requester
+                self.assertIn(
+                    requester.json_decoder, ('orjson', 'msgspec', 'json'))
+        with self.assertRaises(ValueError):
+            SemanticScholar(json_decoder='simplejson')
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_event_loop_thread(self, mock_request):
+        threads = set()
+
+        async def respond(*args, **kwargs) -> httpx.Response:
+            threads.add(threading.current_thread().name)
+            return httpx.Response(status_code=200, json={'title': 'title'})
+
+        mock_request.side_effect = respond
+        self.sch.get_paper('10.1093/mind/lix.236.433')
+        clients = self.sch._AsyncSemanticScholar._requester._clients
+        client = clients[self.sch._loop_thread.loop][0]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            papers = list(pool.map(
+                self.sch.get_paper, [f'CorpusId:{i}' for i in range(16)]))
+        self.assertEqual([paper.title for paper in papers], ['title'] * 16)
+        self.assertIs(list(clients.values())[0][0], client)
+        self.assertEqual(len(clients), 1)
+        self.assertEqual(threads, {'semanticscholar-event-loop'})
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_paginated_results_use_event_loop_thread(self, mock_request):
+        threads = []
+
+        async def respond(*args, **kwargs) -> httpx.Response:
+            threads.append(threading.current_thread().name)
+            return httpx.Response(status_code=200, json={
+                'total': 4, 'token': 'next' if len(threads) == 1 else None,
+                'data': [{'title': 'title'}] * 2})
+
+        mock_request.side_effect = respond
+        results = self.sch.search_paper('turing', bulk=True)
+        self.assertEqual(len(list(results)), 4)
+        self.assertEqual(threads, ['semanticscholar-event-loop'] * 2)
+
     @test_vcr.use_cassette()
     def test_get_available_releases(self):
         releases =  self.sch.get_available_releases()
@@ -854,10 +1042,29 @@ class AsyncSemanticScholarTest(unittest.IsolatedAsyncioTestCase):
                 self.assertIn(
                     'E. Duflo', [author.name for author in item.authors])
 
-    async def test_get_papers_list_size_exceeded_async(self):
-        list_of_paper_ids = [str(i) for i in range(501)]
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_get_papers_chunked_async(self, mock_request):
+        in_flight = max_in_flight = 0
+
+        async def respond(method, url, json=None, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(status_code=200, json=[
+                {'paperId': id} for id in json['ids']])
+
+        mock_request.side_effect = respond
+        self.sch.max_concurrent_batches = 2
+        list_of_paper_ids = [str(i) for i in range(1201)]
+        papers = await self.sch.get_papers(list_of_paper_ids)
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(max_in_flight, 2)
+        self.assertEqual(
+            [paper.paperId for paper in papers], list_of_paper_ids)
         with self.assertRaises(ValueError):
-            await self.sch.get_papers(list_of_paper_ids)
+            self.sch.max_concurrent_batches = 0
 
     async def test_get_papers_list_empty_async(self):
         list_of_paper_ids = []
@@ -871,7 +1078,7 @@ class AsyncSemanticScholarTest(unittest.IsolatedAsyncioTestCase):
             'CorpusId:470667',
             '10.2139/ssrn.2250500',
             '0f40b1f08821e22e859c6050916cec3667778613']
-        with self.assertLogs(level='WARNING') as log:
+        with self.assertLogs('semanticscholar', level='WARNING') as log:
             await self.sch.get_papers(list_of_paper_ids)
             self.assertIn('IDs not found: [\'CorpusId:211530585\']', log.output[0])
 
@@ -942,10 +1149,19 @@ class AsyncSemanticScholarTest(unittest.IsolatedAsyncioTestCase):
         self.assertCountEqual(
             [item.name for item in data], list_of_author_names)
 
-    async def test_get_authors_list_size_exceeded_async(self):
-        list_of_author_ids = [str(i) for i in range(1001)]
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_iter_authors_async(self, mock_request):
+        mock_request.side_effect = SemanticScholarTest._batch_response
+        list_of_author_ids = ['missing'] + [str(i) for i in range(1, 2500)]
+        batches = [
+            batch async for batch in self.sch.iter_authors(list_of_author_ids)]
+        self.assertEqual(
+            sorted(len(authors) for authors, _ in batches), [500, 999, 1000])
+        self.assertEqual(
+            [not_found for _, not_found in batches if not_found],
+            [['missing']])
         with self.assertRaises(ValueError):
-            await self.sch.get_authors(list_of_author_ids)
+            await self.sch.iter_authors([]).__anext__()
 
     async def test_get_authors_list_empty_async(self):
         list_of_author_ids = []
@@ -955,7 +1171,7 @@ class AsyncSemanticScholarTest(unittest.IsolatedAsyncioTestCase):
     @use_shared_cassette
     async def test_get_authors_not_found_warning_async(self):
         list_of_author_ids = ['0', '3234559', '1726629', '1711844']
-        with self.assertLogs(level='WARNING') as log:
+        with self.assertLogs('semanticscholar', level='WARNING') as log:
             await self.sch.get_authors(list_of_author_ids, fields=['name'])
             self.assertIn('IDs not found: [\'0\']', log.output[0])
 
@@ -1305,6 +1521,503 @@ class AsyncSemanticScholarTest(unittest.IsolatedAsyncioTestCase):
                 await self.sch.get_paper('10.1093/mind/lix.236.433')
 
 
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_connection_pool_reused_async(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            status_code=200, json={'title': 'title'})
+        await self.sch.get_paper('10.1093/mind/lix.236.433')
+        client, _ = await self.sch._requester._get_client()
+        await self.sch.get_paper('10.1093/mind/lix.236.433')
+        self.assertIs((await self.sch._requester._get_client())[0], client)
+        await self.sch.aclose()
+        self.assertTrue(client.is_closed)
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_context_manager_async(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            status_code=200, json={'title': 'title'})
+        async with AsyncSemanticScholar(
+                max_connections=5, keepalive_expiry=1.0) as sch:
+            await sch.get_paper('10.1093/mind/lix.236.433')
+            client, _ = await sch._requester._get_client()
+            self.assertEqual(sch._requester.limits.max_connections, 5)
+            self.assertEqual(sch._requester.limits.keepalive_expiry, 1.0)
+        self.assertTrue(client.is_closed)
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_http2_async(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            status_code=200, json={'title': 'title'})
+        sch = AsyncSemanticScholar(http2=True, max_concurrent_streams=10)
+        await sch.get_paper('10.1093/mind/lix.236.433')
+        requester = sch._requester
+        self.assertTrue(requester.http2)
+        client, streams = await requester._get_client()
+        self.assertTrue(client._transport._pool._http2)
+        self.assertEqual(streams._value, 10)
+        await sch.aclose()
+
+    def test_http2_missing_dependency_async(self):
+        with mock.patch.dict('sys.modules', {'h2': None}):
+            with self.assertRaises(ImportError):
+                AsyncSemanticScholar(http2=True)
+
+    @staticmethod
+    def _offset_page_response(total: int, with_total: bool = False):
+        requests = []
+
+        async def respond(method, url, params=None, **kwargs):
+            query = parse_qs(params)
+            offset = int(query['offset'][0])
+            limit = int(query['limit'][0])
+            requests.append(offset)
+            await asyncio.sleep(0.01)
+            end = min(offset + limit, total)
+            page = {'offset': offset, 'data': [
+                {'citingPaper': {'paperId': str(i)}}
+                for i in range(offset, end)]}
+            if end < total:
+                page['next'] = end
+            if with_total:
+                page['total'] = total
+            return httpx.Response(status_code=200, json=page)
+
+        return respond, requests
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_page_concurrency_async(self, mock_request):
+        mock_request.side_effect, requests = self._offset_page_response(950)
+        sch = AsyncSemanticScholar(page_concurrency=4)
+        results = await sch.get_paper_citations('CorpusId:1', limit=100)
+        paper_ids = [item.paper.paperId async for item in results]
+        self.assertEqual(paper_ids, [str(i) for i in range(950)])
+        self.assertEqual(len(results), 950)
+        self.assertEqual(requests[:9], list(range(0, 900, 100)))
+        self.assertEqual(len(requests), 13)
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_page_concurrency_sync(self, mock_request):
+        mock_request.side_effect, requests = self._offset_page_response(
+            950, with_total=True)
+        sch = SemanticScholar(page_concurrency=4)
+        results = sch.get_paper_citations('CorpusId:1', limit=100)
+        paper_ids = [item.paper.paperId for item in results]
+        self.assertEqual(paper_ids, [str(i) for i in range(950)])
+        self.assertEqual(sorted(requests), list(range(0, 1000, 100)))
+        with self.assertRaises(ValueError):
+            sch.page_concurrency = 0
+
+    @staticmethod
+    def _token_page_response(pages: int):
+        requests = []
+
+        async def respond(method, url, params=None, **kwargs):
+            query = parse_qs(params)
+            page = int(query.get('token', ['0'])[0])
+            requests.append(page)
+            await asyncio.sleep(0.001)
+            data = {'total': pages * 2, 'data': [
+                {'paperId': f'{page}-{i}'} for i in range(2)]}
+            if page + 1 < pages:
+                data['token'] = str(page + 1)
+            return httpx.Response(status_code=200, json=data)
+
+        return respond, requests
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_read_ahead_async(self, mock_request):
+        mock_request.side_effect, requests = self._token_page_response(10)
+        sch = AsyncSemanticScholar(read_ahead=2)
+        results = await sch.search_paper('turing', bulk=True)
+        items = aiter(results)
+        for _ in range(3):
+            await anext(items)
+        await asyncio.sleep(0.05)
+        # Page 1 consumed, 2 pages queued and 1 waiting for room.
+        self.assertEqual(requests, [0, 1, 2, 3, 4])
+        paper_ids = [item.paperId async for item in items]
+        self.assertEqual(len(paper_ids), 17)
+        self.assertEqual(paper_ids[-1], '9-1')
+        self.assertEqual(len(results), 20)
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_read_ahead_sync(self, mock_request):
+        mock_request.side_effect, requests = self._token_page_response(5)
+        sch = SemanticScholar(read_ahead=1)
+        results = sch.search_paper('turing', bulk=True)
+        paper_ids = [item.paperId for item in results]
+        self.assertEqual(
+            paper_ids, [f'{page}-{i}' for page in range(5) for i in range(2)])
+        self.assertEqual(requests, [0, 1, 2, 3, 4])
+        with self.assertRaises(ValueError):
+            sch.read_ahead = -1
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_stream_async(self, mock_request):
+        mock_request.side_effect, _ = self._token_page_response(5)
+        sch = AsyncSemanticScholar()
+        results = await sch.search_paper('turing', bulk=True, stream=True)
+        self.assertTrue(results.stream)
+        paper_ids = []
+        async for item in results:
+            paper_ids.append(item.paperId)
+            self.assertLessEqual(len(results), 2)
+        self.assertEqual(
+            paper_ids, [f'{page}-{i}' for page in range(5) for i in range(2)])
+        self.assertEqual([item.paperId for item in results], ['4-0', '4-1'])
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_stream_sync(self, mock_request):
+        mock_request.side_effect, _ = self._token_page_response(5)
+        sch = SemanticScholar(read_ahead=1)
+        results = sch.search_paper('turing', bulk=True, stream=True)
+        paper_ids = []
+        for item in results:
+            paper_ids.append(item.paperId)
+            self.assertLessEqual(len(results), 2)
+        self.assertEqual(len(paper_ids), 10)
+        self.assertEqual(results.items[-1].paperId, '4-1')
+
+    @staticmethod
+    def _year_page_response():
+        requests = []
+
+        async def respond(method, url, params=None, **kwargs):
+            # Year 2000 + n has n + 1 papers, 2 papers per page.
+            query = parse_qs(params)
+            year = query['year'][0]
+            requests.append(year)
+            start, _, end = year.partition('-')
+            papers = [
+                {'paperId': f'{year}-{i}', 'year': year}
+                for year in range(int(start), int(end or start) + 1)
+                for i in range(year - 1999)]
+            offset = int(query.get('token', ['0'])[0])
+            data = {'total': len(papers), 'data': papers[offset:offset + 2]}
+            if offset + 2 < len(papers):
+                data['token'] = str(offset + 2)
+            return httpx.Response(status_code=200, json=data)
+
+        return respond, requests
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_search_paper_partitioned_async(self, mock_request):
+        mock_request.side_effect, requests = self._year_page_response()
+        sch = AsyncSemanticScholar()
+        papers = sch.search_paper_partitioned(
+            'turing', partitions=4, year='2000-2007')
+        paper_ids = [paper.paperId async for paper in papers]
+        self.assertEqual(len(paper_ids), 36)
+        self.assertEqual(
+            sorted(paper_ids),
+            sorted(f'{year}-{i}' for year in range(2000, 2008)
+                   for i in range(year - 1999)))
+        # The later years hold more papers and are split further.
+        self.assertEqual(
+            requests[:5],
+            ['2000-2007', '2000-2003', '2004-2007', '2004-2005', '2006-2007'])
+        with self.assertRaises(ValueError):
+            await anext(sch.search_paper_partitioned('turing'))
+        with self.assertRaises(ValueError):
+            await anext(sch.search_paper_partitioned(
+                'turing', year='2000', publication_date_or_year='2000'))
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_search_paper_partitioned_sync(self, mock_request):
+        mock_request.side_effect, requests = self._year_page_response()
+        sch = SemanticScholar()
+        papers = sch.search_paper_partitioned(
+            'turing', partitions=1, year='2003')
+        self.assertEqual(
+            [paper.paperId for paper in papers],
+            ['2003-0', '2003-1', '2003-2', '2003-3'])
+        self.assertEqual(requests, ['2003', '2003'])
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_lazy_items_async(self, mock_request):
+        mock_request.side_effect, _ = self._token_page_response(3)
+        sch = AsyncSemanticScholar(lazy_items=True)
+        with mock.patch.object(
+                Paper, '_init_attributes', autospec=True,
+                side_effect=Paper._init_attributes) as init_attributes:
+            results = await sch.search_paper('turing', bulk=True)
+            self.assertTrue(results.lazy)
+            self.assertEqual(init_attributes.call_count, 0)
+            self.assertEqual(results.raw_data[1]['paperId'], '0-1')
+            self.assertIs(results[1], results[1])
+            self.assertEqual(init_attributes.call_count, 1)
+            paper_ids = []
+            async for item in results:
+                paper_ids.append(item.paperId)
+                if item.paperId == '1-0':
+                    break
+            self.assertEqual(paper_ids, ['0-0', '0-1', '1-0'])
+            self.assertEqual(init_attributes.call_count, 3)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(
+            [item.paperId for item in results.items[1:]],
+            ['0-1', '1-0', '1-1'])
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_lazy_items_sync(self, mock_request):
+        mock_request.side_effect, _ = self._offset_page_response(250)
+        sch = SemanticScholar(lazy_items=True, page_concurrency=2)
+        results = sch.get_paper_citations('CorpusId:1', limit=100)
+        self.assertIsInstance(results[0], Citation)
+        paper_ids = [item.paper.paperId for item in results]
+        self.assertEqual(paper_ids, [str(i) for i in range(250)])
+        self.assertIs(results.items[-1], results[249])
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_raw_async(self, mock_request):
+        mock_request.side_effect, _ = self._token_page_response(3)
+        sch = AsyncSemanticScholar(raw=True, lazy_items=True)
+        results = await sch.search_paper('turing', bulk=True)
+        self.assertTrue(results.raw)
+        paper_ids = [item['paperId'] async for item in results]
+        self.assertEqual(paper_ids, ['0-0', '0-1', '1-0', '1-1', '2-0', '2-1'])
+        self.assertIs(results[0], results.items[0])
+        self.assertIsInstance(results[0], dict)
+
+        mock_request.side_effect = None
+        mock_request.return_value = httpx.Response(status_code=200, json=[
+            {'paperId': '0', 'externalIds': {'DOI': '10.0/0'}}, None])
+        papers, not_found = await sch.get_papers(
+            ['DOI:10.0/0', 'CorpusId:1'], return_not_found=True)
+        self.assertEqual(papers, [
+            {'paperId': '0', 'externalIds': {'DOI': '10.0/0'}}])
+        self.assertEqual(not_found, ['CorpusId:1'])
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_raw_sync(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            status_code=200, json={'paperId': '0', 'title': 'title'})
+        with SemanticScholar(raw=True) as sch:
+            paper = sch.get_paper('10.1093/mind/lix.236.433')
+            self.assertEqual(paper, {'paperId': '0', 'title': 'title'})
+            sch.raw = False
+            paper = sch.get_paper('10.1093/mind/lix.236.433')
+            self.assertIsInstance(paper, Paper)
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_resume_results_async(self, mock_request):
+        mock_request.side_effect, requests = self._token_page_response(5)
+        sch = AsyncSemanticScholar()
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, 'checkpoint.json')
+            results = await sch.search_paper(
+                'turing', bulk=True, stream=True)
+            results.checkpoint = checkpoint
+            async for item in results:
+                if item.paperId == '1-0':
+                    break
+            state = json.loads(json.dumps(results.state()))
+            with open(checkpoint) as file:
+                saved = json.load(file)
+        self.assertEqual(state['position'], 1)
+        self.assertEqual(saved['position'], 0)
+
+        resumed = await sch.resume_results(state)
+        self.assertTrue(resumed.stream)
+        paper_ids = [item.paperId async for item in resumed]
+        self.assertEqual(
+            paper_ids, ['1-1'] + [f'{page}-{i}'
+                                  for page in range(2, 5) for i in range(2)])
+        self.assertTrue(resumed.state()['complete'])
+
+        resumed = await sch.resume_results(saved)
+        paper_ids = [item.paperId async for item in resumed]
+        self.assertEqual(paper_ids[:2], ['1-0', '1-1'])
+        self.assertEqual(len(paper_ids), 8)
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_checkpoint_mid_page(self, mock_request):
+        mock_request.side_effect, requests = self._offset_page_response(250)
+        sch = SemanticScholar()
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, 'checkpoint.json')
+            results = sch.get_paper_citations('CorpusId:1', limit=100)
+            results.checkpoint = checkpoint
+            for item in results:
+                # Interrupted while processing an item.
+                if item.paper.paperId == '149':
+                    break
+            with open(checkpoint) as file:
+                saved = json.load(file)
+            # Only saved once each page has been iterated over by default.
+            self.assertEqual(saved['offset'], 100)
+            self.assertEqual(saved['position'], 0)
+            self.assertEqual(results.state()['position'], 50)
+
+            results = sch.get_paper_citations('CorpusId:1', limit=100)
+            results.checkpoint = checkpoint
+            results.checkpoint_interval = 0
+            for item in results:
+                if item.paper.paperId == '149':
+                    break
+            with open(checkpoint) as file:
+                saved = json.load(file)
+            self.assertEqual(saved['offset'], 100)
+            self.assertEqual(saved['position'], 49)
+
+            resumed = sch.resume_results(
+                saved, checkpoint=checkpoint, checkpoint_interval=0)
+            self.assertEqual(resumed.checkpoint_interval, 0)
+            paper_ids = []
+            for item in resumed:
+                paper_ids.append(item.paper.paperId)
+                if item.paper.paperId == '160':
+                    break
+            self.assertEqual(paper_ids, [str(i) for i in range(149, 161)])
+            with open(checkpoint) as file:
+                saved = json.load(file)
+            self.assertEqual(saved['position'], 60)
+
+            resumed = sch.resume_results(saved)
+            paper_ids = [item.paper.paperId for item in resumed]
+        self.assertEqual(paper_ids, [str(i) for i in range(160, 250)])
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_resume_results_sync(self, mock_request):
+        mock_request.side_effect, requests = self._offset_page_response(950)
+        sch = SemanticScholar(page_concurrency=4)
+        results = sch.get_paper_citations('CorpusId:1', limit=100)
+        for item in results:
+            if item.paper.paperId == '249':
+                break
+        resumed = sch.resume_results(results.state())
+        self.assertIsInstance(resumed[0], Citation)
+        paper_ids = [item.paper.paperId for item in resumed]
+        self.assertEqual(paper_ids, [str(i) for i in range(250, 950)])
+
+        state = resumed.state()
+        self.assertTrue(state['complete'])
+        count = len(requests)
+        self.assertEqual(len(sch.resume_results(state)), 0)
+        self.assertEqual(len(requests), count)
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_batch_lookups_async(self, mock_request):
+        mock_request.side_effect = SemanticScholarTest._batch_response
+        sch = AsyncSemanticScholar(batch_lookups=True)
+        paper_ids = [str(i) for i in range(1200)]
+        results = await asyncio.gather(
+            *(sch.get_paper(paper_id) for paper_id in paper_ids),
+            sch.get_paper('0', fields=['title']),
+            sch.get_paper('missing'),
+            return_exceptions=True)
+        self.assertEqual(
+            [paper.paperId for paper in results[:1201]], paper_ids + ['0'])
+        self.assertIsInstance(results[-1], ObjectNotFoundException)
+        self.assertEqual(
+            sorted(len(call.kwargs['json']['ids'])
+                   for call in mock_request.call_args_list),
+            [1, 201, 500, 500])
+        self.assertEqual(sch.paper_loader.batches, 4)
+        self.assertEqual(sch.paper_loader.loads, 1202)
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_batch_lookups_authors_async(self, mock_request):
+        mock_request.side_effect = SemanticScholarTest._batch_response
+        sch = AsyncSemanticScholar(batch_lookups=True, batch_delay=0.01)
+        author_ids = [str(i) for i in range(1500)]
+        authors = await asyncio.gather(
+            *(sch.get_author(author_id) for author_id in author_ids))
+        self.assertEqual(
+            [author.authorId for author in authors], author_ids)
+        self.assertEqual(
+            [len(call.kwargs['json']['ids'])
+             for call in mock_request.call_args_list], [1000, 500])
+        self.assertTrue(
+            mock_request.call_args.args[1].endswith('/author/batch'))
+        with self.assertRaises(ObjectNotFoundException):
+            await sch.get_author('missing')
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_batch_lookups_error_async(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            status_code=500, json={'message': 'message'})
+        sch = AsyncSemanticScholar(batch_lookups=True)
+        results = await asyncio.gather(
+            sch.get_paper('1'), sch.get_paper('2'), return_exceptions=True)
+        self.assertEqual(mock_request.call_count, 1)
+        for result in results:
+            self.assertIsInstance(result, ServerErrorException)
+        self.assertIsNone(self.sch.paper_loader)
+
+    @staticmethod
+    async def _slow_response(*args, **kwargs) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(status_code=200, json={'title': 'title'})
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_coalesce_requests_async(self, mock_request):
+        mock_request.side_effect = self._slow_response
+        paper_id = '10.1093/mind/lix.236.433'
+        papers = await asyncio.gather(
+            self.sch.get_paper(paper_id),
+            self.sch.get_paper(paper_id),
+            self.sch.get_paper(paper_id),
+            self.sch.get_paper(paper_id, fields=['title']))
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(self.sch.coalesced_calls, 2)
+        self.assertEqual(papers[0].raw_data, papers[1].raw_data)
+        self.assertIsNot(papers[0].raw_data, papers[1].raw_data)
+        self.assertEqual(self.sch._requester._in_flight, {})
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_coalesce_requests_isolated_async(self, mock_request):
+        mock_request.side_effect = self._slow_response
+        requester = self.sch._requester
+        url = f'{self.sch.api_url}/graph/v1/paper/CorpusId:1'
+
+        async def change():
+            data = await requester.get_data_async(url, 'fields=title', {})
+            data['title'] = 'MUTATED'
+            return data
+
+        def get():
+            return requester.get_data_async(url, 'fields=title', {})
+
+        # Whether the caller changing its result resumes first or last.
+        for calls in ((change, get), (get, change)):
+            results = await asyncio.gather(*(call() for call in calls))
+            self.assertEqual(
+                sorted(result['title'] for result in results),
+                ['MUTATED', 'title'])
+        self.assertEqual(mock_request.call_count, 2)
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_coalesce_requests_cancelled_async(self, mock_request):
+        mock_request.side_effect = self._slow_response
+        paper_id = '10.1093/mind/lix.236.433'
+        first = asyncio.create_task(self.sch.get_paper(paper_id))
+        second = asyncio.create_task(self.sch.get_paper(paper_id))
+        await asyncio.sleep(0)
+        first.cancel()
+        paper = await second
+        self.assertEqual(paper.title, 'title')
+        self.assertEqual(mock_request.call_count, 1)
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_coalesce_requests_disabled_async(self, mock_request):
+        mock_request.side_effect = self._slow_response
+        sch = AsyncSemanticScholar(coalesce_requests=False)
+        paper_id = '10.1093/mind/lix.236.433'
+        await asyncio.gather(
+            sch.get_paper(paper_id), sch.get_paper(paper_id))
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(sch.coalesced_calls, 0)
+
+    def test_request_key_normalized(self):
+        key = self.sch._requester._request_key
+        self.assertEqual(
+            key('url', 'fields=title&limit=10', {}),
+            key('url', '&limit=10&fields=title', {}))
+        self.assertNotEqual(
+            key('url', '', {}, {'ids': ['a', 'b']}),
+            key('url', '', {}, {'ids': ['b', 'a']}))
+
     @test_vcr.use_cassette()
     async def test_get_available_releases(self):
         releases =  await self.sch.get_available_releases()
@@ -1379,9 +2092,611 @@ class AsyncSemanticScholarTest(unittest.IsolatedAsyncioTestCase):
                          'Computing Machinery and Intelligence')
         self.assertIn('Turing test', results[0].text)
 
+class RateLimiterTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_burst(self):
+        limiter = RateLimiter(rate=20, burst=3)
+        for _ in range(3):
+            await limiter.acquire()
+        self.assertEqual(limiter.wait_time, 0)
+        self.assertLess(limiter.tokens, 1)
+        await limiter.acquire()
+        self.assertGreater(limiter.wait_time, 0)
+        self.assertEqual(limiter.queue_depth, 0)
+
+    async def test_queue_depth(self):
+        limiter = RateLimiter(rate=50, burst=1)
+        tasks = [asyncio.create_task(limiter.acquire()) for _ in range(4)]
+        await asyncio.sleep(0)
+        self.assertEqual(limiter.queue_depth, 3)
+        await asyncio.gather(*tasks)
+        self.assertEqual(limiter.queue_depth, 0)
+        self.assertGreaterEqual(limiter.wait_time, 0.05)
+
+    async def test_cancelled_wait_returns_token(self):
+        limiter = RateLimiter(rate=1, burst=1)
+        await limiter.acquire()
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertGreater(limiter.tokens, -0.5)
+
+    def test_presets(self):
+        limiter = RateLimiter.from_preset('api_key')
+        self.assertEqual((limiter.rate, limiter.burst), (1.0, 1))
+        self.assertRaises(ValueError, RateLimiter.from_preset, 'unknown')
+        self.assertRaises(ValueError, RateLimiter, 0)
+        self.assertRaises(ValueError, RateLimiter, 1, 0)
+
+    def test_client_rate_limit(self):
+        self.assertIsNone(AsyncSemanticScholar().rate_limiter)
+        sch = AsyncSemanticScholar(rate_limit=5)
+        self.assertEqual(sch.rate_limiter.rate, 5)
+        sch = SemanticScholar(rate_limit='unauthenticated')
+        self.assertEqual(
+            sch.rate_limiter.burst,
+            RateLimiter.PRESETS['unauthenticated'][1])
+        limiter = RateLimiter(10, 10)
+        sch.rate_limiter = limiter
+        self.assertIs(
+            sch._AsyncSemanticScholar._requester.rate_limiter, limiter)
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_requests_take_tokens(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            status_code=200, json={'title': 'title'})
+        sch = AsyncSemanticScholar(rate_limit=RateLimiter(10, 1))
+        for _ in range(3):
+            await sch.get_paper('10.1093/mind/lix.236.433')
+        self.assertGreater(sch.rate_limiter.wait_time, 0)
+        await sch.aclose()
+
+
+class AdaptiveConcurrencyLimiterTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_additive_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+        for _ in range(6):
+            started_round = await limiter.acquire()
+            limiter.release(started_round, 200)
+        self.assertEqual(limiter.limit, 3)
+        self.assertEqual(limiter.in_flight, 0)
+
+    async def test_multiplicative_decrease_once_per_round(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        rounds = [await limiter.acquire() for _ in range(4)]
+        for started_round in rounds:
+            limiter.release(started_round, 429)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.decreases, 1)
+        limiter.release(await limiter.acquire(), 504)
+        self.assertEqual(limiter.limit, 2)
+
+    async def test_waits_for_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        started_round = await limiter.acquire()
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        self.assertEqual(limiter.queue_depth, 1)
+        self.assertFalse(task.done())
+        limiter.release(started_round, 200)
+        await task
+        self.assertEqual(limiter.in_flight, 1)
+        self.assertEqual(limiter.queue_depth, 0)
+
+    async def test_cancelled_after_wake(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        started_round = await limiter.acquire()
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        limiter.release(started_round, 200)
+        # The slot is handed over to the task, which is cancelled before
+        # it resumes.
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(limiter.in_flight, 0)
+        await asyncio.wait_for(limiter.acquire(), 1)
+
+    def test_invalid_limits(self):
+        self.assertRaises(
+            ValueError, AdaptiveConcurrencyLimiter, initial_limit=0)
+        self.assertRaises(
+            ValueError, AdaptiveConcurrencyLimiter, decrease_factor=1)
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_client_backs_off_on_429(self, mock_request):
+        mock_request.side_effect = [
+            httpx.Response(status_code=429, headers={'Retry-After': '0'}),
+            httpx.Response(status_code=200, json={'title': 'title'})
+        ]
+        sch = AsyncSemanticScholar(adaptive_concurrency=True)
+        paper = await sch.get_paper('10.1093/mind/lix.236.433')
+        self.assertEqual(paper.title, 'title')
+        self.assertEqual(sch.concurrency_limiter.decreases, 1)
+        self.assertEqual(sch.concurrency_limiter.in_flight, 0)
+        self.assertIsNone(AsyncSemanticScholar().concurrency_limiter)
+
+    def test_retry_after_is_capped(self):
+        def wait(retry_after):
+            exception = ConnectionRefusedError()
+            exception.retry_after = retry_after
+            retry_state = mock.Mock()
+            retry_state.outcome.exception.return_value = exception
+            return _wait_for_retry(retry_state)
+
+        self.assertEqual(wait(2.5), 2.5)
+        self.assertEqual(wait(86400), 60)
+        self.assertEqual(
+            wait(_parse_retry_after('Fri, 31 Dec 9999 23:59:59 GMT')), 60)
+
+
+class ResponseCacheTest(unittest.IsolatedAsyncioTestCase):
+
+    URL = 'https://api.semanticscholar.org/graph/v1/paper/CorpusId:1'
+
+    def test_key(self):
+        self.assertEqual(
+            ResponseCache.key('GET', self.URL, '&fields=title&limit=10'),
+            ResponseCache.key('GET', self.URL, 'limit=10&fields=title'))
+        self.assertNotEqual(
+            ResponseCache.key('POST', self.URL, '', {'ids': ['1']}),
+            ResponseCache.key('POST', self.URL, '', {'ids': ['2']}))
+
+    def test_limits(self):
+        cache = ResponseCache(max_entries=2, max_bytes=10)
+        cache.set('a', self.URL, b'aaaa')
+        cache.set('b', self.URL, b'bbbb')
+        self.assertEqual(cache.get('a'), b'aaaa')
+        cache.set('c', self.URL, b'cccc')
+        self.assertIsNone(cache.get('b'))
+        cache.set('d', self.URL, b'dddddd')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 10)
+        cache.set('e', self.URL, b'e' * 11)
+        self.assertIsNone(cache.get('e'))
+        self.assertEqual(cache.stats, {
+            'hits': 1, 'misses': 3, 'evictions': 2, 'entries': 2,
+            'size': 10})
+
+    def test_ttl(self):
+        cache = ResponseCache(default_ttl=60, ttls=((r'/search', 0),))
+        self.assertEqual(cache.ttl(self.URL), 60)
+        cache.set('a', f'{self.URL}/search', b'a')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(
+            ResponseCache().ttl(
+                'https://api.semanticscholar.org/datasets/v1/release/latest'),
+            60 * 60)
+        cache.set('b', self.URL, b'b')
+        with mock.patch('time.time', return_value=time.time() + 61):
+            self.assertIsNone(cache.get('b'))
+        self.assertEqual(len(cache), 0)
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_client_cache(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            status_code=200, json={'title': 'title'})
+        sch = AsyncSemanticScholar(cache=True)
+        first = await sch.get_paper('CorpusId:1', fields=['title'])
+        first.raw_data['title'] = 'changed'
+        second = await sch.get_paper('CorpusId:1', fields=['title'])
+        self.assertEqual(second.title, 'title')
+        self.assertEqual(mock_request.call_count, 1)
+        await sch.get_paper('CorpusId:2', fields=['title'])
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(sch.cache.hits, 1)
+        self.assertEqual(sch.cache.misses, 2)
+        self.assertIsNone(AsyncSemanticScholar().cache)
+        await sch.aclose()
+
+    def test_sqlite_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.sqlite')
+            cache = SQLiteResponseCache(path, max_entries=2)
+            content = b'{"title": "title"}' * 100
+            cache.set('a', self.URL, content)
+            other = SQLiteResponseCache(path, max_entries=2)
+            self.assertEqual(other.get('a'), content)
+            self.assertLess(other.size, len(content))
+            other.set('b', self.URL, b'b')
+            other.set('c', self.URL, b'c')
+            self.assertIsNone(cache.get('a'))
+            self.assertEqual(len(cache), 2)
+            self.assertEqual(other.evictions, 1)
+            with mock.patch('time.time', return_value=time.time() + 3601):
+                self.assertIsNone(cache.get('b'))
+            cache.clear()
+            self.assertEqual(len(other), 0)
+            cache.close()
+            other.close()
+
+    async def test_sqlite_cache_io(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.sqlite')
+            cache = SQLiteResponseCache(path, max_entries=3, compress=False)
+            threads = []
+            get = cache.get
+
+            def record(key):
+                threads.append(threading.current_thread().name)
+                return get(key)
+
+            with mock.patch.object(cache, 'get', record):
+                for key in 'abcd':
+                    await cache.set_async(key, self.URL, key.encode())
+                self.assertIsNone(await cache.get_async('a'))
+                self.assertEqual(await cache.get_async('b'), b'b')
+            self.assertTrue(threads[0].startswith('semanticscholar-cache'))
+            self.assertEqual((len(cache), cache.size), (3, 3))
+
+            connection = sqlite3.connect(path)
+            accessed = connection.execute(
+                "SELECT accessed FROM responses WHERE key = 'b'").fetchone()
+            with mock.patch('time.time', return_value=time.time() + 61):
+                self.assertEqual(cache.get('b'), b'b')
+            # Reads don't write; the use is written with the next insert.
+            self.assertEqual(connection.execute(
+                "SELECT accessed FROM responses WHERE key = 'b'").fetchone(),
+                accessed)
+            cache.set('e', self.URL, b'e')
+            self.assertIsNone(cache.get('c'))
+            self.assertEqual(cache.get('b'), b'b')
+            self.assertIn(('responses_expires',), connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"))
+            cache.invalidate('b')
+            self.assertEqual((len(cache), cache.size), (2, 2))
+            cache.clear()
+            self.assertEqual((len(cache), cache.size), (0, 0))
+            connection.close()
+            cache.close()
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_client_sqlite_cache(self, mock_request):
+        mock_request.return_value = httpx.Response(status_code=200, json=[
+            {'paperId': '0', 'title': 'title'}])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.sqlite')
+            for _ in range(2):
+                sch = AsyncSemanticScholar(cache=path)
+                self.assertIsInstance(sch.cache, SQLiteResponseCache)
+                papers = await sch.get_papers(['CorpusId:1'])
+                self.assertEqual(papers[0].title, 'title')
+                await sch.aclose()
+                self.assertIsNone(sch.cache._connection)
+                self.assertIsNone(sch.cache._executor)
+            with SemanticScholar(cache=path) as sch:
+                papers = sch.get_papers(['CorpusId:1'])
+                self.assertEqual(papers[0].title, 'title')
+            self.assertIsNone(sch.cache._connection)
+        self.assertEqual(mock_request.call_count, 1)
+
+
+class PaperCacheTest(unittest.IsolatedAsyncioTestCase):
+
+    PAPER = {
+        'paperId': 'abc',
+        'corpusId': 1,
+        'externalIds': {'DOI': '10.1/X', 'ArXiv': '2101.00001'},
+        'title': 'title'
+    }
+
+    def test_aliases(self):
+        cache = PaperCache()
+        cache.put(self.PAPER, ['corpusId', 'title', 'externalIds'])
+        for paper_id in ['abc', 'CorpusId:1', 'DOI:10.1/x',
+                         'arxiv:2101.00001']:
+            with self.subTest(subtest=paper_id):
+                self.assertEqual(
+                    cache.get(paper_id, ['externalIds', 'title', 'corpusId']),
+                    self.PAPER)
+        self.assertIsNone(cache.get('DOI:10.1/Y', ['title', 'externalIds']))
+        self.assertIsNone(cache.get('10.1/X', ['title', 'externalIds']))
+        cache.get('abc', ['title', 'externalIds'])['title'] = 'changed'
+        self.assertEqual(
+            cache.get('abc', ['title', 'externalIds'])['title'], 'title')
+        self.assertEqual(cache.stats, {
+            'hits': 6, 'misses': 2, 'evictions': 0, 'entries': 1})
+
+    def test_bare_ids(self):
+        cache = PaperCache()
+        cache.put({'paperId': 'a', 'externalIds': {'MAG': '12345'}},
+                  ['externalIds'])
+        cache.put({'paperId': 'b', 'externalIds': {'PubMed': '12345'}},
+                  ['externalIds'])
+        self.assertIsNone(cache.get('12345', ['externalIds']))
+        self.assertEqual(
+            cache.get('MAG:12345', ['externalIds'])['paperId'], 'a')
+        self.assertEqual(
+            cache.get('PMID:12345', ['externalIds'])['paperId'], 'b')
+
+    def test_fields(self):
+        cache = PaperCache()
+        cache.put(self.PAPER, ['title', 'externalIds'])
+        self.assertEqual(
+            cache.get('CorpusId:1', ['title']),
+            {'paperId': 'abc', 'title': 'title'})
+        self.assertIsNone(cache.get('abc', ['title', 'year']))
+        cache.put({'paperId': 'abc', 'year': 2020, 'authors': []},
+                  ['year', 'authors'])
+        self.assertEqual(
+            cache.get('DOI:10.1/X', ['year', 'title']),
+            {'paperId': 'abc', 'title': 'title', 'year': 2020})
+        # The new data of a key replaces the fields it was fetched with.
+        cache.put({'paperId': 'abc', 'authors': [{'url': 'url'}]},
+                  ['authors.url'])
+        self.assertIsNone(cache.get('abc', ['authors']))
+        self.assertEqual(
+            cache.get('abc', ['authors.url', 'title'])['authors'],
+            [{'url': 'url'}])
+
+    def test_invalidate(self):
+        cache = PaperCache(max_entries=2, ttl=60)
+        cache.put(self.PAPER, ['title'])
+        cache.invalidate('DOI:10.1/X')
+        self.assertIsNone(cache.get('abc', ['title']))
+        self.assertEqual(len(cache), 0)
+        cache.put_all([{'paperId': str(i)} for i in range(3)], ['title'])
+        self.assertIsNone(cache.get('0', ['title']))
+        self.assertEqual(cache.evictions, 1)
+        with mock.patch('time.time', return_value=time.time() + 61):
+            self.assertIsNone(cache.get('1', ['title']))
+        self.assertEqual(len(cache), 1)
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_client_paper_cache(self, mock_request):
+
+        async def respond(method, url, json=None, **kwargs):
+            if json is None:
+                return httpx.Response(status_code=200, json=self.PAPER)
+            return httpx.Response(status_code=200, json=[
+                self.PAPER if id in ('CorpusId:1', 'abc') else None
+                for id in json['ids']])
+
+        mock_request.side_effect = respond
+        sch = AsyncSemanticScholar(paper_cache=True)
+        fields = ['title', 'externalIds']
+        papers, not_found = await sch.get_papers(
+            ['CorpusId:1', 'missing'], fields=fields, return_not_found=True)
+        self.assertEqual(not_found, ['missing'])
+        paper = await sch.get_paper('DOI:10.1/X', fields=fields)
+        self.assertEqual(paper.title, 'title')
+        papers = await sch.get_papers(['ARXIV:2101.00001'], fields=fields)
+        self.assertEqual(papers[0].paperId, 'abc')
+        self.assertEqual(mock_request.call_count, 1)
+        sch.paper_cache.invalidate('abc')
+        await sch.get_paper('DOI:10.1/X', fields=fields)
+        paper = await sch.get_paper('abc', fields=['title'])
+        self.assertEqual(paper.raw_data, {'paperId': 'abc', 'title': 'title'})
+        papers = await sch.get_papers(
+            ['CorpusId:1', 'abc'], fields=['title', 'year'])
+        self.assertEqual(len(papers), 2)
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(
+            mock_request.call_args.kwargs['json'], {'ids': ['CorpusId:1', 'abc']})
+        self.assertIsNone(AsyncSemanticScholar().paper_cache)
+        await sch.aclose()
+
+    @mock.patch('httpx.AsyncClient.request')
+    def test_search_paper_cache(self, mock_request):
+        mock_request.return_value = httpx.Response(status_code=200, json={
+            'total': 1, 'offset': 0, 'data': [self.PAPER]})
+        sch = SemanticScholar(paper_cache=PaperCache())
+        fields = ['title', 'externalIds']
+        sch.search_paper('title', fields=fields)
+        paper = sch.get_paper('CorpusId:1', fields=fields)
+        self.assertEqual(paper.paperId, 'abc')
+        self.assertEqual(mock_request.call_count, 1)
+
+
+class NotFoundCacheTest(unittest.IsolatedAsyncioTestCase):
+
+    def test_filters(self):
+        cache = NotFoundCache(capacity=1000, error_rate=0.01)
+        cache.add_all('paper', [f'DOI:10.1/{i}' for i in range(1000)])
+        self.assertTrue(cache.contains('paper', 'doi:10.1/0'))
+        self.assertFalse(cache.contains('author', 'DOI:10.1/0'))
+        false_positives = sum(
+            cache.contains('paper', f'DOI:10.2/{i}') for i in range(10000))
+        self.assertLess(false_positives, 300)
+        self.assertEqual(cache.entries, 1000)
+        self.assertEqual(cache.size, 2 * 1199)
+        cache.clear()
+        self.assertFalse(cache.contains('paper', 'doi:10.1/0'))
+        with self.assertRaises(ValueError):
+            NotFoundCache(error_rate=1)
+
+    def test_capacity_exceeded(self):
+        cache = NotFoundCache(capacity=1000, error_rate=0.001)
+        cache.add_all('paper', [f'DOI:10.1/{i}' for i in range(20000)])
+        self.assertTrue(all(
+            cache.contains('paper', f'DOI:10.1/{i}') for i in range(20000)))
+        # A new filter is started once each one holds capacity IDs, so
+        # that the error rate grows with the number of filters only.
+        # 20 filters, and the empty one of the older generation.
+        self.assertEqual(cache.size, (20 + 1) * 1798)
+        self.assertEqual(cache.entries, 20000)
+        false_positives = sum(
+            cache.contains('paper', f'DOI:10.2/{i}') for i in range(20000))
+        self.assertLess(false_positives, 20000 * 20 * 0.001 * 2)
+
+        # Full filters saved by two processes are kept side by side.
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'not-found.bin')
+            for name in 'ab':
+                cache = NotFoundCache(
+                    capacity=1000, error_rate=0.001, path=path)
+                cache.add_all(
+                    'paper', [f'DOI:10.{name}/{i}' for i in range(1000)])
+                cache.save()
+            cache = NotFoundCache(capacity=1000, error_rate=0.001, path=path)
+            self.assertTrue(all(
+                cache.contains('paper', f'DOI:10.{name}/{i}')
+                for name in 'ab' for i in range(1000)))
+            false_positives = sum(
+                cache.contains('paper', f'DOI:10.2/{i}') for i in range(20000))
+            self.assertLess(false_positives, 20000 * 2 * 0.001 * 2)
+
+    def test_overfilled_filter_ignored(self):
+        cache = NotFoundCache(capacity=10, error_rate=0.01)
+        cache.add('paper', 'a')
+        bloom = cache._filters[0][-1]
+        # E.g. merged past its capacity by an older version.
+        bloom[0][:] = b'\xff' * len(bloom[0])
+        bloom[2] = cache._bits
+        self.assertFalse(cache.contains('paper', 'a'))
+        self.assertFalse(cache.contains('paper', 'b'))
+
+    def test_save_without_lock(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = NotFoundCache(
+                path=os.path.join(directory, 'not-found.bin'))
+            cache.add('paper', 'a')
+            writing = threading.Event()
+            release = threading.Event()
+            write = cache._write
+
+            def wait_and_write(*args):
+                writing.set()
+                release.wait(5)
+                write(*args)
+
+            with mock.patch.object(cache, '_write', wait_and_write):
+                thread = threading.Thread(target=cache.save)
+                thread.start()
+                self.assertTrue(writing.wait(5))
+                # Lookups and additions don't wait for the file.
+                self.assertTrue(cache._lock.acquire(timeout=1))
+                cache._lock.release()
+                cache.add('paper', 'b')
+                release.set()
+                thread.join()
+            other = NotFoundCache(
+                path=os.path.join(directory, 'not-found.bin'))
+            self.assertTrue(other.contains('paper', 'a'))
+            self.assertFalse(other.contains('paper', 'b'))
+
+    def test_ttl(self):
+        now = time.time()
+        with mock.patch('time.time', return_value=now):
+            cache = NotFoundCache(ttl=90, generations=3)
+            cache.add('paper', 'a')
+        with mock.patch('time.time', return_value=now + 59):
+            self.assertTrue(cache.contains('paper', 'a'))
+            cache.add('paper', 'b')
+        with mock.patch('time.time', return_value=now + 91):
+            self.assertFalse(cache.contains('paper', 'a'))
+            self.assertTrue(cache.contains('paper', 'b'))
+            self.assertEqual(cache.entries, 1)
+        with mock.patch('time.time', return_value=now + 1000):
+            self.assertFalse(cache.contains('paper', 'b'))
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'not-found.bin')
+            now = time.time()
+            with mock.patch('time.time', return_value=now):
+                first = NotFoundCache(ttl=90, generations=3, path=path)
+                first.add('paper', 'a')
+                first.save()
+                second = NotFoundCache(ttl=90, generations=3, path=path)
+                self.assertTrue(second.contains('paper', 'a'))
+                second.add('author', 'b')
+            # Saves merge the IDs saved by other processes, aligning the
+            # generations.
+            with mock.patch('time.time', return_value=now + 31):
+                second.close()
+                first.add('paper', 'c')
+                first.save()
+                third = NotFoundCache(ttl=90, generations=3, path=path)
+                for kind, object_id in [
+                        ('paper', 'a'), ('author', 'b'), ('paper', 'c')]:
+                    self.assertTrue(third.contains(kind, object_id))
+            with mock.patch('time.time', return_value=now + 91):
+                third = NotFoundCache(ttl=90, generations=3, path=path)
+                self.assertFalse(third.contains('paper', 'a'))
+                self.assertTrue(third.contains('paper', 'c'))
+            # Filters of another shape are ignored.
+            other = NotFoundCache(capacity=10, path=path)
+            self.assertFalse(other.contains('paper', 'c'))
+            third.clear()
+            self.assertFalse(os.path.exists(path))
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_client_not_found_cache_path(self, mock_request):
+        mock_request.side_effect = SemanticScholarTest._batch_response
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'not-found.bin')
+            for _ in range(2):
+                async with AsyncSemanticScholar(not_found_cache=path) as sch:
+                    papers, not_found = await sch.get_papers(
+                        ['1', 'missing1'], return_not_found=True)
+                    self.assertEqual(not_found, ['missing1'])
+        self.assertEqual(
+            [call.kwargs['json'] for call in mock_request.call_args_list],
+            [{'ids': ['1', 'missing1']}, {'ids': ['1']}])
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_client_saves_not_found_cache(self, mock_request):
+        mock_request.side_effect = SemanticScholarTest._batch_response
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'not-found.bin')
+            sch = AsyncSemanticScholar(
+                not_found_cache=NotFoundCache(path=path, save_interval=0))
+            threads = []
+            save = sch.not_found_cache.save
+
+            def record():
+                threads.append(threading.current_thread())
+                save()
+
+            with mock.patch.object(sch.not_found_cache, 'save', record):
+                await sch.get_papers(['1', 'missing1'])
+            # Saved once due, off the event loop.
+            self.assertEqual(len(threads), 1)
+            self.assertIsNot(threads[0], threading.current_thread())
+            self.assertTrue(
+                NotFoundCache(path=path).contains('paper', 'missing1'))
+
+    @mock.patch('httpx.AsyncClient.request')
+    async def test_client_not_found_cache(self, mock_request):
+        mock_request.side_effect = SemanticScholarTest._batch_response
+        sch = AsyncSemanticScholar(not_found_cache=True)
+        ids = ['1', 'missing1', '2', 'missing2']
+        for _ in range(2):
+            papers, not_found = await sch.get_papers(
+                ids, return_not_found=True)
+            self.assertEqual([paper.paperId for paper in papers], ['1', '2'])
+            self.assertEqual(not_found, ['missing1', 'missing2'])
+        self.assertEqual(
+            mock_request.call_args.kwargs['json'], {'ids': ['1', '2']})
+        authors, not_found = await sch.get_authors(
+            ['missing1', '3'], return_not_found=True)
+        self.assertEqual(not_found, ['missing1'])
+        self.assertEqual(
+            mock_request.call_args.kwargs['json'], {'ids': ['missing1', '3']})
+        await sch.get_papers(['missing1', 'missing2'])
+        self.assertEqual(mock_request.call_count, 3)
+
+        mock_request.side_effect = None
+        mock_request.return_value = httpx.Response(
+            status_code=404, json={'error': 'Paper not found'})
+        for _ in range(2):
+            with self.assertRaises(ObjectNotFoundException):
+                await sch.get_paper('CorpusId:1')
+        self.assertEqual(mock_request.call_count, 4)
+        self.assertEqual(sch.not_found_cache.hits, 5)
+        self.assertIsNone(AsyncSemanticScholar().not_found_cache)
+        await sch.aclose()
+
+
 class SyncFromAsyncContextTest(unittest.IsolatedAsyncioTestCase):
     '''Test the sync API when called from within a running event loop,
-    exercising the ThreadPoolExecutor fallback in _run_async().'''
+    where requests run on the client's event loop thread.'''
 
     def setUp(self) -> None:
         self.sch = SemanticScholar()